@@ -11,33 +11,40 @@ the config, or schools with ``add_nsf_data`` set to ``False``, are skipped.
 Running the script:
     python add_grants_to_db.py
 
-The script appends newly fetched grants and then updates ``Faculty.has_funding``
-based on whether the faculty member has any grants.
+NSF lookups run concurrently (``GRANT_BACKFILL_CONFIG`` in the populate
+config) and fetched grants are upserted on ``(faculty_id, nsf_id)`` in batched
+commits, so the script can be rerun, or resumed after a failure, without
+creating duplicate grants. Afterwards ``Faculty.has_funding`` is set for every
+faculty member with grants, and the precomputed search results are rewritten.
+NSF responses are read from and written to the funding API cache shared with
+``populate.py`` (``FUNDING_API_CACHE`` in the populate config), so reruns only
+call the API for searches whose cached response has expired.
 """
 
 import logging
 from backend.services.nsf.nsf_service import NSFService
-from backend.services.nsf.nsf_proxy import NSFProxy
-from backend.models.models import Grant, Faculty
-import requests
-from backend.core.extensions import db
-from backend.core.populate_config import SCHOOL_DEPARTMENT_DATA
+from backend.core.grant_backfill import backfill_nsf_grants
+from backend.core.populate_config import SCHOOL_DEPARTMENT_DATA, GRANT_BACKFILL_CONFIG
+from backend.utils.factory import get_database_driver, get_funding_api_cache, get_nsf_proxy
+from backend.utils.http_client import HttpClient
 from backend.app import app
 
-logging.basicConfig(level=logging.DEBUG)
+logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+http_client = HttpClient()
+funding_api_cache = get_funding_api_cache()
+nsf_service = NSFService(proxy=get_nsf_proxy(http_client, funding_api_cache))
+database_driver = get_database_driver(app)
+
 
 def _get_faculty_schools(faculty):
     """
-    Return normalized school names for a faculty record.
+    Return the school names of a faculty record.
 
-    Faculty rows can contain one school (``"SEAS"``) or merged schools as a
-    comma-separated string (``"SEAS,SOM"``). Empty values are ignored.
+    A faculty member found in several schools is listed under each of them.
     """
-    if not faculty.school:
-        return []
-    return [school.strip() for school in faculty.school.split(",") if school.strip()]
+    return list(faculty.schools)
 
 
 def _should_add_nsf_grants(faculty):
@@ -65,66 +72,53 @@ def add_grants_to_db():
     ``backend/core/populate_config.py``. Faculty in disabled or unknown schools
     are skipped without making NSF API calls.
     """
-    with app.app_context():
-        all_faculty = db.session.query(Faculty).all()
-        nsf_service = NSFService(proxy=NSFProxy())
-        for faculty in all_faculty:
-            if not _should_add_nsf_grants(faculty):
-                logger.info(
-                    "Skipping NSF grants for %s because add_nsf_data is not enabled for school(s): %s",
-                    faculty.name,
-                    ", ".join(_get_faculty_schools(faculty)) or "unknown",
-                )
-                continue
-
-            fetched_grants = nsf_service.compile_project_metadata(
-                pi_first_name=faculty.name,
-                pi_last_name=""
+    eligible_faculty = []
+    for faculty in database_driver.get_faculty_names():
+        if _should_add_nsf_grants(faculty):
+            eligible_faculty.append(faculty)
+        else:
+            logger.info(
+                "Skipping NSF grants for %s because add_nsf_data is not enabled for school(s): %s",
+                faculty.name,
+                ", ".join(_get_faculty_schools(faculty)) or "unknown",
             )
-            print(f"Number of grants found for {faculty.name}: {len(fetched_grants.index)}")
-            if fetched_grants.empty:
-                continue
-            for _, row in fetched_grants.iterrows():
-                grant = Grant(
-                    nsf_id=row['id'],
-                    date=nsf_service.process_date_string(row['date']), 
-                    start_date=nsf_service.process_date_string(row['start_date']), 
-                    title=row['title']
-                )
-                faculty.grants.append(grant)
-                db.session.add(grant)
-                print(f"Added grant {grant.nsf_id} ({grant.title})")
-        db.session.commit()
+
+    return backfill_nsf_grants(
+        eligible_faculty,
+        nsf_service,
+        database_driver,
+        workers=GRANT_BACKFILL_CONFIG["WORKERS"],
+        batch_size=GRANT_BACKFILL_CONFIG["BATCH_SIZE"],
+    )
 
 def update_has_funding_bool():
-    """Update each faculty member's ``has_funding`` value based on grants."""
-    with app.app_context():
-        all_faculty = db.session.query(Faculty).all()
-        for faculty in all_faculty:
-            print(f"Updating has_funding for {faculty.name}")
-            faculty.has_funding = faculty.has_funding or len(faculty.grants if isinstance(faculty.grants, list) else faculty.grants.all()) > 0
-            print(f"Faculty {faculty.name} has_funding set to {faculty.has_funding}")
-        db.session.commit()
+    """Set ``has_funding`` for each faculty member with at least one grant."""
+    database_driver.update_has_funding_from_grants()
+
+def update_search_documents():
+    """Rewrite the precomputed search results of faculty whose grants or funding changed."""
+    database_driver.sync_search_documents()
 
 def check_recipient_inst_of_all_nsf_grants():
     """Print the recipient institution for each stored NSF grant."""
+    from backend.core.extensions import db
+    from backend.models.models import Grant
     with app.app_context():
-        all_grants = db.session.query(Grant).all()
-        for grant in all_grants:
-            grant_id = grant.nsf_id
-            endpt = f"https://api.nsf.gov/services/v1/awards/{grant_id}.json"
-            try:
-                response = requests.get(endpt)
-                response.raise_for_status()
-                data = response.json()
-                inst = data['response']['award']
-                for award in inst:
-                    print(f"Grant {grant_id} recipient institution: {award['awardeeName']}")
-            except requests.RequestException as e:
-                print(f"Error fetching data for grant {grant_id}: {e}")
-                continue
+        grant_ids = [nsf_id for nsf_id, in db.session.query(Grant.nsf_id).distinct()]
+    awards = nsf_service.get_award_details(grant_ids, print_fields=["awardeeName"])
+    for grant_id in grant_ids:
+        if grant_id in awards:
+            print(f"Grant {grant_id} recipient institution: {awards[grant_id].get('awardeeName')}")
+        else:
+            print(f"Error fetching data for grant {grant_id}")
 
 if __name__ == "__main__":
-    add_grants_to_db()
-    update_has_funding_bool()
-    # check_recipient_inst_of_all_nsf_grants()
+    try:
+        add_grants_to_db()
+        update_has_funding_bool()
+        update_search_documents()
+        # check_recipient_inst_of_all_nsf_grants()
+    finally:
+        logger.info(f"Funding API cache stats: {funding_api_cache.get_stats()}")
+        logger.info(f"HTTP client metrics: {http_client.get_metrics()}")
+        funding_api_cache.close()
@@ -0,0 +1,192 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+import typing
+from datetime import date
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Bump when the stored profile or faculty format changes; checkpoints of other versions are discarded
+FORMAT_VERSION = 4
+
+
+def _parse_date(value: typing.Optional[str]) -> typing.Optional[date]:
+    return date.fromisoformat(value) if value else None
+
+
+def _format_date(value: typing.Optional[date]) -> typing.Optional[str]:
+    return value.isoformat() if value else None
+
+
+class PopulateCheckpoint:
+    def __init__(self, path: str, max_age_hours: float = 48):
+        """
+        Durable record of the expensive work done by a populate run, so a failed run can be rerun
+        and resume where it stopped: completed department scrapes, per-faculty NIH/NSF enrichment,
+        and embeddings keyed by a hash of the embedded text. The checkpoint is deleted when a run
+        completes, and ignored (and replaced) once it is older than `max_age_hours`.
+        :param path: SQLite file holding the checkpoint
+        :param max_age_hours: age after which an unfinished checkpoint is considered stale
+        """
+        self.path = path
+        self.max_age_hours = max_age_hours
+        self._lock = threading.Lock()
+        self._connection = None
+
+    def open(self) -> "PopulateCheckpoint":
+        if os.path.exists(self.path) and self._is_stale():
+            logger.warning(f"Discarding checkpoint older than {self.max_age_hours} hours "
+                           f"or from an older populate version: {self.path}")
+            os.remove(self.path)
+
+        resuming = os.path.exists(self.path)
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS departments (department TEXT PRIMARY KEY, profiles TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS enrichment (faculty_key TEXT PRIMARY KEY, faculty TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS embeddings (text_hash TEXT PRIMARY KEY, embedding BLOB NOT NULL);
+        """)
+        self._connection.executemany(
+            "INSERT OR IGNORE INTO meta (key, value) VALUES (?, ?)",
+            [("created_at", str(time.time())), ("format_version", str(FORMAT_VERSION))],
+        )
+        self._connection.commit()
+        if resuming:
+            logger.info(f"Resuming from checkpoint: {self.path}")
+        return self
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def delete(self):
+        """Remove the checkpoint after a successful run."""
+        self.close()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.path + suffix):
+                os.remove(self.path + suffix)
+        logger.info(f"Deleted checkpoint: {self.path}")
+
+    def _is_stale(self) -> bool:
+        try:
+            connection = sqlite3.connect(self.path)
+            try:
+                meta = dict(connection.execute("SELECT key, value FROM meta").fetchall())
+            finally:
+                connection.close()
+        except sqlite3.Error:
+            return True
+        if meta.get("format_version") != str(FORMAT_VERSION) or "created_at" not in meta:
+            return True
+        return time.time() - float(meta["created_at"]) > self.max_age_hours * 3600
+
+    def _execute(self, sql: str, parameters: typing.Tuple) -> typing.Optional[typing.Tuple]:
+        with self._lock:
+            cursor = self._connection.execute(sql, parameters)
+            if sql.lstrip().upper().startswith("SELECT"):
+                return cursor.fetchone()
+            self._connection.commit()
+            return None
+
+    def get_department_profiles(self, department: str) -> typing.Optional[typing.List[typing.Dict]]:
+        """
+        :return: scraped profiles of a department completed by an earlier attempt, or None
+        """
+        row = self._execute("SELECT profiles FROM departments WHERE department = ?", (department,))
+        return json.loads(row[0]) if row else None
+
+    def save_department_profiles(self, department: str, profiles: typing.List[typing.Dict]):
+        self._execute(
+            "INSERT OR REPLACE INTO departments (department, profiles) VALUES (?, ?)",
+            (department, json.dumps(profiles)),
+        )
+
+    def get_enriched_faculty(self, faculty_key: str) -> typing.Optional["Faculty"]:
+        """
+        :param faculty_key: identifies the scraped profile and enrichment options
+        :return: enriched Faculty model object saved by an earlier attempt, or None
+        """
+        row = self._execute("SELECT faculty FROM enrichment WHERE faculty_key = ?", (faculty_key,))
+        return self._deserialize_faculty(json.loads(row[0])) if row else None
+
+    def save_enriched_faculty(self, faculty_key: str, faculty: "Faculty"):
+        self._execute(
+            "INSERT OR REPLACE INTO enrichment (faculty_key, faculty) VALUES (?, ?)",
+            (faculty_key, json.dumps(self._serialize_faculty(faculty))),
+        )
+
+    def get_embedding(self, text: str) -> typing.Optional[typing.List[float]]:
+        row = self._execute("SELECT embedding FROM embeddings WHERE text_hash = ?", (self._hash_text(text),))
+        return np.frombuffer(row[0], dtype=np.float32).tolist() if row else None
+
+    def save_embedding(self, text: str, embedding: typing.List[float]):
+        self._execute(
+            "INSERT OR REPLACE INTO embeddings (text_hash, embedding) VALUES (?, ?)",
+            (self._hash_text(text), np.asarray(embedding, dtype=np.float32).tobytes()),
+        )
+
+    @staticmethod
+    def _hash_text(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _serialize_faculty(faculty: "Faculty") -> typing.Dict:
+        return {
+            "name": faculty.name,
+            "school": faculty.school,
+            "department": faculty.department,
+            "about": faculty.about,
+            "email": faculty.email,
+            "profile_url": faculty.profile_url,
+            "has_funding": faculty.has_funding,
+            "projects": [
+                {
+                    "project_number": project.project_number,
+                    "abstract": project.abstract,
+                    "relevant_terms": project.relevant_terms,
+                    "start_date": _format_date(project.start_date),
+                    "end_date": _format_date(project.end_date),
+                    "agency_ic_admin": project.agency_ic_admin,
+                    "activity_code": project.activity_code,
+                }
+                for project in faculty.projects
+            ],
+            "grants": [
+                {
+                    "nsf_id": grant.nsf_id,
+                    "date": _format_date(grant.date),
+                    "start_date": _format_date(grant.start_date),
+                    "title": grant.title,
+                }
+                for grant in faculty.grants
+            ],
+        }
+
+    @staticmethod
+    def _deserialize_faculty(data: typing.Dict) -> "Faculty":
+        from backend.models.models import Faculty, Project, Grant
+        projects = [
+            Project(**{
+                **project,
+                "start_date": _parse_date(project["start_date"]),
+                "end_date": _parse_date(project["end_date"]),
+            })
+            for project in data.pop("projects")
+        ]
+        grants = [
+            Grant(**{
+                **grant,
+                "date": _parse_date(grant["date"]),
+                "start_date": _parse_date(grant["start_date"]),
+            })
+            for grant in data.pop("grants")
+        ]
+        return Faculty(**data, projects=projects, grants=grants, embedding_id=-1)
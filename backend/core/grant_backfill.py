@@ -0,0 +1,84 @@
+import logging
+import typing
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from tqdm import tqdm
+from backend.models.records import NSFAward
+from backend.services.nsf.nsf_service import NSFService
+from backend.utils.name_utils import parse_name
+
+logger = logging.getLogger(__name__)
+
+
+def fetch_nsf_awards(nsf_service: NSFService, name: str) -> typing.List[NSFAward]:
+    """
+    :param nsf_service: NSF service
+    :param name: faculty display name
+    :return: unexpired NSF awards listing the person as PI or co-PI
+    """
+    parsed = parse_name(name)
+    return nsf_service.compile_project_metadata(
+        pi_first_name=parsed.first or parsed.last,
+        pi_last_name=parsed.last if parsed.first else "",
+    )
+
+
+def backfill_nsf_grants(
+    faculty_rows: typing.List[typing.Tuple[int, str, typing.List[str]]],
+    nsf_service: NSFService,
+    database_driver: "DatabaseDriver",
+    workers: int = 4,
+    batch_size: int = 200,
+) -> typing.Dict[str, int]:
+    """
+    Fetch NSF awards for existing faculty concurrently and upsert them as Grants, keyed on
+    (faculty_id, nsf_id), so reruns update grants instead of duplicating them. Grants are
+    committed every `batch_size` grants; a faculty member whose NSF lookup fails is logged and
+    skipped, and the grants already committed are kept.
+    :param faculty_rows: (faculty_id, name, schools) of the faculty to backfill
+    :param nsf_service: NSF service; called from `workers` threads at once
+    :param database_driver: database driver used for the upserts, from the calling thread only
+    :param workers: concurrent NSF lookups
+    :param batch_size: grants per committed batch
+    :return: counts of faculty looked up and failed, and of grants upserted
+    """
+    stats = {"faculty": 0, "failed": 0, "grants": 0}
+    pending_grants = []
+
+    def flush():
+        grants = pending_grants[:]
+        pending_grants.clear()
+        stats["grants"] += database_driver.upsert_grants(grants, batch_size=batch_size)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="nsf-backfill") as executor:
+        futures = {
+            executor.submit(fetch_nsf_awards, nsf_service, name): (faculty_id, name)
+            for faculty_id, name, _ in faculty_rows
+        }
+        for future in tqdm(as_completed(futures), total=len(futures), desc="Backfilling NSF grants", unit="faculty"):
+            faculty_id, name = futures[future]
+            stats["faculty"] += 1
+            try:
+                awards = future.result()
+            except Exception as e:
+                stats["failed"] += 1
+                logger.error(f"NSF lookup failed for {name}: {e}")
+                continue
+
+            logger.debug(f"Number of grants found for {name}: {len(awards)}")
+            pending_grants.extend(
+                {
+                    "faculty_id": faculty_id,
+                    "nsf_id": award.id,
+                    "date": award.date,
+                    "start_date": award.start_date,
+                    "title": award.title,
+                }
+                for award in awards
+            )
+            if len(pending_grants) >= batch_size:
+                flush()
+
+    if pending_grants:
+        flush()
+    logger.info(f"NSF grant backfill complete: {stats}")
+    return stats
@@ -0,0 +1,45 @@
+import logging
+from backend.core.populate_config import DEFAULT_FISCAL_YEARS, HARVEST_CONFIG, NIH_BATCH_CONFIG
+from backend.services.harvest.harvest_service import HarvestService
+from backend.utils.factory import get_harvest_service
+from backend.utils.http_client import HttpClient
+
+logger = logging.getLogger(__name__)
+
+
+def run_harvest(harvest_service: HarvestService):
+    """
+    Download every NIH project and NSF award of the institution into the local harvest store,
+    for populate runs with ENRICHMENT_MODE = "harvest".
+    :param harvest_service: harvest service writing to the configured store
+    """
+    logger.info(f"Harvesting NIH projects for fiscal years {DEFAULT_FISCAL_YEARS} "
+                f"and NSF awards for {HARVEST_CONFIG['NSF_AWARDEE_NAME']}.")
+    harvest_service.harvest(
+        DEFAULT_FISCAL_YEARS,
+        HARVEST_CONFIG["NSF_AWARDEE_NAME"],
+        nih_page_size=NIH_BATCH_CONFIG["PAGE_SIZE"],
+    )
+
+
+def load_award_index(harvest_service: HarvestService) -> "AwardIndex":
+    """
+    Load the harvested awards, harvesting first if the store is missing or older than HARVEST_CONFIG["MAX_AGE_HOURS"].
+    :param harvest_service: harvest service reading from the configured store
+    :return: award index
+    """
+    if harvest_service.store.is_stale(HARVEST_CONFIG["MAX_AGE_HOURS"]):
+        logger.info(f"Award harvest in {HARVEST_CONFIG['PATH']} is missing or stale.")
+        run_harvest(harvest_service)
+    return harvest_service.load_index()
+
+
+if __name__ == '__main__':
+    logger.info("Starting harvest.")
+    http_client = HttpClient()
+    service = get_harvest_service(http_client)
+    try:
+        run_harvest(service)
+    finally:
+        service.store.close()
+        logger.info(f"HTTP client metrics: {http_client.get_metrics()}")
@@ -0,0 +1,194 @@
+import queue
+import logging
+import threading
+import time
+import typing
+
+logger = logging.getLogger(__name__)
+
+_END = object()
+_STOPPED = object()
+
+
+class StageStats:
+    __slots__ = ("name", "items", "batches", "busy_seconds", "started_at", "finished_at")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.items = 0
+        self.batches = 0
+        self.busy_seconds = 0.0
+        self.started_at = None
+        self.finished_at = None
+
+    @property
+    def wall_seconds(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """Items per second of wall-clock time the stage was running."""
+        wall_seconds = self.wall_seconds
+        return self.items / wall_seconds if wall_seconds else 0.0
+
+    def __str__(self) -> str:
+        return (f"{self.name}: {self.items} items in {self.batches} batches, "
+                f"{self.busy_seconds:.1f}s busy / {self.wall_seconds:.1f}s wall, "
+                f"{self.throughput:.2f} items/s")
+
+
+class PipelineStage:
+    def __init__(self, name: str, handler: typing.Callable[[typing.Any], typing.Any], workers: int = 1):
+        """
+        A pipeline stage.
+        :param name: stage name used in logs and stats
+        :param handler: called with each batch from the previous stage; its return value is passed on
+            to the next stage, and falsy results (None, empty list) are dropped
+        :param workers: number of threads running the handler concurrently
+        """
+        self.name = name
+        self.handler = handler
+        self.workers = workers
+
+
+class StagedPipeline:
+    def __init__(self,
+                 source: typing.Iterable,
+                 stages: typing.List[PipelineStage],
+                 queue_size: int = 4,
+                 source_name: str = "source"):
+        """
+        Runs a source iterator and a chain of stages in separate threads, connected by bounded queues.
+        A full queue blocks the stage feeding it, so at most `queue_size` batches wait between any two
+        stages and memory stays flat regardless of how much the source produces. The first error in
+        any stage stops the pipeline and is re-raised by run().
+        :param source: iterable of batches (e.g. lists of items)
+        :param stages: stages applied in order
+        :param queue_size: maximum number of batches buffered between two stages
+        :param source_name: name of the source in logs and stats
+        """
+        self.source = source
+        self.stages = stages
+        self.queues = [queue.Queue(maxsize=queue_size) for _ in stages]
+        self.stats = [StageStats(source_name)] + [StageStats(stage.name) for stage in stages]
+        self._stop = threading.Event()
+        self._errors: typing.List[BaseException] = []
+        self._lock = threading.Lock()
+        self._finished_workers = [0] * len(stages)
+
+    def run(self) -> typing.List[StageStats]:
+        """
+        Run the pipeline to completion.
+        :return: per-stage stats, source first
+        """
+        threads = [threading.Thread(target=self._run_source, name=self.stats[0].name, daemon=True)]
+        for position, stage in enumerate(self.stages):
+            for worker in range(stage.workers):
+                threads.append(threading.Thread(
+                    target=self._run_stage,
+                    args=(position,),
+                    name=f"{stage.name}-{worker}",
+                    daemon=True,
+                ))
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for stats in self.stats:
+            logger.info(f"Pipeline stage {stats}")
+
+        if self._errors:
+            raise self._errors[0]
+        return self.stats
+
+    def _fail(self, error: BaseException):
+        with self._lock:
+            self._errors.append(error)
+        self._stop.set()
+
+    def _put(self, position: int, item: typing.Any) -> bool:
+        while not self._stop.is_set():
+            try:
+                self.queues[position].put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, position: int) -> typing.Any:
+        while not self._stop.is_set():
+            try:
+                return self.queues[position].get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return _STOPPED
+
+    def _end_stream(self, position: int):
+        """Signal end of stream to every worker of the stage at `position`."""
+        if position >= len(self.stages):
+            return
+        for _ in range(self.stages[position].workers):
+            if not self._put(position, _END):
+                return
+
+    @staticmethod
+    def _count(batch: typing.Any) -> int:
+        return len(batch) if isinstance(batch, (list, tuple)) else 1
+
+    def _run_source(self):
+        stats = self.stats[0]
+        stats.started_at = time.monotonic()
+        try:
+            iterator = iter(self.source)
+            while not self._stop.is_set():
+                started = time.monotonic()
+                try:
+                    batch = next(iterator)
+                except StopIteration:
+                    break
+                stats.busy_seconds += time.monotonic() - started
+                stats.items += self._count(batch)
+                stats.batches += 1
+                if not self._put(0, batch):
+                    break
+            self._end_stream(0)
+        except BaseException as e:
+            logger.error(f"Pipeline stage {stats.name} failed: {e}", exc_info=True)
+            self._fail(e)
+        finally:
+            stats.finished_at = time.monotonic()
+
+    def _run_stage(self, position: int):
+        stage = self.stages[position]
+        stats = self.stats[position + 1]
+        with self._lock:
+            if stats.started_at is None:
+                stats.started_at = time.monotonic()
+        try:
+            while True:
+                batch = self._get(position)
+                if batch is _END or batch is _STOPPED:
+                    break
+                started = time.monotonic()
+                result = stage.handler(batch)
+                with self._lock:
+                    stats.busy_seconds += time.monotonic() - started
+                    stats.items += self._count(batch)
+                    stats.batches += 1
+                if result and position + 1 < len(self.stages):
+                    if not self._put(position + 1, result):
+                        break
+        except BaseException as e:
+            logger.error(f"Pipeline stage {stage.name} failed: {e}", exc_info=True)
+            self._fail(e)
+        finally:
+            with self._lock:
+                self._finished_workers[position] += 1
+                last_worker = self._finished_workers[position] == stage.workers
+                stats.finished_at = time.monotonic()
+            if last_worker and not self._stop.is_set():
+                self._end_stream(position + 1)
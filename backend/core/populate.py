@@ -1,5 +1,10 @@
 import logging
 import os
+import itertools
+import threading
+import collections
+import dataclasses
+import typing
 from tqdm import tqdm
 from tqdm.contrib.logging import logging_redirect_tqdm
 from backend.app import app
@@ -9,24 +14,47 @@ from backend.core.populate_config import (
     SCHOOLS_TO_SCRAPE,
     SCHOOL_DEPARTMENT_DATA,
     INDEX_PATH,
+    HTTP_CACHE_REVALIDATE,
+    INCREMENTAL_UPDATE,
+    INCREMENTAL_MIN_SCRAPED_FRACTION,
+    PIPELINE_CONFIG,
+    CHECKPOINT_PATH,
+    CHECKPOINT_MAX_AGE_HOURS,
+    ENRICHMENT_MODE,
+    ENRICHMENT_CONCURRENCY,
 )
+from backend.core.checkpoint import PopulateCheckpoint
+from backend.core.harvest import load_award_index
+from backend.core.pipeline import StagedPipeline, PipelineStage
+from backend.models.records import FacultyProfile, FacultyVector
 from backend.services.scraper.darden_scraper import DardenScraper
 from backend.services.scraper.nursing_scraper import NursingScraper
 from backend.services.scraper.som_scraper import SOMScraper
+from backend.utils.http_client import HttpClient
 from backend.utils.http_client_cached import HttpClientCached
-from backend.utils.factory import get_embedding_service, get_database_driver
+from backend.utils.factory import (
+    get_embedding_service,
+    get_database_driver,
+    get_harvest_service,
+    get_funding_api_cache,
+    get_nih_reporter_proxy,
+    get_nsf_proxy,
+)
 from backend.services.scraper.seas_scraper import SEASScraper
 from backend.services.scraper.batten_scraper import BattenScraper
 from backend.services.scraper.scraper_service import ScraperService
-from backend.services.nih.nih_reporter_proxy import NIHReporterProxy
 from backend.services.nih.nih_reporter_service import NIHReporterService
-from backend.services.nsf.nsf_proxy import NSFProxy
 from backend.services.nsf.nsf_service import NSFService
 from backend.services.aggregator.data_aggregator import DataAggregator
+from backend.utils.fingerprint_utils import compute_faculty_fingerprint
+from backend.utils.institution_utils import InstitutionUtils
 
 logger = logging.getLogger(__name__)
 
-http_client = HttpClientCached()
+http_client = HttpClientCached(revalidate=HTTP_CACHE_REVALIDATE)
+# NIH RePORTER and NSF responses are cached in the shared funding API cache instead
+funding_api_client = HttpClient()
+funding_api_cache = get_funding_api_cache()
 
 scraper_service = ScraperService([
     SOMScraper(http_client),
@@ -36,12 +64,14 @@ scraper_service = ScraperService([
     NursingScraper(http_client),
 ])
 
-nih_service = NIHReporterService(NIHReporterProxy(http_client))
+nih_service = NIHReporterService(get_nih_reporter_proxy(funding_api_client, funding_api_cache))
 embedding_service = get_embedding_service(app)
 database_driver = get_database_driver(app)
-nsf_service = NSFService(NSFProxy())
+nsf_service = NSFService(get_nsf_proxy(funding_api_client, funding_api_cache))
 
-data_aggregator = DataAggregator(scraper_service, nih_service, embedding_service, nsf_service)
+data_aggregator = DataAggregator(
+    scraper_service, nih_service, embedding_service, nsf_service, enrichment_mode=ENRICHMENT_MODE
+)
 
 
 def progress_bar(iterable, description, total=None):
@@ -59,75 +89,46 @@ def delete_faiss_index():
     logger.info("Deleting FAISS index.")
     if os.path.exists(INDEX_PATH):
         os.remove(INDEX_PATH)
+    database_driver.clear_embedding_vectors()
+    # Vector IDs start again from 0, so IDs still held by kept faculty would point at other faculty's vectors
+    database_driver.reset_faculty_embedding_ids()
     embedding_service.embedding_storage.index = None
 
 
-def merge_faculty_records(faculty_dict, faculty):
-    faculty_identifier = (faculty.name, faculty.email)
-
-    if faculty_identifier in faculty_dict:
-        existing = faculty_dict[faculty_identifier]
-
-        # Merge departments
-        existing.department = ",".join(
-            sorted(set(existing.department.split(",") + faculty.department.split(","))))
-
-        # Merge schools
-        existing.school = ",".join(sorted(set(existing.school.split(",") + faculty.school.split(","))))
-    else:
-        faculty_dict[faculty_identifier] = faculty
-
-
-def rebuild_faiss_index():
-    logger.info("Rebuilding FAISS index.")
-    delete_faiss_index()
-
-    faculty_records = database_driver.get_all_faculty()
-    for faculty in progress_bar(faculty_records, "Rebuilding FAISS index"):
-        embedding_id = embedding_service.generate_and_store_embedding(faculty)
-        database_driver.update_faculty_embedding_id(faculty.faculty_id, embedding_id)
-
-
-def should_rebuild_faiss_index():
-    if KEEP_EXISTING_SCHOOLS:
-        return REBUILD_INDEX
-
-    if not REBUILD_INDEX:
-        logger.info("REBUILD_INDEX=False ignored because KEEP_EXISTING_SCHOOLS=False.")
-    return True
-
-
-
-def delete_faiss_index():
-    logger.info("Deleting FAISS index.")
-    if os.path.exists(INDEX_PATH):
-        os.remove(INDEX_PATH)
-    embedding_service.embedding_storage.index = None
-
-
-def merge_faculty_records(faculty_dict, faculty):
-    faculty_identifier = (faculty.name, faculty.email)
-
-    if faculty_identifier in faculty_dict:
-        existing = faculty_dict[faculty_identifier]
-
-        # Merge departments
-        existing.department = ",".join(
-            sorted(set(existing.department.split(",") + faculty.department.split(","))))
-
-        # Merge schools
-        existing.school = ",".join(sorted(set(existing.school.split(",") + faculty.school.split(","))))
-    else:
-        faculty_dict[faculty_identifier] = faculty
-
-
-def rebuild_faiss_index():
-    logger.info("Rebuilding FAISS index.")
-    delete_faiss_index()
+def embed_missing_faculty(checkpoint: PopulateCheckpoint):
+    """
+    Embed every faculty record still holding the placeholder embedding ID, e.g. faculty from schools
+    outside SCHOOLS_TO_SCRAPE after the index was deleted and their IDs were reset.
+    Records are streamed from the database and written back a batch at a time, so memory use does
+    not grow with the number of faculty. A failed run is resumed by rerunning the full update, which
+    deletes the index and resets the IDs again; embeddings already made are read from the checkpoint.
+    :param checkpoint: checkpoint holding embeddings from an earlier, failed attempt
+    """
+    logger.info("Embedding faculty records without an embedding.")
+    missing_faculty = (
+        faculty for faculty in database_driver.iter_all_faculty(batch_size=PIPELINE_CONFIG["DB_BATCH_SIZE"])
+        if faculty.embedding_id < 0
+    )
 
-    for faculty in database_driver.get_all_faculty():
-        embedding_id = embedding_service.generate_and_store_embedding(faculty)
-        database_driver.update_faculty_embedding_id(faculty.faculty_id, embedding_id)
+    batch_size = PIPELINE_CONFIG["BATCH_SIZE"]
+    progress = progress_bar(None, "Embedding remaining faculty")
+    try:
+        while True:
+            batch = list(itertools.islice(missing_faculty, batch_size))
+            if not batch:
+                break
+            embedding_ids = {}
+            vectors = {}
+            for faculty, faculty_vectors in zip(batch, embedding_service.generate_vectors(batch, embedding_cache=checkpoint)):
+                vectors[faculty.faculty_id] = embedding_service.store_vectors(faculty, faculty_vectors, save_index=False)
+                embedding_ids[faculty.faculty_id] = faculty.embedding_id
+            database_driver.update_faculty_embedding_ids(embedding_ids, batch_size=PIPELINE_CONFIG["DB_BATCH_SIZE"])
+            database_driver.replace_embedding_vectors(vectors, batch_size=PIPELINE_CONFIG["DB_BATCH_SIZE"])
+            progress.update(len(batch))
+    finally:
+        progress.close()
+
+    embedding_service.embedding_storage.save_index()
 
 
 def should_rebuild_faiss_index():
@@ -139,14 +140,284 @@ def should_rebuild_faiss_index():
     return True
 
 
-if __name__ == '__main__':
-    logger.info("Starting populate_db.")
-    all_faculty = []
+class PopulateRun:
+    def __init__(self,
+                 checkpoint: PopulateCheckpoint,
+                 incremental: bool,
+                 existing_faculty: typing.Dict[typing.Tuple[str, str], typing.Tuple] = None,
+                 award_index: "AwardIndex" = None):
+        """
+        State shared by the pipeline stages of a single populate run.
+        :param checkpoint: checkpoint that scrape, enrich and embed results are read from and saved to
+        :param incremental: if True, skip faculty whose fingerprint matches `existing_faculty` and upsert the rest
+        :param existing_faculty: mapping of (name, email) to (faculty_id, fingerprint, embedding_id) before the run
+        :param award_index: harvested NIH projects and NSF awards to enrich from instead of the APIs
+        """
+        self.checkpoint = checkpoint
+        self.incremental = incremental
+        self.award_index = award_index
+        self.existing_faculty = existing_faculty or {}
+        # faculty_id -> (kind, source_key) -> (vector_id, text_hash) of the vectors stored for existing faculty
+        self.existing_vectors = database_driver.get_embedding_vectors(
+            [faculty_id for faculty_id, _, _ in self.existing_faculty.values()]
+        ) if incremental and self.existing_faculty else {}
+        self.stored_embedding_ids = embedding_service.embedding_storage.get_embedding_ids() if self.existing_vectors else set()
+        # faculty_id -> (schools, departments) of existing faculty before the run
+        self.existing_affiliations = database_driver.get_faculty_affiliations(
+            [faculty_id for faculty_id, _, _ in self.existing_faculty.values()]
+        ) if incremental and self.existing_faculty else {}
+        # (name, email) -> (schools, departments) for every scraped faculty member; duplicates found in
+        # later departments only extend these sets and are not enriched or embedded again
+        self.affiliations: typing.Dict[typing.Tuple[str, str], typing.Tuple[set, set]] = {}
+        self.counts = collections.Counter()
+        self._lock = threading.Lock()
+        self._progress = None
+
+    def scrape(self) -> typing.Iterator[typing.List[FacultyProfile]]:
+        """Pipeline source: scraped profiles of first-seen faculty, in batches that never span schools."""
+        batch_size = PIPELINE_CONFIG["BATCH_SIZE"]
+        for school in SCHOOLS_TO_SCRAPE:
+            batch = []
+            for profile in self._iter_school_profiles(school):
+                faculty_identifier = (profile.name, profile.email)
+                if faculty_identifier in self.affiliations:
+                    schools, departments = self.affiliations[faculty_identifier]
+                    schools.add(profile.school)
+                    departments.add(profile.department)
+                    continue
+
+                self.affiliations[faculty_identifier] = ({profile.school}, {profile.department})
+                batch.append(profile)
+                if len(batch) == batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+
+    def _iter_school_profiles(self, school: str) -> typing.Iterator[FacultyProfile]:
+        """Replay departments scraped by an earlier attempt from the checkpoint and scrape the rest."""
+        for department in InstitutionUtils.get_departments_from_school(school):
+            checkpointed_profiles = self.checkpoint.get_department_profiles(department)
+            if checkpointed_profiles is not None:
+                logger.info(f"Using checkpointed profiles for {department}.")
+                self._count("departments_resumed")
+                for profile in checkpointed_profiles:
+                    yield FacultyProfile(**profile)
+                continue
+
+            profiles = []
+            for profile in scraper_service.iter_department_faculty_profiles(department):
+                profiles.append(dataclasses.asdict(profile))
+                yield profile
+            self.checkpoint.save_department_profiles(department, profiles)
+
+    def enrich(self, profiles: typing.List[FacultyProfile]) -> typing.List["Faculty"]:
+        """Pipeline stage: NIH/NSF enrichment, fingerprinting and, in incremental mode, change detection."""
+        school_config = SCHOOL_DEPARTMENT_DATA.get(profiles[0].school, {})
+        add_nih_data = school_config.get("add_nih_data", True)
+        add_nsf_data = school_config.get("add_nsf_data", True)
+
+        faculty_list = []
+        profiles_to_enrich = []
+        for profile in profiles:
+            checkpointed_faculty = self.checkpoint.get_enriched_faculty(
+                self._enrichment_key(profile, add_nih_data, add_nsf_data)
+            )
+            if checkpointed_faculty is not None:
+                self._count("enrichment_resumed")
+                faculty_list.append(checkpointed_faculty)
+            else:
+                profiles_to_enrich.append(profile)
+
+        enriched_faculty = data_aggregator.build_faculty_models(
+            profiles_to_enrich,
+            add_nih_data=add_nih_data,
+            add_nsf_data=add_nsf_data,
+            award_index=self.award_index,
+            nih_concurrency=school_config.get("nih_concurrency", ENRICHMENT_CONCURRENCY["NIH"]),
+            nsf_concurrency=school_config.get("nsf_concurrency", ENRICHMENT_CONCURRENCY["NSF"]),
+        )
+        for profile, faculty in zip(profiles_to_enrich, enriched_faculty):
+            self.checkpoint.save_enriched_faculty(
+                self._enrichment_key(profile, add_nih_data, add_nsf_data), faculty
+            )
+        faculty_list.extend(enriched_faculty)
+
+        changed_faculty = []
+        for faculty in faculty_list:
+            faculty.fingerprint = compute_faculty_fingerprint(faculty)
+            existing = self.existing_faculty.get((faculty.name, faculty.email))
+            if self.incremental and existing and existing[1] == faculty.fingerprint:
+                self._count("unchanged")
+                continue
+            changed_faculty.append(faculty)
+        return changed_faculty
+
+    @staticmethod
+    def _enrichment_key(profile: FacultyProfile, add_nih_data: bool, add_nsf_data: bool) -> str:
+        return "|".join((profile.name, profile.email, profile.department,
+                         str(add_nih_data), str(add_nsf_data)))
+
+    def embed(self, faculty_list: typing.List["Faculty"]) -> typing.List[typing.Tuple["Faculty", typing.List[FacultyVector]]]:
+        """Pipeline stage: build and embed texts, reusing the stored vectors of unchanged texts."""
+        faculty_vectors = embedding_service.generate_vectors(
+            faculty_list,
+            embedding_cache=self.checkpoint,
+            existing_vectors=[self._reusable_vectors(faculty) for faculty in faculty_list],
+        )
+        return list(zip(faculty_list, faculty_vectors))
+
+    def _reusable_vectors(self, faculty: "Faculty") -> typing.Dict[typing.Tuple[str, str], typing.Tuple[int, str]]:
+        """Stored vectors of an existing faculty member that are still in the FAISS index."""
+        existing = self.existing_faculty.get((faculty.name, faculty.email)) if self.incremental else None
+        if not existing:
+            return {}
+        return {
+            key: (vector_id, text_hash)
+            for key, (vector_id, text_hash) in self.existing_vectors.get(existing[0], {}).items()
+            if vector_id in self.stored_embedding_ids
+        }
+
+    def _stored_vector_ids(self, faculty_id: int, embedding_id: int) -> typing.List[int]:
+        """IDs of the profile vector and all other vectors stored for an existing faculty member."""
+        return [embedding_id] + [vector_id for vector_id, _ in self.existing_vectors.get(faculty_id, {}).values()]
+
+    def write(self, embedded_faculty: typing.List[typing.Tuple["Faculty", typing.List[FacultyVector]]]):
+        """
+        Pipeline stage: add new vectors to the FAISS index, insert or update faculty records and their
+        vector rows, and remove the vectors an updated faculty member no longer uses.
+        """
+        embedding_storage = embedding_service.embedding_storage
+        new_faculty = []
+        for faculty, vectors in embedded_faculty:
+            faculty.vectors = embedding_service.store_vectors(faculty, vectors, save_index=False)
+            existing = self.existing_faculty.get((faculty.name, faculty.email)) if self.incremental else None
+            if existing:
+                faculty_id, _, old_embedding_id = existing
+                database_driver.update_faculty(faculty_id, faculty)
+                kept_ids = {vector.vector_id for vector in vectors}
+                embedding_storage.remove_embeddings(
+                    [vector_id for vector_id in self._stored_vector_ids(faculty_id, old_embedding_id)
+                     if vector_id not in kept_ids],
+                    save_index=False,
+                )
+                self._count("changed")
+            else:
+                new_faculty.append(faculty)
+                self._count("new")
+        database_driver.add_faculty_batch(new_faculty, batch_size=PIPELINE_CONFIG["DB_BATCH_SIZE"])
+        embedding_storage.save_index()
+
+        if self._progress is not None:
+            self._progress.update(len(embedded_faculty))
+
+    def run(self):
+        stages = [
+            PipelineStage("enrich", self.enrich, workers=PIPELINE_CONFIG["ENRICH_WORKERS"]),
+            PipelineStage("embed", self.embed, workers=PIPELINE_CONFIG["EMBED_WORKERS"]),
+            PipelineStage("write", self.write),
+        ]
+        with logging_redirect_tqdm():
+            self._progress = progress_bar(None, "Writing faculty records")
+            try:
+                StagedPipeline(
+                    self.scrape(),
+                    stages,
+                    queue_size=PIPELINE_CONFIG["QUEUE_SIZE"],
+                    source_name="scrape",
+                ).run()
+            finally:
+                self._progress.close()
+
+        database_driver.update_faculty_affiliations(self.affiliations)
+
+        if self.incremental:
+            self._remove_missing_faculty()
+
+        logger.info(f"Populate run complete: {dict(self.counts)}.")
+
+    def _remove_missing_faculty(self):
+        """
+        Delete previously stored faculty of the scraped schools that were not found by this scrape.
+        A school whose scrape found fewer than INCREMENTAL_MIN_SCRAPED_FRACTION of its stored faculty
+        is assumed to have failed to scrape, and its missing faculty are kept.
+        """
+        failed_schools = self._failed_schools()
+        missing = []
+        for faculty_identifier, existing in self.existing_faculty.items():
+            if faculty_identifier in self.affiliations:
+                continue
+            if failed_schools.intersection(self.existing_affiliations.get(existing[0], ([], []))[0]):
+                self.counts["removal_skipped"] += 1
+                continue
+            missing.append(existing)
+        if not missing:
+            return
+        database_driver.delete_faculty_by_ids([faculty_id for faculty_id, _, _ in missing])
+        embedding_service.embedding_storage.remove_embeddings([
+            vector_id
+            for faculty_id, _, embedding_id in missing
+            for vector_id in self._stored_vector_ids(faculty_id, embedding_id)
+        ])
+        self.counts["removed"] += len(missing)
+
+    def _failed_schools(self) -> typing.Set[str]:
+        """Scraped schools that found fewer than INCREMENTAL_MIN_SCRAPED_FRACTION of their stored faculty."""
+        stored = collections.Counter(
+            school for schools, _ in self.existing_affiliations.values() for school in schools
+        )
+        scraped = collections.Counter(
+            school for schools, _ in self.affiliations.values() for school in schools
+        )
+        failed_schools = set()
+        for school in SCHOOLS_TO_SCRAPE:
+            if stored[school] and scraped[school] < INCREMENTAL_MIN_SCRAPED_FRACTION * stored[school]:
+                logger.warning(f"Scrape of {school} found {scraped[school]} of its {stored[school]} stored faculty; "
+                               f"keeping the stored faculty it did not find.")
+                failed_schools.add(school)
+        return failed_schools
+
+    def _count(self, outcome: str):
+        with self._lock:
+            self.counts[outcome] += 1
+
+
+def run_incremental_update(checkpoint: PopulateCheckpoint, award_index: "AwardIndex" = None):
+    """
+    Re-scrape and re-enrich SCHOOLS_TO_SCRAPE, then write only the faculty whose fingerprint
+    changed, appeared or disappeared. Unchanged faculty are neither re-embedded nor rewritten.
+    Search documents are synced afterwards.
+    :param checkpoint: checkpoint of the current run
+    :param award_index: harvested awards to enrich from, when ENRICHMENT_MODE is "harvest"
+    """
+    logger.info(f"Running incremental update for schools: {SCHOOLS_TO_SCRAPE}.")
+    existing_faculty = database_driver.get_faculty_fingerprints(SCHOOLS_TO_SCRAPE)
+    PopulateRun(checkpoint, incremental=True, existing_faculty=existing_faculty, award_index=award_index).run()
+    database_driver.sync_search_documents(batch_size=PIPELINE_CONFIG["DB_BATCH_SIZE"])
+
+
+def run_full_update(checkpoint: PopulateCheckpoint, award_index: "AwardIndex" = None):
+    """
+    Delete SCHOOLS_TO_SCRAPE (or the whole database) and rebuild it from a fresh scrape.
+    When resuming, the deleted data is rebuilt from the checkpoint rather than scraped and embedded again.
+    Search documents are synced afterwards.
+    :param checkpoint: checkpoint of the current run
+    :param award_index: harvested awards to enrich from, when ENRICHMENT_MODE is "harvest"
+    """
     rebuild_index = should_rebuild_faiss_index()
 
     if KEEP_EXISTING_SCHOOLS:
         logger.info(f"Keeping existing schools outside scrape list: {SCHOOLS_TO_SCRAPE}.")
+        replaced_faculty = database_driver.get_faculty_fingerprints(SCHOOLS_TO_SCRAPE)
+        replaced_vectors = database_driver.get_embedding_vectors(
+            [faculty_id for faculty_id, _, _ in replaced_faculty.values()]
+        )
         database_driver.delete_faculty_by_schools(SCHOOLS_TO_SCRAPE)
+        if not rebuild_index:
+            embedding_service.embedding_storage.remove_embeddings(
+                [embedding_id for _, _, embedding_id in replaced_faculty.values()]
+                + [vector_id for vectors in replaced_vectors.values() for vector_id, _ in vectors.values()]
+            )
     else:
         logger.info("Clearing database.")
         database_driver.clear()
@@ -156,65 +427,31 @@ if __name__ == '__main__':
     else:
         logger.info("Keeping existing FAISS index and appending embeddings for scraped schools.")
 
-    try:
-        faculty_dict = dict()
-
-        for school in SCHOOLS_TO_SCRAPE:
-            school_config = SCHOOL_DEPARTMENT_DATA.get(school, {})
-            add_nih_data = school_config.get("add_nih_data", True)
-            school_faculty = data_aggregator.aggregate_school_faculty_data(
-                school,
-                add_nih_data=add_nih_data,
-                generate_embeddings=False,
-            )
-
-            for faculty in school_faculty:
-                merge_faculty_records(faculty_dict, faculty)
+    PopulateRun(checkpoint, incremental=False, award_index=award_index).run()
 
-        all_faculty = list(faculty_dict.values())
-
-        if not rebuild_index:
-            for faculty in all_faculty:
-                faculty.embedding_id = embedding_service.generate_and_store_embedding(faculty)
-
-        with logging_redirect_tqdm():
-            for school in progress_bar(SCHOOLS_TO_SCRAPE, "Scraping schools"):
-                school_config = SCHOOL_DEPARTMENT_DATA.get(school, {})
-                add_nih_data = school_config.get("add_nih_data", True)
-                add_nsf_data = school_config.get("add_nsf_data", True)
-                school_faculty = data_aggregator.aggregate_school_faculty_data(
-                    school,
-                    add_nih_data=add_nih_data,
-                    add_nsf_data=add_nsf_data,
-                    generate_embeddings=False,
-                )
-
-                for faculty in progress_bar(
-                        school_faculty,
-                        f"Merging {school} faculty",
-                        total=len(school_faculty)):
-                    merge_faculty_records(faculty_dict, faculty)
-
-            all_faculty = list(faculty_dict.values())
-
-            if not rebuild_index:
-                for faculty in progress_bar(all_faculty, "Generating embeddings"):
-                    faculty.embedding_id = embedding_service.generate_and_store_embedding(faculty)
-
-            for faculty in progress_bar(all_faculty, "Writing faculty records"):
-                database_driver.add_faculty(faculty)
-
-            if rebuild_index:
-                rebuild_faiss_index()
+    if rebuild_index:
+        embed_missing_faculty(checkpoint)
+    database_driver.sync_search_documents(batch_size=PIPELINE_CONFIG["DB_BATCH_SIZE"])
 
-        if rebuild_index:
-            rebuild_faiss_index()
 
-    except Exception as e:
-        logger.error(f"Failed to aggregate data: {e}")
-        if KEEP_EXISTING_SCHOOLS:
-            database_driver.delete_faculty_by_schools(SCHOOLS_TO_SCRAPE)
+if __name__ == '__main__':
+    logger.info("Starting populate_db.")
+    checkpoint = PopulateCheckpoint(CHECKPOINT_PATH, max_age_hours=CHECKPOINT_MAX_AGE_HOURS).open()
+    try:
+        award_index = load_award_index(get_harvest_service(funding_api_client)) if ENRICHMENT_MODE == "harvest" else None
+        if INCREMENTAL_UPDATE:
+            run_incremental_update(checkpoint, award_index)
         else:
-            database_driver.clear()
-        if rebuild_index:
-            delete_faiss_index()
+            run_full_update(checkpoint, award_index)
+        checkpoint.delete()
+    except Exception as e:
+        checkpoint.close()
+        logger.error(f"Failed to aggregate data: {e}. Completed work is checkpointed in {CHECKPOINT_PATH}; "
+                     f"rerun populate to resume.")
+        raise
+    finally:
+        logger.info(f"HTTP cache stats: {http_client.get_cache_stats()}")
+        logger.info(f"HTTP client metrics: {http_client.get_metrics()}")
+        logger.info(f"Funding API cache stats: {funding_api_cache.get_stats()}")
+        logger.info(f"Embedding metrics: {embedding_service.embedding_generator.get_metrics()}")
+        logger.info(f"Funding API client metrics: {funding_api_client.get_metrics()}")
@@ -13,8 +13,72 @@ KEEP_EXISTING_SCHOOLS = True
 # (only takes effect if KEEP_EXISTING_SCHOOLS is True)
 REBUILD_INDEX = False
 
+# Whether to update only faculty whose scraped profile or NIH/NSF data changed since the last run.
+# Faculty are matched on (name, email) and compared by content fingerprint; new and changed
+# faculty are re-embedded and upserted, faculty no longer listed are removed, and unchanged
+# faculty are left untouched. Overrides KEEP_EXISTING_SCHOOLS and REBUILD_INDEX when True.
+INCREMENTAL_UPDATE = False
+
+# Incremental updates only remove the stored faculty of a school missing from this scrape if the scrape
+# found at least this fraction of the school's stored faculty. A scraper that silently returns nothing
+# or little, e.g. after a page layout change or a blocked request, then leaves the school untouched.
+INCREMENTAL_MIN_SCRAPED_FRACTION = 0.5
+
+# Whether scraped pages stay in the HTTP cache indefinitely and are revalidated with
+# If-None-Match / If-Modified-Since on each run (304s are served from the cache),
+# instead of expiring after 30 seconds and being downloaded again in full
+HTTP_CACHE_REVALIDATE = True
+
+# Populate runs as a pipeline of concurrent stages (scrape -> enrich -> embed -> write).
+# BATCH_SIZE: faculty per batch passed between stages
+# QUEUE_SIZE: batches buffered between two stages before the upstream stage blocks
+# ENRICH_WORKERS / EMBED_WORKERS: threads calling the NIH/NSF and embedding APIs
+# DB_BATCH_SIZE: rows per flush/statement in bulk database writes
+PIPELINE_CONFIG = {
+    "BATCH_SIZE": 25,
+    "QUEUE_SIZE": 4,
+    "ENRICH_WORKERS": 2,
+    "EMBED_WORKERS": 2,
+    "DB_BATCH_SIZE": 500,
+}
+
+# Completed department scrapes, NIH/NSF enrichment and embeddings are checkpointed here while
+# populate runs. A failed run leaves the checkpoint in place and rerunning resumes from it;
+# checkpoints older than CHECKPOINT_MAX_AGE_HOURS are discarded instead of resumed.
+CHECKPOINT_PATH = os.path.join(BASE_DIR, "..", "..", "instance", "populate_checkpoint.sqlite")
+CHECKPOINT_MAX_AGE_HOURS = 48
+
+# Durable cache of NIH RePORTER and NSF API responses, shared by populate, the harvest and
+# add_grants_to_db.py. Responses are keyed by endpoint and normalized payload, stored
+# zlib-compressed, and reused until their endpoint's TTL (seconds) runs out; a TTL of 0
+# disables caching for that endpoint. NIH RePORTER data is refreshed weekly, NSF data daily.
+FUNDING_API_CACHE = {
+    "PATH": os.path.join(BASE_DIR, "..", "..", "instance", "funding_api_cache.sqlite"),
+    "TTL_SECONDS": {
+        "nih_reporter_search": 7 * 24 * 3600,
+        "nsf_awards_search": 24 * 3600,
+        "nsf_award": 7 * 24 * 3600,
+    },
+}
+
+# add_grants_to_db.py backfill of NSF grants for existing faculty.
+# WORKERS: concurrent NSF lookups
+# BATCH_SIZE: grants upserted per committed batch
+GRANT_BACKFILL_CONFIG = {
+    "WORKERS": 4,
+    "BATCH_SIZE": 200,
+}
+
 SCHOOLS_TO_SCRAPE = ["DARDEN"]
 
+# Default limits on concurrent NIH RePORTER / NSF requests while enriching a batch of faculty.
+# A school can override them with "nih_concurrency" / "nsf_concurrency" next to its
+# "add_nih_data" / "add_nsf_data" flags. Limits apply per enrich worker (PIPELINE_CONFIG["ENRICH_WORKERS"]).
+ENRICHMENT_CONCURRENCY = {
+    "NIH": 4,
+    "NSF": 4,
+}
+
 SCHOOL_DEPARTMENT_DATA = {
     "NURSING": {
         "base_url": "",
@@ -110,6 +174,30 @@ SCHOOL_DEPARTMENT_DATA = {
 
 DEFAULT_FISCAL_YEARS = list(range(datetime.datetime.now().year - 5, datetime.datetime.now().year + 1))
 
+# How faculty are enriched with NIH RePORTER and NSF data:
+# "per_faculty": one RePORTER request and one NSF request per faculty member
+# "batched": PI names are sent NIH_BATCH_CONFIG["PI_NAMES_PER_REQUEST"] at a time and the paged
+#            results are mapped back to faculty by principal investigator name
+# "harvest": every NIH project and NSF award of the institution is downloaded once (see
+#            HARVEST_CONFIG and backend/core/harvest.py) and joined to faculty by name, offline
+ENRICHMENT_MODE = "batched"
+
+# PATH: local store of harvested NIH projects and NSF awards
+# MAX_AGE_HOURS: populate re-harvests first when the stored harvest is older than this
+# NSF_AWARDEE_NAME: NSF awardee name of the institution (NIH uses org_names in NIH_REPORTER_PAYLOAD)
+HARVEST_CONFIG = {
+    "PATH": os.path.join(BASE_DIR, "..", "..", "instance", "award_harvest.sqlite"),
+    "MAX_AGE_HOURS": 24 * 7,
+    "NSF_AWARDEE_NAME": "University of Virginia",
+}
+
+# PI_NAMES_PER_REQUEST: PI names per RePORTER search in batched mode
+# PAGE_SIZE: results per RePORTER page (the API allows at most 500)
+NIH_BATCH_CONFIG = {
+    "PI_NAMES_PER_REQUEST": 25,
+    "PAGE_SIZE": 500,
+}
+
 NIH_REPORTER_PAYLOAD = {
     "criteria": {
         "use_relevance": True,
@@ -128,8 +216,65 @@ NIH_REPORTER_PAYLOAD = {
     },
 }
 
+# CHUNKED_FALLBACK: texts over MAX_TOKENS are split into chunks whose embeddings are averaged
+# (one API call per chunk) instead of being truncated to MAX_TOKENS. Faculty profiles are built
+# to fit MAX_TOKENS (see PROFILE_DOCUMENT_CONFIG), so this only affects unusually long inputs.
+# BATCH_SIZE / BATCH_MAX_TOKENS: most texts and tokens sent in one embedding API request
 OPENAI_CONFIG = {
     "EMBEDDING_MODEL": "text-embedding-ada-002",
     "MAX_TOKENS": 8192,
     "EMBEDDING_DIMENSIONS": 1536,
+    "CHUNKED_FALLBACK": False,
+    "BATCH_SIZE": 64,
+    "BATCH_MAX_TOKENS": 250000,
+}
+
+# Each faculty member is indexed with several vectors: one for the profile and, in multi-vector mode,
+# one per distinct project and grant, all owned by the profile vector (Faculty.embedding_id).
+# Search scores each faculty member from its matching vectors, so one strongly matching project
+# is not averaged away by unrelated ones, and a changed project re-embeds only that project.
+# MULTI_VECTOR: if False, only the profile vector is stored and it embeds the whole profile document;
+#               part of the faculty fingerprint, so switching it re-embeds every faculty member
+# AGGREGATION: "max" scores a faculty member by its best matching vector,
+#              "sum_top_n" by the summed similarity of its TOP_N best matching vectors
+# CANDIDATES_PER_RESULT: vectors retrieved per requested result before aggregating by faculty member
+EMBEDDING_INDEX_CONFIG = {
+    "MULTI_VECTOR": True,
+    "AGGREGATION": "max",
+    "TOP_N": 3,
+    "CANDIDATES_PER_RESULT": 8,
+}
+
+# Lexical and hybrid search (mode=lexical|hybrid on /api/search) over the about text, project
+# abstracts and project terms of each faculty member, with an in-memory BM25 index built from the
+# database when the FAISS index is loaded.
+# BM25_K1 / BM25_B: BM25 term frequency saturation and document length normalization
+# HYBRID_CANDIDATES_PER_RESULT: results taken from the vector and the lexical ranking per requested result
+# RRF_K: reciprocal rank fusion constant used to fuse the two rankings in hybrid mode
+LEXICAL_SEARCH_CONFIG = {
+    "BM25_K1": 1.2,
+    "BM25_B": 0.75,
+    "HYBRID_CANDIDATES_PER_RESULT": 4,
+    "RRF_K": 60,
+}
+
+# Faculty profiles are embedded as one document that fits OPENAI_CONFIG["MAX_TOKENS"]. In multi-vector
+# mode (see EMBEDDING_INDEX_CONFIG) the profile document holds only the about section.
+# SECTION_SHARES: share of the token budget planned for each section; budget a section does not
+#                 need is handed to the others. Projects are ranked most recent first, terms by how
+#                 many projects list them, grants most recent first; content past the budget is cut.
+# RESERVED_TOKENS: tokens kept free for section labels and tokenization differences at joins
+# MIN_SECTION_TOKENS: a section item is truncated only if at least this many tokens of it fit
+# VERSION: part of the faculty fingerprint; bump when the document layout changes so incremental
+#          updates re-embed every profile
+PROFILE_DOCUMENT_CONFIG = {
+    "SECTION_SHARES": {
+        "about": 0.25,
+        "projects": 0.5,
+        "terms": 0.1,
+        "grants": 0.15,
+    },
+    "RESERVED_TOKENS": 64,
+    "MIN_SECTION_TOKENS": 32,
+    "VERSION": 2,
 }
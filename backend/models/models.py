@@ -1,10 +1,44 @@
 from backend.core.extensions import db
 
+faculty_schools = db.Table(
+    'faculty_schools',
+    db.Column('faculty_id', db.Integer, db.ForeignKey('faculty.faculty_id', ondelete='CASCADE'), primary_key=True),
+    db.Column('school_id', db.Integer, db.ForeignKey('schools.school_id', ondelete='CASCADE'), primary_key=True),
+    db.Index('ix_faculty_schools_school_id', 'school_id', 'faculty_id'),
+)
+
+faculty_departments = db.Table(
+    'faculty_departments',
+    db.Column('faculty_id', db.Integer, db.ForeignKey('faculty.faculty_id', ondelete='CASCADE'), primary_key=True),
+    db.Column('department_id', db.Integer, db.ForeignKey('departments.department_id', ondelete='CASCADE'), primary_key=True),
+    db.Index('ix_faculty_departments_department_id', 'department_id', 'faculty_id'),
+)
+
+
+class School(db.Model):
+    __tablename__ = 'schools'
+
+    school_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    name = db.Column(db.String, nullable=False, unique=True)
+
+
+class Department(db.Model):
+    __tablename__ = 'departments'
+
+    department_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    name = db.Column(db.String, nullable=False, unique=True)
+
+
 class Faculty(db.Model):
     __tablename__ = 'faculty'
+    __table_args__ = (
+        db.Index('ix_faculty_embedding_id', 'embedding_id'),
+    )
 
     faculty_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     name = db.Column(db.String, nullable=False)
+    # School and department of the profile the record was built from; every school and department
+    # the faculty member was found in is listed by `schools` and `departments`
     school = db.Column(db.String, nullable=False)
     department = db.Column(db.String, nullable=False)
     about = db.Column(db.Text, nullable=True)
@@ -12,13 +46,22 @@ class Faculty(db.Model):
     profile_url = db.Column(db.String, nullable=True)
     has_funding = db.Column(db.Boolean, nullable=True)
     embedding_id = db.Column(db.Integer, nullable=False)
+    fingerprint = db.Column(db.String(64), nullable=True)
     # grant_ids = db.Column(db.Text, nullable=True) # Comma-separated list
-    grants = db.relationship("Grant", back_populates="faculty", cascade="all, delete", lazy='joined')
-    projects = db.relationship("Project", back_populates="faculty", cascade="all, delete")
+    grants = db.relationship("Grant", back_populates="faculty", cascade="all, delete-orphan", lazy='joined')
+    projects = db.relationship("Project", back_populates="faculty", cascade="all, delete-orphan")
+    vectors = db.relationship("EmbeddingVector", back_populates="faculty", cascade="all, delete-orphan")
+    schools = db.relationship("School", secondary=faculty_schools, order_by="School.name", lazy='selectin')
+    departments = db.relationship("Department", secondary=faculty_departments, order_by="Department.name", lazy='selectin')
 
 
 class Project(db.Model):
     __tablename__ = "projects"
+    __table_args__ = (
+        db.UniqueConstraint('faculty_id', 'project_number', name='uq_projects_faculty_id_project_number'),
+        db.Index('ix_projects_activity_code_faculty_id', 'activity_code', 'faculty_id'),
+        db.Index('ix_projects_agency_ic_admin_faculty_id', 'agency_ic_admin', 'faculty_id'),
+    )
 
     project_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     faculty_id = db.Column(db.Integer, db.ForeignKey('faculty.faculty_id', ondelete='CASCADE'), nullable=False)
@@ -34,6 +77,9 @@ class Project(db.Model):
 
 class Grant(db.Model):
     __tablename__ = 'grants'
+    __table_args__ = (
+        db.UniqueConstraint('faculty_id', 'nsf_id', name='uq_grants_faculty_id_nsf_id'),
+    )
 
     grant_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     nsf_id = db.Column(db.String, nullable=False)
@@ -42,4 +88,31 @@ class Grant(db.Model):
     start_date = db.Column(db.Date, nullable=True)
     title = db.Column(db.String, nullable=True)
 
-    faculty = db.relationship('Faculty', back_populates='grants')
\ No newline at end of file
+    faculty = db.relationship('Faculty', back_populates='grants')
+
+class EmbeddingVector(db.Model):
+    """A vector of the FAISS index and the faculty member owning it: the profile, a project or a grant."""
+    __tablename__ = 'embedding_vectors'
+    __table_args__ = (
+        db.Index('ix_embedding_vectors_faculty_id_kind_source_key', 'faculty_id', 'kind', 'source_key'),
+    )
+
+    vector_id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    faculty_id = db.Column(db.Integer, db.ForeignKey('faculty.faculty_id', ondelete='CASCADE'), nullable=False)
+    kind = db.Column(db.String(16), nullable=False)
+    source_key = db.Column(db.String, nullable=False, default="")
+    text_hash = db.Column(db.String(64), nullable=False)
+
+    faculty = db.relationship('Faculty', back_populates='vectors')
+
+
+class FacultySearchDocument(db.Model):
+    """A faculty member serialized as a search result, precomputed by populate so results are hydrated by one lookup."""
+    __tablename__ = 'faculty_search_doc'
+    __table_args__ = (
+        db.Index('ix_faculty_search_doc_faculty_id', 'faculty_id'),
+    )
+
+    embedding_id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    faculty_id = db.Column(db.Integer, db.ForeignKey('faculty.faculty_id', ondelete='CASCADE'), nullable=False)
+    document = db.Column(db.Text, nullable=False)
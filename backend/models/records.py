@@ -0,0 +1,78 @@
+import typing
+from dataclasses import dataclass
+from datetime import date
+
+
+@dataclass(slots=True)
+class FacultyProfile:
+    """Faculty profile as scraped from a department's people page."""
+    name: str
+    school: str
+    department: str
+    email: str
+    about: str
+    profile_url: str
+
+
+@dataclass(slots=True)
+class NIHProject:
+    """Project metadata extracted from an NIH RePORTER search result."""
+    project_number: str
+    abstract_text: typing.Optional[str]
+    terms: typing.Optional[str]
+    start_date: typing.Optional[date]
+    end_date: typing.Optional[date]
+    agency_ic_admin: typing.Optional[str]
+    activity_code: typing.Optional[str]
+    core_project_number: typing.Optional[str] = None
+    fiscal_year: typing.Optional[int] = None
+
+
+@dataclass(slots=True)
+class NSFAward:
+    """Award metadata extracted from an NSF awards API result."""
+    id: str
+    date: typing.Optional[date]
+    start_date: typing.Optional[date]
+    title: typing.Optional[str]
+
+
+@dataclass(slots=True)
+class FacultyVector:
+    """
+    A text of a faculty member to index: its profile, a project or a grant. Holds either the new
+    embedding of the text, or the ID of a stored vector of the same text that is reused.
+    """
+    kind: str
+    source_key: str
+    text_hash: str
+    embedding: typing.Optional[typing.List[float]] = None
+    vector_id: typing.Optional[int] = None
+
+
+class FacultyName(typing.NamedTuple):
+    """A stored faculty member and every school it is listed under."""
+    faculty_id: int
+    name: str
+    schools: typing.List[str]
+
+
+@dataclass(slots=True)
+class FacultySummary:
+    """Identifying fields of a faculty member listed with a project search result."""
+    faculty_id: int
+    name: str
+    school: str
+    schools: typing.List[str]
+    departments: typing.List[str]
+    email: typing.Optional[str]
+    profile_url: typing.Optional[str]
+
+
+@dataclass(slots=True)
+class AwardMatch:
+    """An NIH project or NSF grant matching a project search, with every faculty member it is listed for."""
+    kind: str
+    award: typing.Union["Project", "Grant"]
+    score: float
+    faculty: typing.List[FacultySummary]
@@ -1,12 +1,14 @@
 import typing
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from backend.services.embedding.embedding_service import EmbeddingService
 from backend.services.nih.nih_reporter_service import NIHReporterService
 from backend.services.nsf.nsf_service import NSFService
 from backend.services.scraper.scraper_service import ScraperService
 from backend.models.models import *
-import pandas as pd
+from backend.models.records import FacultyProfile, NIHProject, NSFAward
+from backend.utils.name_utils import parse_name
 
 logger = logging.getLogger(__name__)
 
@@ -15,11 +17,17 @@ class DataAggregator:
                  scraper_service: ScraperService,
                  nih_service: NIHReporterService,
                  embedding_service: EmbeddingService,
-                 nsf_service: NSFService):
+                 nsf_service: NSFService,
+                 enrichment_mode: str = "per_faculty"):
+        """
+        :param enrichment_mode: "per_faculty" to query NIH RePORTER once per faculty member, or
+            "batched" to query it once per group of PI names in build_faculty_models
+        """
         self.scraper_service = scraper_service
         self.nih_service = nih_service
         self.embedding_service = embedding_service
         self.nsf_service = nsf_service
+        self.enrichment_mode = enrichment_mode
 
     def aggregate_school_faculty_data(
             self,
@@ -36,42 +44,144 @@ class DataAggregator:
         :param generate_embeddings: if False, leave embedding IDs unset for a later index rebuild
         :return: dictionary of department faculty data stored as Faculty model objects
         """
-        school_faculty_df = self.scraper_service.get_school_faculty_data(school)
+        school_faculty_profiles = self.scraper_service.get_school_faculty_data(school)
         faculty_list = []
 
-        for dept, dept_faculty_df in school_faculty_df.items():
-            for faculty_profile in dept_faculty_df.itertuples():
-                faculty = self._build_faculty_model(
-                    faculty_profile,
+        for dept, dept_faculty_profiles in school_faculty_profiles.items():
+            for faculty in self.build_faculty_models(
+                    dept_faculty_profiles,
                     add_nih_data=add_nih_data,
-                    add_nsf_data=add_nsf_data,
-                )
+                    add_nsf_data=add_nsf_data):
                 if generate_embeddings:
                     faculty.embedding_id = self.embedding_service.generate_and_store_embedding(faculty)
                 faculty_list.append(faculty)
 
         return faculty_list
 
+    def build_faculty_models(
+            self,
+            faculty_profiles: typing.List[FacultyProfile],
+            add_nih_data: bool = True,
+            add_nsf_data: bool = True,
+            award_index: "AwardIndex" = None,
+            nih_concurrency: int = 1,
+            nsf_concurrency: int = 1) -> typing.List[Faculty]:
+        """
+        Enrich a batch of scraped faculty profiles with NIH RePORTER and NSF data.
+        NIH and NSF requests run on separate worker pools, so both services are queried at the
+        same time and each service has at most its own concurrency limit of requests in flight.
+        :param faculty_profiles: scraped faculty profiles
+        :param add_nih_data: if False, skip NIH RePORTER API calls
+        :param add_nsf_data: if False, skip NSF API calls
+        :param award_index: harvested NIH projects and NSF awards; if given, faculty are joined to it
+            by name instead of calling either API
+        :param nih_concurrency: maximum number of concurrent NIH RePORTER requests
+        :param nsf_concurrency: maximum number of concurrent NSF requests
+        :return: Faculty model objects without embeddings
+        """
+        if award_index is not None:
+            return [
+                self._build_faculty_model_from_index(faculty_profile, award_index, add_nih_data, add_nsf_data)
+                for faculty_profile in faculty_profiles
+            ]
+
+        pi_names = [self._extract_names(faculty_profile) for faculty_profile in faculty_profiles]
+        with ThreadPoolExecutor(max_workers=nih_concurrency, thread_name_prefix="nih") as nih_pool, \
+                ThreadPoolExecutor(max_workers=nsf_concurrency, thread_name_prefix="nsf") as nsf_pool:
+            nsf_futures = [
+                nsf_pool.submit(self._fetch_nsf_grants, first_name, last_name) if add_nsf_data else None
+                for first_name, last_name in pi_names
+            ]
+            if add_nih_data and self.enrichment_mode == "batched":
+                logger.info(f"Fetching NIH project information for {len(pi_names)} faculty.")
+                # One paged search for the whole batch; NSF requests keep running meanwhile
+                projects_by_pi = self.nih_service.compile_batch_project_metadata(pi_names)
+                nih_futures = [None] * len(pi_names)
+            else:
+                projects_by_pi = {}
+                nih_futures = [
+                    nih_pool.submit(self._fetch_nih_projects, first_name, last_name) if add_nih_data else None
+                    for first_name, last_name in pi_names
+                ]
+
+            faculty_list = []
+            for faculty_profile, pi_name, nih_future, nsf_future in zip(
+                    faculty_profiles, pi_names, nih_futures, nsf_futures):
+                faculty_list.append(self._build_faculty_model(
+                    faculty_profile,
+                    add_nih_data=add_nih_data,
+                    add_nsf_data=add_nsf_data,
+                    nih_projects=nih_future.result() if nih_future else projects_by_pi.get(pi_name),
+                    nsf_awards=nsf_future.result() if nsf_future else None,
+                ))
+        return faculty_list
+
+    def _fetch_nih_projects(self, pi_first_name: str, pi_last_name: str) -> typing.List[NIHProject]:
+        logger.info(f"Fetching NIH project information for {pi_first_name} {pi_last_name}.")
+        return self.nih_service.compile_project_metadata(pi_first_name, pi_last_name)
+
+    def _fetch_nsf_grants(self, first_name: str, last_name: str) -> typing.List[NSFAward]:
+        logger.info(f"Fetching NSF grants for {first_name} {last_name}.")
+        return self.get_nsf_grants(first_name, last_name)
+
+    def _build_faculty_model_from_index(
+            self,
+            faculty_profile: FacultyProfile,
+            award_index: "AwardIndex",
+            add_nih_data: bool,
+            add_nsf_data: bool) -> Faculty:
+        """
+        Build faculty model from faculty profile and harvested awards
+        :param faculty_profile: faculty data
+        :param award_index: harvested NIH projects and NSF awards
+        :param add_nih_data: if False, leave projects empty
+        :param add_nsf_data: if False, leave grants empty
+        :return: faculty model
+        """
+        first_name, last_name = self._extract_names(faculty_profile)
+        return self._build_faculty_model(
+            faculty_profile,
+            add_nih_data=add_nih_data,
+            add_nsf_data=add_nsf_data,
+            nih_projects=[
+                self.nih_service.compile_project(project)
+                for project in award_index.get_nih_projects(first_name, last_name)
+            ],
+            nsf_awards=[
+                self.nsf_service.compile_award(award)
+                for award in award_index.get_nsf_awards(first_name, last_name)
+            ],
+        )
+
     def _build_faculty_model(
             self,
-            faculty_profile: typing.Tuple,
+            faculty_profile: FacultyProfile,
             add_nih_data: bool = True,
-            add_nsf_data: bool = True) -> Faculty:
+            add_nsf_data: bool = True,
+            nih_projects: typing.List[NIHProject] = None,
+            nsf_awards: typing.List[NSFAward] = None) -> Faculty:
         """
         Build faculty model from faculty profile
         :param faculty_profile: faculty data
         :param add_nih_data: if False, skip NIH RePORTER API call and leave projects empty
         :param add_nsf_data: if False, skip NSF API call and leave grants empty
+        :param nih_projects: NIH project metadata already fetched for this faculty member, if any
+        :param nsf_awards: NSF award metadata already fetched for this faculty member, if any
         :return: faculty model
         """
         first_name, last_name = self._extract_names(faculty_profile)
-        if add_nih_data:
+        if add_nih_data and nih_projects is not None:
+            projects = [
+                self._convert_to_project_model(project)
+                for project in NIHReporterService.canonicalize_projects(nih_projects)
+            ]
+        elif add_nih_data:
             logger.info(f"Fetching NIH project information for {first_name} {last_name}.")
             projects = self._get_projects(first_name, last_name)
         else:
             logger.debug(f"Skipping NIH data for {first_name} {last_name} (add_nih_data=False).")
             projects = []
-        # nsf_grants = self.nsf_service.compile_project_metadata(pi_first_name=first_name, pi_last_name=last_name) if self.nsf_service else pd.DataFrame()
+        # nsf_grants = self.nsf_service.compile_project_metadata(pi_first_name=first_name, pi_last_name=last_name) if self.nsf_service else []
         # grant_ids = self.get_nsf_grant_ids(first_name, last_name)
         # if not grant_ids:
         #     logger.warning(f"No NSF grant IDs found for {first_name} {last_name}.")
@@ -79,26 +189,30 @@ class DataAggregator:
         #     logger.info(f"IDs for {first_name} {last_name}: {', '.join(grant_ids)}")
         grants_list = []
         if add_nsf_data:
-            logger.info(f"Fetching NSF grants for {first_name} {last_name}.")
-            grants = self.get_nsf_grants(first_name, last_name)
-            if grants.empty:
+            if nsf_awards is None:
+                logger.info(f"Fetching NSF grants for {first_name} {last_name}.")
+                nsf_awards = self.get_nsf_grants(first_name, last_name)
+            if not nsf_awards:
                 logger.warning(f"No NSF grants found for {first_name} {last_name}.")
             else:
                 grants_list = [Grant(
-                        nsf_id=row['id'],
-                        date=self.nsf_service.process_date_string(row['date']),
-                        start_date=self.nsf_service.process_date_string(row['start_date']),
-                        title=row['title']
-                    ) for _, row in grants.iterrows()]
+                        nsf_id=award.id,
+                        date=award.date,
+                        start_date=award.start_date,
+                        title=award.title
+                    ) for award in nsf_awards]
         else:
             logger.debug(f"Skipping NSF data for {first_name} {last_name} (add_nsf_data=False).")
+        # Projects and grants are unique per faculty member (see the model constraints)
+        projects = self._deduplicate(projects, "project_number")
+        grants_list = self._deduplicate(grants_list, "nsf_id")
         faculty = Faculty(
-            name=faculty_profile.Faculty_Name,
-            school=faculty_profile.School,
-            department=faculty_profile.Department,
-            about=faculty_profile.About_Section,
-            email=faculty_profile.Email_Address,
-            profile_url=faculty_profile.Profile_URL,
+            name=faculty_profile.name,
+            school=faculty_profile.school,
+            department=faculty_profile.department,
+            about=faculty_profile.about,
+            email=faculty_profile.email,
+            profile_url=faculty_profile.profile_url,
             projects=projects,
             # grant_ids=",".join(grant_ids) if grant_ids else None,
             grants=grants_list,
@@ -107,6 +221,16 @@ class DataAggregator:
         )
         return faculty
 
+    @staticmethod
+    def _deduplicate(records: typing.List[typing.Any], key: str) -> typing.List[typing.Any]:
+        """
+        Drop records whose `key` attribute repeats an earlier record's; the last duplicate's data is kept.
+        :param records: Project or Grant model objects
+        :param key: attribute identifying a record
+        :return: records with unique keys
+        """
+        return list({getattr(record, key): record for record in records}.values())
+
     def _get_projects(self, pi_first_name: str, pi_last_name: str) -> typing.List[Project]:
         """
         Retrieve NIH-funded projects from NIH RePORTER API and convert to Project model object
@@ -114,14 +238,17 @@ class DataAggregator:
         :param pi_last_name: PI last name
         :return: list of Project model objects
         """
-        projects_df = self.nih_service.compile_project_metadata(pi_first_name, pi_last_name)
-        return [self._convert_to_project_model(project) for project in projects_df.itertuples()]
+        nih_projects = self.nih_service.compile_project_metadata(pi_first_name, pi_last_name)
+        return [
+            self._convert_to_project_model(project)
+            for project in NIHReporterService.canonicalize_projects(nih_projects)
+        ]
 
     @staticmethod
-    def _convert_to_project_model(project: typing.Tuple) -> Project:
+    def _convert_to_project_model(project: NIHProject) -> Project:
         """
-        Convert namedtuple to Project model object
-        :param project: namedtuple
+        Convert NIH project record to Project model object
+        :param project: NIH project record
         :return: Project model object
         """
         return Project(
@@ -144,40 +271,37 @@ class DataAggregator:
         # if not first_name or not last_name:
         #     raise ValueError("First name and last name must be provided to retrieve NSF grant IDs.")
         try:
-            grants_df = self.nsf_service.compile_project_metadata(pi_first_name=first_name, pi_last_name=last_name)
-            return grants_df['id'].tolist() if not grants_df.empty else []
+            awards = self.nsf_service.compile_project_metadata(pi_first_name=first_name, pi_last_name=last_name)
+            return [award.id for award in awards]
         except Exception as e:
             logger.error(f"Error retrieving NSF grant IDs for {first_name} {last_name}: {e}")
             return []
 
-    def get_nsf_grants(self, first_name: str, last_name: str) -> pd.DataFrame:
+    def get_nsf_grants(self, first_name: str, last_name: str) -> typing.List[NSFAward]:
         """
         Retrieve NSF grants for a given PI
         :param first_name: PI first name
         :param last_name: PI last name
-        :return: DataFrame of NSF grants
+        :return: list of NSF award records
         """
         if not first_name or not last_name:
             raise ValueError("First name and last name must be provided to retrieve NSF grants.")
         try:
-            grants_df = self.nsf_service.compile_project_metadata(pi_first_name=first_name, pi_last_name=last_name)
-            if grants_df.empty:
-                # logger.warning(f"No NSF grants found for PI '{first_name} {last_name}'.")
-                return pd.DataFrame()
-            return grants_df
+            return self.nsf_service.compile_project_metadata(pi_first_name=first_name, pi_last_name=last_name)
         except Exception as e:
             logger.error(f"Error retrieving NSF grants for {first_name} {last_name}: {e}")
-            return pd.DataFrame()
+            return []
 
     @staticmethod
-    def _extract_names(faculty_profile: typing.Tuple) -> typing.Tuple[str, str]:
+    def _extract_names(faculty_profile: FacultyProfile) -> typing.Tuple[str, str]:
         """
-        Extract faculty names from NamedTuple
-        :param faculty_profile: named tuple w/ faculty information
+        Extract faculty names from profile, without middle names, honorifics, suffixes or diacritics
+        :param faculty_profile: faculty profile record
         :return: first and last name of faculty member
         """
-        names = faculty_profile.Faculty_Name.split(" ")
-        return names[0], names[-1]
+        name = parse_name(faculty_profile.name)
+        # Single-word names are used as both first and last name
+        return name.first or name.last, name.last
 
     def _has_funding(self, projects: typing.List[Project]) -> bool:
         """
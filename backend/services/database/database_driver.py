@@ -1,13 +1,257 @@
+import re
 import logging
 import typing
-from sqlalchemy import delete, or_
+import weakref
+from sqlalchemy import delete, update, insert, select, and_, or_, tuple_, func, inspect, text, literal_column
+from sqlalchemy import table as table_clause, column as column_clause
 from contextlib import contextmanager
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, selectinload, load_only, raiseload
 
 from backend.core.extensions import db
+from backend.models.records import FacultyName, FacultySummary
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BATCH_SIZE = 500
+
+
+def _chunks(items: typing.List, batch_size: int) -> typing.Iterator[typing.List]:
+    for start in range(0, len(items), batch_size):
+        yield items[start:start + batch_size]
+
+
+_WEBSEARCH_TERM = re.compile(r'(-?)"([^"]*)"?|(\S+)')
+_WORD = re.compile(r"\w+")
+
+# Full-text search backend available per engine: "postgresql", "sqlite", or None for the ILIKE fallback
+_full_text_search_backends = weakref.WeakKeyDictionary()
+
+
+def _websearch_to_fts5(query: str) -> typing.Optional[str]:
+    """
+    Translate web search syntax, as accepted by PostgreSQL's websearch_to_tsquery, into an SQLite
+    FTS5 query: words and "quoted phrases" must all match, OR between two terms matches either,
+    and a leading - excludes a term. Terms are always quoted, so other FTS5 syntax is not interpreted.
+    :param query: web search query
+    :return: FTS5 MATCH expression, or None if the query has no term to match
+    """
+    clauses = []
+    excluded = []
+    alternative = False
+    for negated, phrase, word in _WEBSEARCH_TERM.findall(query):
+        if not phrase and word.upper() == "OR":
+            alternative = bool(clauses)
+            continue
+        if word.startswith("-"):
+            negated, word = "-", word[1:]
+        words = _WORD.findall(phrase or word)
+        if not words:
+            continue
+        term = '"' + " ".join(words) + '"'
+        if negated:
+            excluded.append(term)
+        elif alternative:
+            clauses[-1].append(term)
+        else:
+            clauses.append([term])
+        alternative = False
+    if not clauses:
+        return None
+    expression = " AND ".join(
+        f"({' OR '.join(terms)})" if len(terms) > 1 else terms[0] for terms in clauses
+    )
+    for term in excluded:
+        expression = f"({expression}) NOT {term}"
+    return expression
+
+
+def _full_text_search_backend() -> typing.Optional[str]:
+    """
+    :return: "postgresql" or "sqlite" if the database has the full-text search objects created by
+    migration f4c18b2e6a73, otherwise None
+    """
+    engine = db.session.get_bind()
+    if engine not in _full_text_search_backends:
+        dialect = engine.dialect.name
+        inspector = inspect(engine)
+        if dialect == "postgresql":
+            available = any(c["name"] == "search_vector" for c in inspector.get_columns("faculty"))
+        elif dialect == "sqlite":
+            available = inspector.has_table("faculty_fts")
+        else:
+            available = False
+        _full_text_search_backends[engine] = dialect if available else None
+    return _full_text_search_backends[engine]
+
+
+def _upsert_rows(model: typing.Type, rows: typing.List[typing.Dict], key_columns: typing.List[str]):
+    """
+    Insert rows, or update the existing row with the same key columns, without committing.
+    SQLite and PostgreSQL use a native INSERT ... ON CONFLICT DO UPDATE that only rewrites rows whose
+    values changed; other dialects look up existing keys first and issue separate updates and inserts.
+    Rows must have unique keys and the same columns.
+    :param model: model class with a unique constraint on `key_columns`
+    :param rows: column values per row
+    :param key_columns: columns of the unique constraint
+    """
+    if not rows:
+        return
+
+    table = model.__table__
+    dialect = db.session.get_bind().dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        statement = dialect_insert(table)
+        update_columns = [column for column in rows[0] if column not in key_columns]
+        if update_columns:
+            statement = statement.on_conflict_do_update(
+                index_elements=key_columns,
+                set_={column: statement.excluded[column] for column in update_columns},
+                where=or_(*(table.c[column].is_distinct_from(statement.excluded[column]) for column in update_columns)),
+            )
+        else:
+            statement = statement.on_conflict_do_nothing(index_elements=key_columns)
+        db.session.execute(statement, rows)
+        return
+
+    primary_key = model.__mapper__.primary_key[0].key
+    key_of = lambda row: tuple(row[column] for column in key_columns)
+    existing = {
+        tuple(row[1:]): row[0]
+        for row in db.session.execute(
+            select(getattr(model, primary_key), *(getattr(model, column) for column in key_columns))
+            .where(tuple_(*(getattr(model, column) for column in key_columns)).in_([key_of(row) for row in rows]))
+        )
+    }
+    updates = [{**row, primary_key: existing[key_of(row)]} for row in rows if key_of(row) in existing]
+    inserts = [row for row in rows if key_of(row) not in existing]
+    if updates:
+        db.session.execute(update(model), updates)
+    if inserts:
+        db.session.execute(insert(model), inserts)
+
+
+def _sync_children(model: typing.Type, faculty_id: int, children: typing.List, key_column: str):
+    """
+    Make a faculty member's Projects, Grants or EmbeddingVectors match `children`: rows are upserted on
+    (faculty_id, key_column), or on key_column if it is the primary key, and rows whose key is no longer
+    listed are deleted, so unchanged rows are not rewritten.
+    :param model: Project, Grant or EmbeddingVector
+    :param faculty_id: Faculty primary key
+    :param children: transient model objects holding the new data
+    :param key_column: column identifying a child of the faculty member
+    """
+    key_is_primary = model.__table__.c[key_column].primary_key
+    columns = [
+        column.key for column in model.__table__.columns
+        if (column.key == key_column or not column.primary_key) and column.key != "faculty_id"
+    ]
+    rows = {
+        getattr(child, key_column): {"faculty_id": faculty_id, **{column: getattr(child, column) for column in columns}}
+        for child in children
+    }
+    key = getattr(model, key_column)
+    db.session.execute(
+        delete(model)
+        .where(model.faculty_id == faculty_id, key.not_in(list(rows)))
+        .execution_options(synchronize_session=False)
+    )
+    _upsert_rows(model, list(rows.values()), [key_column] if key_is_primary else ["faculty_id", key_column])
+
+
+def _name_ids(model: typing.Type, names: typing.Iterable[str]) -> typing.Dict[str, int]:
+    """
+    Primary keys of the School or Department rows with the given names, inserting the missing rows
+    without committing.
+    :param model: School or Department
+    :param names: names to look up
+    :return: mapping of name to primary key
+    """
+    names = set(names)
+    if not names:
+        return {}
+    primary_key = model.__table__.primary_key.columns[0]
+    ids = {}
+    for batch in _chunks(sorted(names), DEFAULT_BATCH_SIZE):
+        ids.update(db.session.execute(select(model.name, primary_key).where(model.name.in_(batch))).all())
+    missing = names - set(ids)
+    if missing:
+        db.session.execute(insert(model), [{"name": name} for name in sorted(missing)])
+        for batch in _chunks(sorted(missing), DEFAULT_BATCH_SIZE):
+            ids.update(db.session.execute(select(model.name, primary_key).where(model.name.in_(batch))).all())
+    return ids
+
+
+def _sync_affiliations(affiliations: typing.Dict[int, typing.Tuple[typing.Iterable[str], typing.Iterable[str]]]) -> int:
+    """
+    Set the schools and departments of Faculty records, without committing. Association rows that are
+    already present are kept, missing ones are inserted and the others are deleted.
+    :param affiliations: mapping of faculty_id to (school names, department names)
+    :return: number of Faculty records whose affiliations changed
+    """
+    from backend.models.models import School, Department, faculty_schools, faculty_departments
+    changed = set()
+    for position, model, association, key in ((0, School, faculty_schools, "school_id"),
+                                              (1, Department, faculty_departments, "department_id")):
+        ids = _name_ids(model, {name for names in affiliations.values() for name in names[position]})
+        wanted = {
+            (faculty_id, ids[name]) for faculty_id, names in affiliations.items() for name in names[position]
+        }
+        current = set()
+        for batch in _chunks(list(affiliations), DEFAULT_BATCH_SIZE):
+            current.update(
+                tuple(row) for row in db.session.execute(
+                    select(association.c.faculty_id, association.c[key]).where(association.c.faculty_id.in_(batch))
+                )
+            )
+        for batch in _chunks(list(current - wanted), DEFAULT_BATCH_SIZE):
+            db.session.execute(delete(association).where(
+                tuple_(association.c.faculty_id, association.c[key]).in_(batch)
+            ))
+        missing = wanted - current
+        if missing:
+            db.session.execute(insert(association), [{"faculty_id": faculty_id, key: id_} for faculty_id, id_ in missing])
+        changed.update(faculty_id for faculty_id, _ in current ^ wanted)
+    return len(changed)
+
+
+def _affiliation_names(faculty_ids: typing.Iterable[int]) -> typing.Dict[int, typing.Tuple[typing.List[str], typing.List[str]]]:
+    """
+    :param faculty_ids: Faculty primary keys
+    :return: mapping of faculty_id to its sorted (school names, department names)
+    """
+    from backend.models.models import School, Department, faculty_schools, faculty_departments
+    names = {faculty_id: ([], []) for faculty_id in faculty_ids}
+    for position, model, association, key in ((0, School, faculty_schools, "school_id"),
+                                              (1, Department, faculty_departments, "department_id")):
+        for batch in _chunks(list(names), DEFAULT_BATCH_SIZE):
+            rows = db.session.execute(
+                select(association.c.faculty_id, model.name)
+                .join(model, model.__table__.c[key] == association.c[key])
+                .where(association.c.faculty_id.in_(batch))
+                .order_by(model.name)
+            )
+            for faculty_id, name in rows:
+                names[faculty_id][position].append(name)
+    return names
+
+
+def _filter_by_affiliation(query, school: str = None, department: str = None):
+    """
+    Restrict a Faculty query to a school and a department, by equality on their names joined through
+    the association tables.
+    """
+    from backend.models.models import Faculty, School, Department
+    if school:
+        query = query.join(Faculty.schools).filter(School.name == school)
+    if department:
+        query = query.join(Faculty.departments).filter(Department.name == department)
+    return query
+
+
 class DatabaseDriver:
     def __init__(self, app):
         self.app = app
@@ -40,9 +284,201 @@ class DatabaseDriver:
         """Helper function to add faculty to the database."""
         logger.info(f"Creating faculty record for {faculty.name}.")
         db.session.add(faculty)
+        db.session.flush()
+        _sync_affiliations({faculty.faculty_id: ([faculty.school], [faculty.department])})
         db.session.commit()
         logger.info(f"Faculty record created successfully for {faculty.name}.")
 
+    def add_faculty_batch(self, faculty_list: typing.List["Faculty"], batch_size: int = DEFAULT_BATCH_SIZE):
+        """
+        Persist Faculty objects, with their Projects and Grants, in a single transaction. Each record is
+        listed under its own school and department until update_faculty_affiliations merges them.
+        :param faculty_list: List of Faculty objects.
+        :param batch_size: number of Faculty objects flushed to the database at a time.
+        """
+        try:
+            with self._app_context():
+                self._add_faculty_batch(faculty_list, batch_size)
+        except Exception as e:
+            logger.error(f"Failed to create {len(faculty_list)} faculty records: {e}", exc_info=True)
+            raise
+
+    @staticmethod
+    def _add_faculty_batch(faculty_list: typing.List["Faculty"], batch_size: int):
+        """Helper function to add faculty to the database in batches."""
+        if not faculty_list:
+            return
+
+        try:
+            for batch in _chunks(faculty_list, batch_size):
+                db.session.add_all(batch)
+                db.session.flush()
+                _sync_affiliations({faculty.faculty_id: ([faculty.school], [faculty.department]) for faculty in batch})
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        logger.info(f"Created {len(faculty_list)} faculty records.")
+
+    def update_faculty(self, faculty_id: int, faculty: "Faculty"):
+        """
+        Overwrite an existing Faculty record with a freshly aggregated one. Its Projects and Grants are
+        upserted and those no longer listed are deleted; unchanged children are not rewritten.
+        :param faculty_id: Faculty primary key of the record to overwrite.
+        :param faculty: transient Faculty object holding the new data.
+        """
+        try:
+            with self._app_context():
+                self._update_faculty(faculty_id, faculty)
+        except Exception as e:
+            logger.error(f"Failed to update faculty record for {faculty.name}: {e}", exc_info=True)
+            raise
+
+    @staticmethod
+    def _update_faculty(faculty_id: int, faculty: "Faculty"):
+        """Helper function to update a faculty record in place."""
+        from backend.models.models import Faculty, Project, Grant, EmbeddingVector, FacultySearchDocument
+        existing = db.session.get(Faculty, faculty_id)
+        if not existing:
+            raise RuntimeError(f"No faculty record found with faculty_id {faculty_id}")
+        for column in ("name", "school", "department", "about", "email", "profile_url",
+                       "has_funding", "embedding_id", "fingerprint"):
+            setattr(existing, column, getattr(faculty, column))
+        try:
+            db.session.flush()
+            # Results are hydrated from the records until sync_search_documents writes a new document
+            db.session.execute(delete(FacultySearchDocument).where(FacultySearchDocument.faculty_id == faculty_id))
+            _sync_children(Project, faculty_id, faculty.projects, "project_number")
+            _sync_children(Grant, faculty_id, faculty.grants, "nsf_id")
+            _sync_children(EmbeddingVector, faculty_id, faculty.vectors, "vector_id")
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        logger.info(f"Faculty record updated successfully for {faculty.name}.")
+
+    def get_faculty_fingerprints(self, schools: typing.List[str]) -> typing.Dict[typing.Tuple[str, str], typing.Tuple[int, str, int]]:
+        """
+        Retrieve fingerprints of Faculty records belonging to any of the specified schools.
+        :param schools: List of school acronyms.
+        :return: mapping of (name, email) to (faculty_id, fingerprint, embedding_id)
+        """
+        try:
+            with self.app.app_context():
+                return self._get_faculty_fingerprints(schools)
+        except Exception as e:
+            logger.error(f"Failed to retrieve faculty fingerprints for schools {schools}: {e}")
+            raise
+
+    @staticmethod
+    def _get_faculty_fingerprints(schools: typing.List[str]) -> typing.Dict[typing.Tuple[str, str], typing.Tuple[int, str, int]]:
+        """Helper function to query faculty fingerprints for selected schools."""
+        from backend.models.models import Faculty, School
+        if not schools:
+            return {}
+
+        rows = db.session.query(
+            Faculty.faculty_id, Faculty.name, Faculty.email, Faculty.fingerprint, Faculty.embedding_id
+        ).join(Faculty.schools).filter(School.name.in_(schools)).distinct().all()
+        return {(row.name, row.email): (row.faculty_id, row.fingerprint, row.embedding_id) for row in rows}
+
+    def get_faculty_affiliations(self, faculty_ids: typing.List[int]) -> typing.Dict[int, typing.Tuple[typing.List[str], typing.List[str]]]:
+        """
+        Retrieve the schools and departments Faculty records are listed under.
+        :param faculty_ids: Faculty primary keys
+        :return: mapping of faculty_id to its sorted (school names, department names)
+        """
+        try:
+            with self.app.app_context():
+                return _affiliation_names(faculty_ids)
+        except Exception as e:
+            logger.error(f"Failed to retrieve affiliations of {len(faculty_ids)} faculty records: {e}")
+            raise
+
+    def update_faculty_affiliations(self, affiliations: typing.Dict[typing.Tuple[str, str], typing.Tuple[typing.Iterable[str], typing.Iterable[str]]]):
+        """
+        Set the schools and departments of Faculty records, matched on (name, email).
+        Records whose affiliations are already up to date are left untouched.
+        :param affiliations: mapping of (name, email) to (school names, department names)
+        """
+        try:
+            with self.app.app_context():
+                self._update_faculty_affiliations(affiliations)
+        except Exception as e:
+            logger.error(f"Failed to update faculty affiliations: {e}")
+            raise
+
+    @staticmethod
+    def _update_faculty_affiliations(affiliations: typing.Dict[typing.Tuple[str, str], typing.Tuple[typing.Iterable[str], typing.Iterable[str]]]):
+        """Helper function to update faculty schools and departments."""
+        from backend.models.models import Faculty
+        if not affiliations:
+            return
+
+        names = list({name for name, _ in affiliations})
+        faculty_affiliations = {}
+        for batch in _chunks(names, DEFAULT_BATCH_SIZE):
+            rows = db.session.query(Faculty.faculty_id, Faculty.name, Faculty.email).filter(Faculty.name.in_(batch))
+            for row in rows:
+                affiliation = affiliations.get((row.name, row.email))
+                if affiliation:
+                    faculty_affiliations[row.faculty_id] = affiliation
+        try:
+            updated = _sync_affiliations(faculty_affiliations)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        logger.info(f"Updated affiliations for {updated} faculty records.")
+
+    def delete_faculty_by_ids(self, faculty_ids: typing.List[int]):
+        """
+        Delete Faculty records, and their Projects and Grants, by primary key.
+        :param faculty_ids: List of Faculty primary keys.
+        """
+        try:
+            with self.app.app_context():
+                self._delete_faculty_by_ids(faculty_ids)
+        except Exception as e:
+            logger.error(f"Failed to delete faculty records {faculty_ids}: {e}")
+            raise
+
+    @staticmethod
+    def _delete_faculty_by_ids(faculty_ids: typing.List[int]):
+        """Helper function to delete faculty records by primary key."""
+        if not faculty_ids:
+            return
+
+        try:
+            deleted = DatabaseDriver._delete_faculty_rows(list(faculty_ids))
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        logger.info(f"Deleted {deleted} faculty records.")
+
+    @staticmethod
+    def _delete_faculty_rows(faculty_ids: typing.List[int], batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+        """
+        Set-based delete of Faculty rows and their Projects, Grants, EmbeddingVectors, affiliations and
+        search documents, without loading them into the session. The caller commits.
+        :return: number of Faculty rows deleted
+        """
+        from backend.models.models import (
+            Faculty, Project, Grant, EmbeddingVector, FacultySearchDocument, faculty_schools, faculty_departments
+        )
+        deleted = 0
+        for batch in _chunks(faculty_ids, batch_size):
+            db.session.execute(delete(FacultySearchDocument).where(FacultySearchDocument.faculty_id.in_(batch)))
+            db.session.execute(delete(faculty_schools).where(faculty_schools.c.faculty_id.in_(batch)))
+            db.session.execute(delete(faculty_departments).where(faculty_departments.c.faculty_id.in_(batch)))
+            db.session.execute(delete(Project).where(Project.faculty_id.in_(batch)))
+            db.session.execute(delete(Grant).where(Grant.faculty_id.in_(batch)))
+            db.session.execute(delete(EmbeddingVector).where(EmbeddingVector.faculty_id.in_(batch)))
+            deleted += db.session.execute(delete(Faculty).where(Faculty.faculty_id.in_(batch))).rowcount
+        db.session.expire_all()
+        return deleted
+
     def get_faculty_by_embedding_id(self, embedding_id: int) -> "Faculty":
         """
         Retrieve a single Faculty object by corresponding embedding ID.
@@ -67,6 +503,128 @@ class DatabaseDriver:
             logger.warning(f"No faculty record found with embedding_id {embedding_id}.")
         return faculty
 
+    def get_faculty_by_embedding_ids(self, embedding_ids: typing.List[int], attributes: typing.Iterable[str]) -> typing.Dict[int, "Faculty"]:
+        """
+        Retrieve Faculty objects by embedding ID, loading only the given attributes. Columns not listed
+        are not selected, and relationships not listed are not loaded and raise if accessed.
+        :param embedding_ids: List of embedding IDs.
+        :param attributes: names of the Faculty columns and relationships to load
+        :return: mapping of embedding ID to detached Faculty object; IDs without a record are left out
+        """
+        try:
+            with self.app.app_context():
+                return self._get_faculty_by_embedding_ids(embedding_ids, attributes)
+        except Exception as e:
+            logger.error(f"Failed to retrieve faculty records for {len(embedding_ids)} embedding IDs: {e}")
+            raise
+
+    @staticmethod
+    def _get_faculty_by_embedding_ids(embedding_ids: typing.List[int], attributes: typing.Iterable[str]) -> typing.Dict[int, "Faculty"]:
+        """Helper function to query faculty attributes by embedding ID."""
+        from backend.models.models import Faculty
+        attributes = set(attributes) | {"embedding_id"}
+        mapper = inspect(Faculty)
+        options = [load_only(*[getattr(Faculty, name) for name in mapper.column_attrs.keys() if name in attributes])]
+        for relationship in mapper.relationships:
+            attribute = getattr(Faculty, relationship.key)
+            options.append(selectinload(attribute) if relationship.key in attributes else raiseload(attribute))
+
+        faculty = {}
+        for batch in _chunks(list(embedding_ids), DEFAULT_BATCH_SIZE):
+            for record in Faculty.query.options(*options).filter(Faculty.embedding_id.in_(batch)):
+                faculty.setdefault(record.embedding_id, record)
+        return faculty
+
+    def get_search_documents(self, embedding_ids: typing.List[int]) -> typing.Dict[int, str]:
+        """
+        Get the precomputed search result JSON of Faculty records by embedding ID, without loading
+        the records themselves.
+        :param embedding_ids: List of embedding IDs.
+        :return: mapping of embedding ID to JSON text; IDs without a document are left out
+        """
+        try:
+            with self.app.app_context():
+                return self._get_search_documents(embedding_ids)
+        except Exception as e:
+            logger.error(f"Failed to retrieve search documents for {len(embedding_ids)} embedding IDs: {e}")
+            raise
+
+    @staticmethod
+    def _get_search_documents(embedding_ids: typing.List[int]) -> typing.Dict[int, str]:
+        """Helper function to query search documents by embedding ID."""
+        from backend.models.models import FacultySearchDocument
+        documents = {}
+        for batch in _chunks(list(embedding_ids), DEFAULT_BATCH_SIZE):
+            documents.update(db.session.execute(
+                select(FacultySearchDocument.embedding_id, FacultySearchDocument.document)
+                .where(FacultySearchDocument.embedding_id.in_(batch))
+            ).all())
+        return documents
+
+    def sync_search_documents(self, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+        """
+        Recompute the search result JSON of every Faculty record and write the documents that changed.
+        Documents of deleted records and of embedding IDs no longer used are removed.
+        :param batch_size: number of Faculty records loaded at a time
+        :return: number of documents written
+        """
+        try:
+            with self.app.app_context():
+                return self._sync_search_documents(batch_size)
+        except Exception as e:
+            logger.error(f"Failed to sync search documents: {e}")
+            raise
+
+    @staticmethod
+    def _sync_search_documents(batch_size: int) -> int:
+        """Helper function to rewrite changed search documents."""
+        from backend.models.models import Faculty, FacultySearchDocument
+        from backend.utils.serialization_utils import faculty_search_document
+        total = 0
+        written = 0
+        last_faculty_id = None
+        try:
+            while True:
+                batch = DatabaseDriver._get_faculty_page(last_faculty_id, batch_size)
+                if not batch:
+                    break
+                last_faculty_id = batch[-1].faculty_id
+                # Records not embedded yet hold a placeholder ID
+                batch = [faculty for faculty in batch if faculty.embedding_id is not None and faculty.embedding_id >= 0]
+                existing = dict(db.session.execute(
+                    select(FacultySearchDocument.embedding_id, FacultySearchDocument.document)
+                    .where(FacultySearchDocument.embedding_id.in_([faculty.embedding_id for faculty in batch]))
+                ).all())
+                owners = {}
+                rows = []
+                for faculty in batch:
+                    if faculty.embedding_id in owners:
+                        logger.warning(f"Embedding ID {faculty.embedding_id} is held by more than one faculty record; "
+                                       f"keeping the search document of faculty {owners[faculty.embedding_id]}.")
+                        continue
+                    owners[faculty.embedding_id] = faculty.faculty_id
+                    document = faculty_search_document(faculty)
+                    if existing.get(faculty.embedding_id) != document:
+                        rows.append({
+                            "embedding_id": faculty.embedding_id,
+                            "faculty_id": faculty.faculty_id,
+                            "document": document,
+                        })
+                _upsert_rows(FacultySearchDocument, rows, ["embedding_id"])
+                total += len(owners)
+                written += len(rows)
+                db.session.expunge_all()
+
+            db.session.execute(delete(FacultySearchDocument).where(FacultySearchDocument.embedding_id.not_in(
+                select(Faculty.embedding_id).where(Faculty.embedding_id >= 0)
+            )))
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        logger.info(f"Wrote {written} of {total} search documents.")
+        return written
+
     def get_embedding_ids_by_search_parameters(self, **parameters) -> typing.List[int]:
         """
         Get Faculty embedding IDs that satisfy search parameters.
@@ -83,23 +641,149 @@ class DatabaseDriver:
             logger.error(f"Failed to retrieve faculty record by filters: {e}")
             raise
 
-    def get_all_faculty(self) -> typing.List["Faculty"]:
+    def get_award_vector_ids(self, activity_code: str = None, agency_ic_admin: str = None) -> typing.List[int]:
         """
-        Retrieve all Faculty records with associated Projects.
-        :return: List of Faculty objects.
+        Get the vector IDs of the NIH projects that satisfy search parameters.
+        :param activity_code: Activity code
+        :param agency_ic_admin: Agency IC admin
+        :return: List of project vector IDs
+        """
+        try:
+            with self.app.app_context():
+                return self._get_award_vector_ids(activity_code, agency_ic_admin)
+        except Exception as e:
+            logger.error(f"Failed to retrieve project vectors by filters: {e}")
+            raise
+
+    @staticmethod
+    def _get_award_vector_ids(activity_code: str = None, agency_ic_admin: str = None) -> typing.List[int]:
+        """Helper function to query project vector IDs by project metadata."""
+        from backend.models.models import Project, EmbeddingVector
+        query = db.session.query(EmbeddingVector.vector_id).join(Project, and_(
+            EmbeddingVector.kind == "project",
+            Project.faculty_id == EmbeddingVector.faculty_id,
+            Project.project_number == EmbeddingVector.source_key,
+        ))
+        if activity_code:
+            query = query.filter(Project.activity_code == activity_code)
+        if agency_ic_admin:
+            query = query.filter(Project.agency_ic_admin == agency_ic_admin)
+        return [record.vector_id for record in query.all()]
+
+    def get_awards_by_vector_ids(self, vector_ids: typing.List[int]) -> typing.Dict[int, typing.Tuple[str, typing.Union["Project", "Grant"], FacultySummary]]:
+        """
+        Get the Project or Grant behind each project or grant vector, with its Faculty, in one query,
+        plus one query each for the schools and departments of the Faculty.
+        :param vector_ids: List of vector IDs.
+        :return: mapping of vector ID to (kind, Project or Grant, FacultySummary); IDs of profile
+            vectors or without a record are left out
         """
         try:
             with self.app.app_context():
-                return self._get_all_faculty()
+                return self._get_awards_by_vector_ids(vector_ids)
         except Exception as e:
-            logger.error(f"Failed to retrieve faculty records: {e}")
+            logger.error(f"Failed to retrieve projects for {len(vector_ids)} vectors: {e}")
             raise
 
     @staticmethod
-    def _get_all_faculty() -> typing.List["Faculty"]:
-        """Helper function to query all faculty records."""
+    def _get_awards_by_vector_ids(vector_ids: typing.List[int]) -> typing.Dict[int, typing.Tuple[str, typing.Union["Project", "Grant"], FacultySummary]]:
+        """Helper function to query projects, grants and faculty by vector ID."""
+        from backend.models.models import Faculty, Project, Grant, EmbeddingVector
+        if not vector_ids:
+            return {}
+
+        rows = db.session.query(
+            EmbeddingVector.vector_id, EmbeddingVector.kind, Project, Grant,
+            Faculty.faculty_id, Faculty.name, Faculty.school, Faculty.email, Faculty.profile_url,
+        ).join(
+            Faculty, Faculty.faculty_id == EmbeddingVector.faculty_id
+        ).outerjoin(Project, and_(
+            EmbeddingVector.kind == "project",
+            Project.faculty_id == EmbeddingVector.faculty_id,
+            Project.project_number == EmbeddingVector.source_key,
+        )).outerjoin(Grant, and_(
+            EmbeddingVector.kind == "grant",
+            Grant.faculty_id == EmbeddingVector.faculty_id,
+            Grant.nsf_id == EmbeddingVector.source_key,
+        )).filter(EmbeddingVector.vector_id.in_(list(vector_ids))).all()
+
+        rows = [row for row in rows if row.Project is not None or row.Grant is not None]
+        affiliations = _affiliation_names({row.faculty_id for row in rows})
+        return {
+            row.vector_id: (row.kind, row.Project or row.Grant, FacultySummary(
+                row.faculty_id, row.name, row.school, *affiliations[row.faculty_id], row.email, row.profile_url
+            ))
+            for row in rows
+        }
+
+    def get_lexical_documents(self) -> typing.List[typing.Tuple[int, str]]:
+        """
+        Retrieve the text searched lexically for every Faculty record: its about text and the
+        abstracts and terms of its projects, without loading ORM objects.
+        :return: list of (embedding_id, text)
+        """
+        try:
+            with self.app.app_context():
+                return self._get_lexical_documents()
+        except Exception as e:
+            logger.error(f"Failed to retrieve lexical search documents: {e}")
+            raise
+
+    @staticmethod
+    def _get_lexical_documents() -> typing.List[typing.Tuple[int, str]]:
+        """Helper function to query faculty and project text by embedding ID."""
+        from backend.models.models import Faculty, Project
+        texts = {
+            row.embedding_id: [row.about or ""]
+            for row in db.session.query(Faculty.embedding_id, Faculty.about)
+        }
+        project_rows = db.session.query(Faculty.embedding_id, Project.abstract, Project.relevant_terms).join(
+            Project, Project.faculty_id == Faculty.faculty_id
+        )
+        for row in project_rows:
+            texts[row.embedding_id].extend((row.abstract or "", row.relevant_terms or ""))
+        return [(embedding_id, "\n".join(parts)) for embedding_id, parts in texts.items()]
+
+    def get_all_faculty(self) -> typing.List["Faculty"]:
+        """
+        Retrieve all Faculty records with associated Projects and Grants. Prefer iter_all_faculty,
+        which does not hold every record in memory at once.
+        :return: List of Faculty objects.
+        """
+        return list(self.iter_all_faculty())
+
+    def iter_all_faculty(self, batch_size: int = DEFAULT_BATCH_SIZE) -> typing.Iterator["Faculty"]:
+        """
+        Stream all Faculty records, by faculty_id, with their Projects, Grants, schools and departments.
+        Records are read a page at a time by keyset pagination and each child collection of a page is
+        loaded by one query, so memory use is bounded by `batch_size` however many records there are.
+        Each page is read in its own app context, and the records yielded are detached from the session.
+        :param batch_size: number of Faculty records per page.
+        :return: iterator of Faculty objects.
+        """
+        last_faculty_id = None
+        while True:
+            try:
+                with self.app.app_context():
+                    page = self._get_faculty_page(last_faculty_id, batch_size)
+            except Exception as e:
+                logger.error(f"Failed to retrieve faculty records after faculty_id {last_faculty_id}: {e}")
+                raise
+            yield from page
+            if len(page) < batch_size:
+                return
+            last_faculty_id = page[-1].faculty_id
+
+    @staticmethod
+    def _get_faculty_page(after_faculty_id: typing.Optional[int], batch_size: int) -> typing.List["Faculty"]:
+        """Helper function to query the next page of faculty records, with their children, by faculty_id."""
         from backend.models.models import Faculty
-        return Faculty.query.options(joinedload(Faculty.projects)).all()
+        query = Faculty.query.options(
+            selectinload(Faculty.projects), selectinload(Faculty.grants)
+        ).order_by(Faculty.faculty_id)
+        if after_faculty_id is not None:
+            query = query.filter(Faculty.faculty_id > after_faculty_id)
+        return query.limit(batch_size).all()
 
     def update_faculty_embedding_id(self, faculty_id: int, embedding_id: int):
         """
@@ -124,6 +808,259 @@ class DatabaseDriver:
         faculty.embedding_id = embedding_id
         db.session.commit()
 
+    def update_faculty_embedding_ids(self, embedding_ids: typing.Dict[int, int], batch_size: int = DEFAULT_BATCH_SIZE):
+        """
+        Update the embedding IDs of many Faculty records in a single transaction.
+        :param embedding_ids: mapping of Faculty primary key to new embedding ID.
+        :param batch_size: number of rows updated per statement.
+        """
+        try:
+            with self.app.app_context():
+                self._update_faculty_embedding_ids(embedding_ids, batch_size)
+        except Exception as e:
+            logger.error(f"Failed to update embedding_ids for {len(embedding_ids)} faculty records: {e}")
+            raise
+
+    @staticmethod
+    def _update_faculty_embedding_ids(embedding_ids: typing.Dict[int, int], batch_size: int):
+        """Helper function to bulk update faculty embedding IDs by primary key."""
+        from backend.models.models import Faculty
+        if not embedding_ids:
+            return
+
+        rows = [
+            {"faculty_id": faculty_id, "embedding_id": embedding_id}
+            for faculty_id, embedding_id in embedding_ids.items()
+        ]
+        try:
+            for batch in _chunks(rows, batch_size):
+                db.session.execute(update(Faculty), batch)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        logger.info(f"Updated embedding_ids for {len(rows)} faculty records.")
+
+    def get_vector_owners(self) -> typing.List[typing.Tuple[int, int]]:
+        """
+        Retrieve the owner of every project and grant vector in the FAISS index.
+        :return: list of (vector_id, owner embedding_id) rows, the owner being the Faculty's profile vector
+        """
+        try:
+            with self.app.app_context():
+                return self._get_vector_owners()
+        except Exception as e:
+            logger.error(f"Failed to retrieve embedding vector owners: {e}")
+            raise
+
+    @staticmethod
+    def _get_vector_owners() -> typing.List[typing.Tuple[int, int]]:
+        """Helper function to query vector owners."""
+        from backend.models.models import Faculty, EmbeddingVector
+        rows = db.session.query(EmbeddingVector.vector_id, Faculty.embedding_id).join(
+            Faculty, Faculty.faculty_id == EmbeddingVector.faculty_id
+        ).filter(EmbeddingVector.vector_id != Faculty.embedding_id).all()
+        return [tuple(row) for row in rows]
+
+    def get_embedding_vectors(self, faculty_ids: typing.List[int]) -> typing.Dict[int, typing.Dict[typing.Tuple[str, str], typing.Tuple[int, str]]]:
+        """
+        Retrieve the stored vectors of Faculty records.
+        :param faculty_ids: List of Faculty primary keys.
+        :return: mapping of faculty_id to a mapping of (kind, source_key) to (vector_id, text_hash)
+        """
+        try:
+            with self.app.app_context():
+                return self._get_embedding_vectors(faculty_ids)
+        except Exception as e:
+            logger.error(f"Failed to retrieve embedding vectors for {len(faculty_ids)} faculty records: {e}")
+            raise
+
+    @staticmethod
+    def _get_embedding_vectors(faculty_ids: typing.List[int]) -> typing.Dict[int, typing.Dict[typing.Tuple[str, str], typing.Tuple[int, str]]]:
+        """Helper function to query embedding vectors by faculty."""
+        from backend.models.models import EmbeddingVector
+        vectors = {}
+        for batch in _chunks(list(faculty_ids), DEFAULT_BATCH_SIZE):
+            rows = db.session.query(
+                EmbeddingVector.faculty_id, EmbeddingVector.kind, EmbeddingVector.source_key,
+                EmbeddingVector.vector_id, EmbeddingVector.text_hash,
+            ).filter(EmbeddingVector.faculty_id.in_(batch))
+            for row in rows:
+                vectors.setdefault(row.faculty_id, {})[(row.kind, row.source_key)] = (row.vector_id, row.text_hash)
+        return vectors
+
+    def replace_embedding_vectors(self, vectors: typing.Dict[int, typing.List["EmbeddingVector"]], batch_size: int = DEFAULT_BATCH_SIZE):
+        """
+        Replace the stored vectors of Faculty records in a single transaction.
+        :param vectors: mapping of Faculty primary key to transient EmbeddingVector objects.
+        :param batch_size: number of rows deleted or inserted per statement.
+        """
+        try:
+            with self.app.app_context():
+                self._replace_embedding_vectors(vectors, batch_size)
+        except Exception as e:
+            logger.error(f"Failed to replace embedding vectors for {len(vectors)} faculty records: {e}")
+            raise
+
+    @staticmethod
+    def _replace_embedding_vectors(vectors: typing.Dict[int, typing.List["EmbeddingVector"]], batch_size: int):
+        """Helper function to delete and insert embedding vectors by faculty."""
+        from backend.models.models import EmbeddingVector
+        if not vectors:
+            return
+
+        rows = [
+            {
+                "vector_id": vector.vector_id,
+                "faculty_id": faculty_id,
+                "kind": vector.kind,
+                "source_key": vector.source_key,
+                "text_hash": vector.text_hash,
+            }
+            for faculty_id, faculty_vectors in vectors.items()
+            for vector in faculty_vectors
+        ]
+        try:
+            for batch in _chunks(list(vectors), batch_size):
+                db.session.execute(delete(EmbeddingVector).where(EmbeddingVector.faculty_id.in_(batch)))
+            for batch in _chunks(rows, batch_size):
+                db.session.execute(insert(EmbeddingVector), batch)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        logger.info(f"Replaced embedding vectors of {len(vectors)} faculty records.")
+
+    def clear_embedding_vectors(self):
+        """
+        Delete every EmbeddingVector row, e.g. before the FAISS index is rebuilt.
+        """
+        try:
+            with self.app.app_context():
+                self._clear_embedding_vectors()
+        except Exception as e:
+            logger.error(f"Failed to clear embedding vectors: {e}")
+            raise
+
+    @staticmethod
+    def _clear_embedding_vectors():
+        """Helper function to delete all embedding vectors."""
+        from backend.models.models import EmbeddingVector
+        try:
+            db.session.execute(delete(EmbeddingVector))
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        logger.info("All embedding vectors deleted.")
+
+    def reset_faculty_embedding_ids(self):
+        """
+        Set the embedding ID of every Faculty record to the -1 placeholder and delete the search documents
+        keyed by the old IDs, e.g. when the FAISS index is deleted and vector IDs start again from 0.
+        """
+        try:
+            with self.app.app_context():
+                self._reset_faculty_embedding_ids()
+        except Exception as e:
+            logger.error(f"Failed to reset faculty embedding IDs: {e}")
+            raise
+
+    @staticmethod
+    def _reset_faculty_embedding_ids():
+        """Helper function to reset all faculty embedding IDs."""
+        from backend.models.models import Faculty, FacultySearchDocument
+        try:
+            reset = db.session.execute(update(Faculty).values(embedding_id=-1)).rowcount
+            db.session.execute(delete(FacultySearchDocument))
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        logger.info(f"Reset the embedding IDs of {reset} faculty records.")
+
+    def get_faculty_names(self) -> typing.List[FacultyName]:
+        """
+        Retrieve the name and schools of every Faculty record, without loading relationships.
+        :return: list of FacultyName, by faculty_id
+        """
+        try:
+            with self.app.app_context():
+                return self._get_faculty_names()
+        except Exception as e:
+            logger.error(f"Failed to retrieve faculty names: {e}")
+            raise
+
+    @staticmethod
+    def _get_faculty_names() -> typing.List[FacultyName]:
+        """Helper function to query faculty names and schools."""
+        from backend.models.models import Faculty
+        rows = db.session.query(Faculty.faculty_id, Faculty.name).order_by(Faculty.faculty_id).all()
+        affiliations = _affiliation_names(row.faculty_id for row in rows)
+        return [FacultyName(row.faculty_id, row.name, affiliations[row.faculty_id][0]) for row in rows]
+
+    def upsert_grants(self, grants: typing.List[typing.Dict], batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+        """
+        Insert Grants, or update the existing Grant with the same (faculty_id, nsf_id), committing per batch.
+        Rerunning with the same grants therefore changes nothing.
+        :param grants: Grant column values; each dictionary holds faculty_id, nsf_id, date, start_date and title.
+        :param batch_size: number of grants written and committed at a time.
+        :return: number of grants written
+        """
+        try:
+            with self.app.app_context():
+                return self._upsert_grants(grants, batch_size)
+        except Exception as e:
+            logger.error(f"Failed to upsert {len(grants)} grants: {e}")
+            raise
+
+    @staticmethod
+    def _upsert_grants(grants: typing.List[typing.Dict], batch_size: int) -> int:
+        """Helper function to upsert grants keyed on (faculty_id, nsf_id)."""
+        from backend.models.models import Grant
+        # Later duplicates of a key win, as they would with one statement per grant
+        unique_grants = list({(grant["faculty_id"], grant["nsf_id"]): grant for grant in grants}.values())
+        for batch in _chunks(unique_grants, batch_size):
+            try:
+                _upsert_rows(Grant, batch, ["faculty_id", "nsf_id"])
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                raise
+        logger.info(f"Upserted {len(unique_grants)} grants.")
+        return len(unique_grants)
+
+    def update_has_funding_from_grants(self) -> int:
+        """
+        Set has_funding on every Faculty record that has at least one Grant. Other records are left unchanged.
+        :return: number of records updated
+        """
+        try:
+            with self.app.app_context():
+                return self._update_has_funding_from_grants()
+        except Exception as e:
+            logger.error(f"Failed to update has_funding from grants: {e}")
+            raise
+
+    @staticmethod
+    def _update_has_funding_from_grants() -> int:
+        """Helper function to flag faculty with grants as funded in one statement."""
+        from backend.models.models import Faculty, Grant
+        try:
+            result = db.session.execute(
+                update(Faculty)
+                .where(Faculty.faculty_id.in_(select(Grant.faculty_id)))
+                .where(or_(Faculty.has_funding.is_(None), Faculty.has_funding.is_(False)))
+                .values(has_funding=True)
+                .execution_options(synchronize_session=False)
+            )
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        logger.info(f"Set has_funding for {result.rowcount} faculty records with grants.")
+        return result.rowcount
+
     def delete_faculty_by_schools(self, schools: typing.List[str]):
         """
         Delete Faculty records belonging to any of the specified schools.
@@ -139,19 +1076,22 @@ class DatabaseDriver:
     @staticmethod
     def _delete_faculty_by_schools(schools: typing.List[str]):
         """Helper function to delete faculty records for selected schools."""
-        from backend.models.models import Faculty
+        from backend.models.models import Faculty, School
         if not schools:
             return
 
-        faculty_records = Faculty.query.filter(
-            or_(*(Faculty.school.contains(school) for school in schools))
-        ).all()
-
-        for faculty in faculty_records:
-            db.session.delete(faculty)
-
-        db.session.commit()
-        logger.info(f"Deleted {len(faculty_records)} faculty records for schools: {schools}.")
+        faculty_ids = [
+            row.faculty_id for row in db.session.query(Faculty.faculty_id).join(Faculty.schools).filter(
+                School.name.in_(schools)
+            ).distinct()
+        ]
+        try:
+            deleted = DatabaseDriver._delete_faculty_rows(faculty_ids)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        logger.info(f"Deleted {deleted} faculty records for schools: {schools}.")
 
     @staticmethod
     def _get_embedding_ids_by_search_parameters(school=None,
@@ -161,12 +1101,10 @@ class DatabaseDriver:
                                                 has_funding=None) -> typing.List[int]:
         """Helper function to query faculty by embedding IDs."""
         from backend.models.models import Faculty, Project
-        query = db.session.query(Faculty.embedding_id).outerjoin(Project)
-
-        if school:
-            query = query.filter(Faculty.school.contains(school))
-        if department:
-            query = query.filter(Faculty.department.contains(department))
+        query = _filter_by_affiliation(db.session.query(Faculty.embedding_id), school, department)
+        # An inner join, and only when filtering on projects, so the planner can start from any index
+        if activity_code or agency_ic_admin:
+            query = query.join(Faculty.projects)
         if activity_code:
             query = query.filter(Project.activity_code == activity_code)
         if agency_ic_admin:
@@ -208,27 +1146,47 @@ class DatabaseDriver:
                             activity_code: str = None,
                             agency_ic_admin: str = None,
                             has_funding: bool = None) -> typing.List[int]:
-        """Helper function to search for exact words in faculty profiles."""
+        """
+        Helper function to search for exact words in faculty profiles. Uses the full-text search
+        document of each faculty member where the database has one, ranked by relevance, and
+        falls back to case-insensitive substring matching otherwise.
+        """
         from backend.models.models import Faculty, Project
-        faculty_query = db.session.query(Faculty.embedding_id).outerjoin(Faculty.projects).filter(
-            or_(
-            Faculty.about.ilike(f"%{query}%"),
-            Project.abstract.ilike(f"%{query}%"),
-            Project.relevant_terms.ilike(f"%{query}%")
+        backend = _full_text_search_backend()
+        if backend == "postgresql":
+            search_vector = literal_column("faculty.search_vector")
+            ts_query = func.websearch_to_tsquery("english", query)
+            faculty_query = db.session.query(Faculty.embedding_id).filter(
+                search_vector.op("@@")(ts_query)
+            ).order_by(func.ts_rank(search_vector, ts_query).desc())
+        elif backend == "sqlite":
+            fts_query = _websearch_to_fts5(query)
+            if fts_query is None:
+                return []
+            faculty_fts = table_clause("faculty_fts", column_clause("rowid"))
+            faculty_query = db.session.query(Faculty.embedding_id).join(
+                faculty_fts, faculty_fts.c.rowid == Faculty.faculty_id
+            ).filter(
+                text("faculty_fts MATCH :fts_query").bindparams(fts_query=fts_query)
+            ).order_by(text("bm25(faculty_fts, 2.0, 1.0)"))
+        else:
+            faculty_query = db.session.query(Faculty.embedding_id).filter(
+                or_(
+                    Faculty.about.ilike(f"%{query}%"),
+                    Faculty.projects.any(or_(
+                        Project.abstract.ilike(f"%{query}%"),
+                        Project.relevant_terms.ilike(f"%{query}%"),
+                    )),
+                )
             )
-        )
-        if school:
-            faculty_query = faculty_query.filter(Faculty.school == school)
-        if department:
-            faculty_query = faculty_query.filter(Faculty.department.contains(department))
+        faculty_query = _filter_by_affiliation(faculty_query, school, department)
         if activity_code:
             faculty_query = faculty_query.filter(Faculty.projects.any(Project.activity_code == activity_code))
         if agency_ic_admin:
             faculty_query = faculty_query.filter(Faculty.projects.any(Project.agency_ic_admin == agency_ic_admin))
         if has_funding is not None:
             faculty_query = faculty_query.filter(Faculty.has_funding == has_funding)
-        return [record.embedding_id for record in faculty_query.distinct().limit(top_k).all()]
-        
+        return [record.embedding_id for record in faculty_query.limit(top_k).all()]
 
     def clear(self):
         """
@@ -244,8 +1202,22 @@ class DatabaseDriver:
     @staticmethod
     def _clear_db():
         """Helper function to clear faculty records."""
-        from backend.models.models import Faculty, Project
-        db.session.execute(delete(Faculty))
-        db.session.execute(delete(Project))
-        db.session.commit()
+        from backend.models.models import (
+            Faculty, Project, Grant, EmbeddingVector, FacultySearchDocument, School, Department,
+            faculty_schools, faculty_departments,
+        )
+        try:
+            db.session.execute(delete(FacultySearchDocument))
+            db.session.execute(delete(faculty_schools))
+            db.session.execute(delete(faculty_departments))
+            db.session.execute(delete(School))
+            db.session.execute(delete(Department))
+            db.session.execute(delete(Project))
+            db.session.execute(delete(Grant))
+            db.session.execute(delete(EmbeddingVector))
+            db.session.execute(delete(Faculty))
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
         logger.info("All faculty records deleted.")
@@ -1,29 +1,102 @@
 import logging
+import threading
 import typing
+import collections
+import numpy as np
 from openai import OpenAI
 from backend.core.populate_config import OPENAI_CONFIG
-from backend.utils.token_utils import count_tokens, chunk_text
+from backend.utils.token_utils import count_tokens, chunk_text, truncate_to_tokens
 
 logger = logging.getLogger(__name__)
 
 class EmbeddingGenerator:
-    def __init__(self, openai_client: OpenAI):
+    def __init__(self, openai_client: OpenAI, chunked_fallback: bool = None):
+        """
+        :param openai_client: OpenAI client
+        :param chunked_fallback: embed texts over the token limit in chunks and average them, instead of
+            truncating them; defaults to OPENAI_CONFIG["CHUNKED_FALLBACK"]
+        """
         self.client = openai_client
+        self.chunked_fallback = OPENAI_CONFIG["CHUNKED_FALLBACK"] if chunked_fallback is None else chunked_fallback
+        self.metrics: collections.Counter = collections.Counter()
+        self._lock = threading.Lock()
         logger.info("Initialized EmbeddingGenerator with OpenAI client")
 
+    def _record_metric(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self.metrics[name] += value
+
+    def get_metrics(self) -> typing.Dict[str, typing.Any]:
+        """
+        Embedding counters since the generator was created.
+        texts: texts embedded; text_tokens: their total tokens; truncated_texts / chunked_texts: texts over
+        the token limit that were truncated / split; api_calls: embedding API requests
+        :return: dictionary of counters plus the average tokens per text
+        """
+        with self._lock:
+            metrics = {name: self.metrics[name] for name in ("texts", "text_tokens", "truncated_texts", "chunked_texts", "api_calls")}
+        metrics["tokens_per_text"] = round(metrics["text_tokens"] / metrics["texts"], 1) if metrics["texts"] else 0
+        return metrics
+
     def generate_embedding(self, text: str) -> typing.List[float]:
         """
         Generates an embedding for provided text using OpenAI's text-embedding-ada-002 model.
-        Handles chunking if the text exceeds the token limit.
+        Text over the token limit is truncated, or chunked if the chunked fallback is enabled.
         :param text: input text
         :return: embedding
         """
+        text, token_count = self._prepare_text(text)
+        if token_count is None:
+            return self._generate_chunked_embedding(text)
+        return self._call_embedding_api(text)
+
+    def generate_embeddings(self, texts: typing.List[str]) -> typing.List[typing.List[float]]:
+        """
+        Generates embeddings for many texts, sending up to OPENAI_CONFIG["BATCH_SIZE"] texts and
+        OPENAI_CONFIG["BATCH_MAX_TOKENS"] tokens per API request. Texts over the token limit are
+        handled as in generate_embedding.
+        :param texts: input texts
+        :return: embeddings, in the order of `texts`
+        """
+        embeddings = [None] * len(texts)
+        batch, batch_tokens = [], 0
+        for position, text in enumerate(texts):
+            text, token_count = self._prepare_text(text)
+            if token_count is None:
+                embeddings[position] = self._generate_chunked_embedding(text)
+                continue
+            if batch and (len(batch) >= OPENAI_CONFIG["BATCH_SIZE"]
+                          or batch_tokens + token_count > OPENAI_CONFIG["BATCH_MAX_TOKENS"]):
+                self._embed_batch(batch, embeddings)
+                batch, batch_tokens = [], 0
+            batch.append((position, text))
+            batch_tokens += token_count
+        if batch:
+            self._embed_batch(batch, embeddings)
+        return embeddings
+
+    def _prepare_text(self, text: str) -> typing.Tuple[str, typing.Optional[int]]:
+        """
+        Record the text in the metrics and fit it to the token limit.
+        :return: the text, truncated if needed, and its token count; None instead of the count
+            if the text is to be embedded in chunks
+        """
         token_count = count_tokens(text)
-        return (
-            self._call_embedding_api(text)
-            if token_count <= OPENAI_CONFIG["MAX_TOKENS"]
-            else self._generate_chunked_embedding(text)
-        )
+        self._record_metric("texts")
+        self._record_metric("text_tokens", token_count)
+        if token_count <= OPENAI_CONFIG["MAX_TOKENS"]:
+            return text, token_count
+        if self.chunked_fallback:
+            self._record_metric("chunked_texts")
+            return text, None
+        self._record_metric("truncated_texts")
+        logger.warning(f"Truncating text of {token_count} tokens to {OPENAI_CONFIG['MAX_TOKENS']} tokens.")
+        return truncate_to_tokens(text, OPENAI_CONFIG["MAX_TOKENS"]), OPENAI_CONFIG["MAX_TOKENS"]
+
+    def _embed_batch(self, batch: typing.List[typing.Tuple[int, str]], embeddings: typing.List):
+        """Embed (position, text) pairs in one API request and store the embeddings at their positions."""
+        for (position, _), embedding in zip(batch, self._call_embedding_api_batch([text for _, text in batch])):
+            embeddings[position] = embedding
 
     def _generate_chunked_embedding(self, text: str) -> typing.List[float]:
         """
@@ -45,12 +118,13 @@ class EmbeddingGenerator:
         """
         logging.info("Aggregating embeddings using mean pooling.")
         try:
-            return [sum(x) / len(embeddings) for x in zip(*embeddings)]
+            return np.mean(np.asarray(embeddings, dtype=np.float64), axis=0).tolist()
         except Exception as e:
             logging.error(f"Failed to aggregate embeddings: {e}")
             raise
 
     def _call_embedding_api(self, text: str) -> typing.List[float]:
+        self._record_metric("api_calls")
         try:
             response = self.client.embeddings.create(
                 input=text,
@@ -59,4 +133,16 @@ class EmbeddingGenerator:
             return response.data[0].embedding
         except Exception as e:
             logging.error(f"Error generating single embedding: {e}")
+            raise
+
+    def _call_embedding_api_batch(self, texts: typing.List[str]) -> typing.List[typing.List[float]]:
+        self._record_metric("api_calls")
+        try:
+            response = self.client.embeddings.create(
+                input=texts,
+                model=OPENAI_CONFIG["EMBEDDING_MODEL"],
+            )
+            return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+        except Exception as e:
+            logging.error(f"Error generating {len(texts)} embeddings: {e}")
             raise
\ No newline at end of file
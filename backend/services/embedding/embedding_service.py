@@ -1,15 +1,37 @@
 import typing
+import hashlib
 import logging
+from backend.core.populate_config import EMBEDDING_INDEX_CONFIG, LEXICAL_SEARCH_CONFIG
+from backend.models.records import FacultyVector
 from backend.services.embedding.preprocessor import Preprocessor
+from backend.services.embedding.profile_document_builder import ProfileDocumentBuilder
 from backend.services.embedding.embedding_generator import EmbeddingGenerator
 from backend.services.embedding.embedding_storage import EmbeddingStorage
+from backend.services.search.lexical_index import reciprocal_rank_fusion
 
 logger = logging.getLogger(__name__)
 
+SEARCH_MODES = ("vector", "lexical", "hybrid")
+
+PROFILE_VECTOR = "profile"
+PROJECT_VECTOR = "project"
+GRANT_VECTOR = "grant"
+
+
 class EmbeddingService:
     def __init__(self,
                  embedding_generator: EmbeddingGenerator = None,
-                 embedding_storage: EmbeddingStorage = None):
+                 embedding_storage: EmbeddingStorage = None,
+                 document_builder: ProfileDocumentBuilder = None,
+                 multi_vector: bool = None):
+        """
+        :param embedding_generator: embedding generator
+        :param embedding_storage: FAISS index storage
+        :param document_builder: builds the embedded texts; defaults to a ProfileDocumentBuilder whose
+            profile document holds only the about section in multi-vector mode
+        :param multi_vector: also index one vector per distinct project and grant of a faculty member;
+            defaults to EMBEDDING_INDEX_CONFIG["MULTI_VECTOR"]
+        """
 
         if not embedding_generator:
             raise TypeError('embedding_generator must be defined')
@@ -18,22 +40,143 @@ class EmbeddingService:
 
         self.embedding_generator = embedding_generator
         self.embedding_storage = embedding_storage
+        self.multi_vector = EMBEDDING_INDEX_CONFIG["MULTI_VECTOR"] if multi_vector is None else multi_vector
+        self.document_builder = document_builder or ProfileDocumentBuilder(
+            sections=("about",) if self.multi_vector else None
+        )
+
+    def generate_and_store_embedding(self,
+                                     faculty: "Faculty",
+                                     save_index: bool = True,
+                                     embedding_cache: "PopulateCheckpoint" = None) -> int:
+        """
+        Preprocess, generate, and store the vectors of a faculty member, and set faculty.vectors to their rows
+        :param faculty: transient Faculty model object containing faculty data
+        :param save_index: if False, leave the FAISS index unsaved so the caller can save once per batch
+        :param embedding_cache: optional store consulted before calling the embedding API
+        :return: Index of the faculty member's profile embedding in FAISS
+        """
+        vectors = self.generate_vectors([faculty], embedding_cache=embedding_cache)[0]
+        faculty.vectors = self.store_vectors(faculty, vectors, save_index=save_index)
+        return faculty.embedding_id
 
-    def generate_and_store_embedding(self, faculty: "Faculty") -> int:
+    def build_texts(self, faculty: "Faculty") -> typing.List[typing.Tuple[str, str, str]]:
         """
-        Preprocess, generate, and store the embedding for a faculty member
+        Texts to index for a faculty member: the profile document and, in multi-vector mode,
+        each distinct project and grant text
         :param faculty: Faculty model object containing faculty data
-        :return: Index of the generated embedding in FAISS
+        :return: (kind, source key, text) per vector, the profile first
+        """
+        texts = [(PROFILE_VECTOR, "", self.document_builder.build(faculty))]
+        if not self.multi_vector:
+            return texts
+
+        seen = set()
+        sources = [(PROJECT_VECTOR, project.project_number, self.document_builder.build_project(project))
+                   for project in faculty.projects]
+        sources += [(GRANT_VECTOR, grant.nsf_id, self.document_builder.build_grant(grant))
+                    for grant in faculty.grants]
+        for kind, source_key, text in sources:
+            if text and text not in seen:
+                seen.add(text)
+                texts.append((kind, source_key, text))
+        return texts
+
+    def generate_vectors(self,
+                         faculty_list: typing.List["Faculty"],
+                         embedding_cache: "PopulateCheckpoint" = None,
+                         existing_vectors: typing.List[typing.Dict[typing.Tuple[str, str], typing.Tuple[int, str]]] = None
+                         ) -> typing.List[typing.List[FacultyVector]]:
+        """
+        Build and embed the texts of faculty members without storing them. A text whose stored vector
+        has the same hash reuses that vector, so only new and changed projects and grants are embedded.
+        A text whose source key changed, e.g. an NIH project number that moved to the next fiscal year's
+        suffix, reuses a stored vector of the same kind and hash under its new key.
+        The remaining texts are embedded with batched API requests across the whole list.
+        :param faculty_list: Faculty model objects containing faculty data
+        :param embedding_cache: optional store with get_embedding(text)/save_embedding(text, embedding),
+            consulted before calling the embedding API
+        :param existing_vectors: per faculty member, (kind, source key) -> (vector_id, text_hash) of
+            the vectors stored for it that may be reused
+        :return: per faculty member, its vectors with the profile vector first
+        """
+        existing_vectors = existing_vectors or [{}] * len(faculty_list)
+        faculty_vectors = []
+        pending = {}
+        for faculty, existing in zip(faculty_list, existing_vectors):
+            stored_by_hash = {(kind, text_hash): vector_id for (kind, _), (vector_id, text_hash) in existing.items()}
+            vectors = []
+            for kind, source_key, text in self.build_texts(faculty):
+                vector = FacultyVector(kind, source_key, hashlib.sha256(text.encode("utf-8")).hexdigest())
+                stored = existing.get((kind, source_key))
+                if stored and stored[1] == vector.text_hash:
+                    vector.vector_id = stored[0]
+                elif (kind, vector.text_hash) in stored_by_hash:
+                    # Texts are distinct per faculty member, so no stored vector is reused twice
+                    vector.vector_id = stored_by_hash[(kind, vector.text_hash)]
+                else:
+                    vector.embedding = embedding_cache.get_embedding(text) if embedding_cache is not None else None
+                    if vector.embedding is None:
+                        pending.setdefault(text, []).append(vector)
+                vectors.append(vector)
+            faculty_vectors.append(vectors)
+
+        if pending:
+            logging.info(f"Embedding {len(pending)} texts of {len(faculty_list)} faculty.")
+            texts = list(pending)
+            try:
+                embeddings = self.embedding_generator.generate_embeddings(texts)
+            except Exception as e:
+                logging.error(f"Failed to generate embeddings for {len(faculty_list)} faculty: {e}")
+                raise
+            for text, embedding in zip(texts, embeddings):
+                if embedding_cache is not None:
+                    embedding_cache.save_embedding(text, embedding)
+                for vector in pending[text]:
+                    vector.embedding = embedding
+        return faculty_vectors
+
+    def store_vectors(self,
+                      faculty: "Faculty",
+                      vectors: typing.List[FacultyVector],
+                      save_index: bool = True) -> typing.List["EmbeddingVector"]:
+        """
+        Add the new vectors of a faculty member to the FAISS index, owned by its profile vector,
+        and set faculty.embedding_id to the profile vector
+        :param faculty: Faculty model object
+        :param vectors: vectors from generate_vectors, the profile vector first
+        :param save_index: if False, leave the FAISS index unsaved so the caller can save once per batch
+        :return: transient EmbeddingVector rows of all of the faculty member's vectors, new and reused
         """
-        logging.info(f"Starting embedding generation for faculty: {faculty.name}")
+        from backend.models.models import EmbeddingVector
         try:
-            text = Preprocessor.preprocess_faculty_profile(faculty)
-            embedding = self.embedding_generator.generate_embedding(text)
-            return self.embedding_storage.add_embedding(faculty.name, embedding)
+            profile, owned = vectors[0], vectors[1:]
+            if profile.vector_id is None:
+                profile.vector_id = self.embedding_storage.add_embeddings([profile.embedding], save_index=False)[0]
+            new_vectors = [vector for vector in owned if vector.vector_id is None]
+            new_ids = self.embedding_storage.add_embeddings(
+                [vector.embedding for vector in new_vectors], owner_id=profile.vector_id, save_index=False
+            )
+            for vector, vector_id in zip(new_vectors, new_ids):
+                vector.vector_id = vector_id
+            self.embedding_storage.set_owner([vector.vector_id for vector in owned], profile.vector_id)
+            if save_index:
+                self.embedding_storage.save_index()
         except Exception as e:
-            logging.error(f"Failed to generate and store embedding for faculty {faculty.name}: {e}")
+            logging.error(f"Failed to store embeddings for faculty {faculty.name}: {e}")
             raise
 
+        faculty.embedding_id = profile.vector_id
+        return [
+            EmbeddingVector(
+                vector_id=vector.vector_id,
+                kind=vector.kind,
+                source_key=vector.source_key,
+                text_hash=vector.text_hash,
+            )
+            for vector in vectors
+        ]
+
     def search_similar_embeddings(self,
                                   query: str = None,
                                   top_k: int = None,
@@ -42,7 +185,8 @@ class EmbeddingService:
                                   activity_code: str = None,
                                   agency_ic_admin: str = None,
                                   has_funding: bool = None,
-                                  exact_words: bool = None
+                                  exact_words: bool = None,
+                                  mode: str = "vector"
                                   ) -> typing.List[int]:
         """
         Search for the most similar faculty based on a natural language query.
@@ -53,37 +197,77 @@ class EmbeddingService:
         :param activity_code: activity code
         :param agency_ic_admin: agency ic admin name
         :param has_funding: faculty has funding
+        :param exact_words: only return faculty whose text matches the query as written, with
+            "quoted phrases", OR and -excluded terms; overrides `mode`
+        :param mode: "vector" ranks by embedding similarity, "lexical" by BM25 score, and "hybrid"
+            fuses both rankings with reciprocal rank fusion
         :return: List of faculty EIDs
         """
         if not query:
             logger.error("Invalid query input for similarity search")
             raise ValueError("Query must be a non-empty string")
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"Search mode must be one of {SEARCH_MODES}")
 
-        logging.info(f"Performing similarity search for query: '{query}'")
+        logging.info(f"Performing {mode} search for query: '{query}'")
 
         standardized_query = Preprocessor.preprocess_query(query)
-        query_embedding = self.embedding_generator.generate_embedding(standardized_query)
-        results = None
-        if not exact_words:
+        filters = dict(
+            school=school,
+            department=department,
+            activity_code=activity_code,
+            agency_ic_admin=agency_ic_admin,
+            has_funding=has_funding
+        )
+        if exact_words:
+            # The query is passed as written, since standardizing it drops the quotes of phrases
+            results = self.embedding_storage.search_exact_words(query=query.strip(), top_k=top_k, **filters)
+        elif mode == "lexical":
+            results = self.embedding_storage.search_lexical(query=standardized_query, top_k=top_k, **filters)
+        else:
+            candidates = top_k * LEXICAL_SEARCH_CONFIG["HYBRID_CANDIDATES_PER_RESULT"] if mode == "hybrid" else top_k
+            query_embedding = self.embedding_generator.generate_embedding(standardized_query)
             results = self.embedding_storage.search_similar_embeddings(
                 query_embedding=query_embedding,
-                top_k=top_k,
-                school=school,
-                department=department,
-                activity_code=activity_code,
-                agency_ic_admin=agency_ic_admin,
-                has_funding=has_funding
-            )
-        else:
-            results = self.embedding_storage.search_exact_words(
-                query=standardized_query,
-                top_k=top_k,
-                school=school,
-                department=department,
-                activity_code=activity_code,
-                agency_ic_admin=agency_ic_admin,
-                has_funding=has_funding
+                top_k=candidates,
+                **filters
             )
+            if mode == "hybrid":
+                lexical_results = self.embedding_storage.search_lexical(
+                    query=standardized_query, top_k=candidates, **filters
+                )
+                results = reciprocal_rank_fusion(
+                    [results, lexical_results], k=LEXICAL_SEARCH_CONFIG["RRF_K"]
+                )[:top_k]
 
         logging.info(f"Search completed. {len(results)} results found.")
-        return results
\ No newline at end of file
+        return results
+
+    def search_similar_awards(self,
+                              query: str = None,
+                              top_k: int = None,
+                              activity_code: str = None,
+                              agency_ic_admin: str = None) -> typing.List[typing.Tuple[int, float]]:
+        """
+        Search for the NIH projects and NSF grants most similar to a natural language query.
+        Requires the project and grant vectors of multi-vector mode.
+        :param query: user input query
+        :param top_k: Number of vectors to return
+        :param activity_code: activity code
+        :param agency_ic_admin: agency ic admin name
+        :return: (vector_id, similarity) pairs, most similar first
+        """
+        if not query:
+            logger.error("Invalid query input for project search")
+            raise ValueError("Query must be a non-empty string")
+
+        logging.info(f"Performing project search for query: '{query}'")
+        query_embedding = self.embedding_generator.generate_embedding(Preprocessor.preprocess_query(query))
+        results = self.embedding_storage.search_award_vectors(
+            query_embedding=query_embedding,
+            top_k=top_k,
+            activity_code=activity_code,
+            agency_ic_admin=agency_ic_admin,
+        )
+        logging.info(f"Project search completed. {len(results)} results found.")
+        return results
@@ -2,14 +2,38 @@ import faiss
 import logging
 import typing
 import numpy as np
-from backend.core.populate_config import OPENAI_CONFIG, INDEX_PATH
+from backend.core.populate_config import OPENAI_CONFIG, INDEX_PATH, EMBEDDING_INDEX_CONFIG, LEXICAL_SEARCH_CONFIG
+from backend.services.search.lexical_index import BM25Index
 
 logger = logging.getLogger(__name__)
 
 class EmbeddingStorage:
-    def __init__(self, database_driver: "DatabaseDriver"):
+    def __init__(self,
+                 database_driver: "DatabaseDriver",
+                 aggregation: str = None,
+                 top_n: int = None,
+                 candidates_per_result: int = None):
+        """
+        FAISS index of faculty vectors. Besides its profile vector (Faculty.embedding_id), a faculty member
+        may own project and grant vectors; searches aggregate matching vectors per owner and return
+        owner embedding IDs.
+        :param database_driver: database driver
+        :param aggregation: "max" or "sum_top_n"; defaults to EMBEDDING_INDEX_CONFIG
+        :param top_n: vectors summed per owner by "sum_top_n"; defaults to EMBEDDING_INDEX_CONFIG
+        :param candidates_per_result: vectors retrieved per requested result; defaults to EMBEDDING_INDEX_CONFIG
+        """
         self.database_driver = database_driver
+        self.aggregation = aggregation or EMBEDDING_INDEX_CONFIG["AGGREGATION"]
+        self.top_n = top_n or EMBEDDING_INDEX_CONFIG["TOP_N"]
+        self.candidates_per_result = candidates_per_result or EMBEDDING_INDEX_CONFIG["CANDIDATES_PER_RESULT"]
+        if self.aggregation not in ("max", "sum_top_n"):
+            raise ValueError(f"Unknown aggregation: {self.aggregation}")
         self.index = None # lazy loading
+        self._next_id = 0
+        # owner embedding ID by vector ID; vectors without an owner row own themselves
+        self._owners = np.empty(0, dtype=np.int64)
+        # BM25 index of faculty text, rebuilt on first use after the FAISS index is (re)loaded
+        self._lexical_index = None
 
     def _load_index(self):
         if self.index is None:
@@ -18,7 +42,65 @@ class EmbeddingStorage:
                 logger.info("FAISS index loaded successfully.")
             except Exception:
                 logger.warning("No FAISS index found; creating a new one.")
-                self.index = faiss.IndexFlatL2(OPENAI_CONFIG["EMBEDDING_DIMENSIONS"])
+                self.index = faiss.IndexIDMap2(faiss.IndexFlatL2(OPENAI_CONFIG["EMBEDDING_DIMENSIONS"]))
+
+            if not isinstance(self.index, faiss.IndexIDMap2):
+                self.index = self._to_id_map(self.index)
+            stored_ids = self._stored_ids()
+            self._next_id = int(stored_ids.max()) + 1 if len(stored_ids) else 0
+            self._load_owners()
+            self._lexical_index = None
+
+    def _load_owners(self):
+        """Build the owner map of the stored vectors from the owner rows in the database."""
+        self._owners = np.arange(self._next_id, dtype=np.int64)
+        rows = np.array(self.database_driver.get_vector_owners(), dtype=np.int64).reshape(-1, 2)
+        rows = rows[rows[:, 0] < self._next_id]
+        self._owners[rows[:, 0]] = rows[:, 1]
+        logger.info(f"Loaded owners of {len(rows)} project and grant vectors.")
+
+    def _owner_ids(self, vector_ids: np.ndarray) -> np.ndarray:
+        owner_ids = vector_ids.copy()
+        known = vector_ids < len(self._owners)
+        owner_ids[known] = self._owners[vector_ids[known]]
+        return owner_ids
+
+    def set_owner(self, vector_ids: typing.List[int], owner_id: int):
+        """
+        Record the owner of stored vectors in the in-memory owner map
+        :param vector_ids: IDs of project or grant vectors
+        :param owner_id: embedding ID of the owning profile vector
+        """
+        self._load_index()
+        self._set_owners(np.asarray(vector_ids, dtype=np.int64), owner_id)
+
+    def _set_owners(self, vector_ids: np.ndarray, owner_ids: typing.Union[int, np.ndarray]):
+        if not len(vector_ids):
+            return
+        if vector_ids.max() >= len(self._owners):
+            self._owners = np.concatenate([
+                self._owners,
+                np.arange(len(self._owners), vector_ids.max() + 1, dtype=np.int64),
+            ])
+        self._owners[vector_ids] = owner_ids
+
+    @staticmethod
+    def _to_id_map(index: faiss.Index) -> faiss.IndexIDMap2:
+        """
+        Wrap a positional index in an ID map so embeddings can be removed without renumbering the rest.
+        Existing vectors keep their positions as IDs.
+        """
+        logger.info("Converting FAISS index to an ID-mapped index.")
+        id_mapped_index = faiss.IndexIDMap2(faiss.IndexFlatL2(index.d))
+        if index.ntotal:
+            id_mapped_index.add_with_ids(
+                index.reconstruct_n(0, index.ntotal),
+                np.arange(index.ntotal, dtype=np.int64),
+            )
+        return id_mapped_index
+
+    def _stored_ids(self) -> np.ndarray:
+        return faiss.vector_to_array(self.index.id_map)
 
     def save_index(self):
         """
@@ -33,24 +115,70 @@ class EmbeddingStorage:
             logging.error(f"Error saving FAISS index: {INDEX_PATH}")
             raise
 
-    def add_embedding(self, faculty_name: str, embedding: typing.List[float]) -> int:
+    def get_embedding_ids(self) -> typing.Set[int]:
+        """
+        IDs of all embeddings currently in the FAISS index
+        """
+        self._load_index()
+        return set(self._stored_ids().tolist())
+
+    def add_embedding(self, faculty_name: str, embedding: typing.List[float], save_index: bool = True) -> int:
         """
         Add an embedding to the FAISS index
         :param faculty_name: name of the faculty
         :param embedding: faculty embedding
+        :param save_index: if False, only update the in-memory index; call save_index() later
         :return: index of the added embedding
         """
-        self._load_index()
         logging.info(f"Adding embedding for faculty: {faculty_name}.")
+        return self.add_embeddings([embedding], save_index=save_index)[0]
+
+    def add_embeddings(self,
+                       embeddings: typing.List[typing.List[float]],
+                       owner_id: int = None,
+                       save_index: bool = True) -> typing.List[int]:
+        """
+        Add embeddings to the FAISS index under new consecutive IDs
+        :param embeddings: embeddings to add
+        :param owner_id: embedding ID of the profile vector owning them; by default each embedding owns itself
+        :param save_index: if False, only update the in-memory index; call save_index() later
+        :return: IDs of the added embeddings
+        """
+        self._load_index()
+        if not embeddings:
+            return []
         try:
-            vector = np.array([embedding], dtype=np.float32)
-            self.index.add(vector)
-            self.save_index()
-            return self.index.ntotal - 1
+            vectors = np.array(embeddings, dtype=np.float32)
+            embedding_ids = np.arange(self._next_id, self._next_id + len(vectors), dtype=np.int64)
+            self.index.add_with_ids(vectors, embedding_ids)
+            self._next_id += len(vectors)
+            self._set_owners(embedding_ids, embedding_ids if owner_id is None else owner_id)
+            if save_index:
+                self.save_index()
+            return embedding_ids.tolist()
         except Exception as e:
             logging.error(f"Error adding embedding: {e}")
             raise
 
+    def remove_embeddings(self, embedding_ids: typing.List[int], save_index: bool = True):
+        """
+        Remove embeddings from the FAISS index; remaining embeddings keep their IDs
+        :param embedding_ids: IDs of the embeddings to remove
+        :param save_index: if False, only update the in-memory index; call save_index() later
+        """
+        self._load_index()
+        embedding_ids = [eid for eid in embedding_ids if eid is not None and eid >= 0]
+        if not embedding_ids:
+            return
+        logging.info(f"Removing {len(embedding_ids)} embedding(s) from FAISS index.")
+        try:
+            self.index.remove_ids(np.array(embedding_ids, dtype=np.int64))
+            if save_index:
+                self.save_index()
+        except Exception as e:
+            logging.error(f"Error removing embeddings: {e}")
+            raise
+
     def search_similar_embeddings(self,
                                   query_embedding: typing.List[float] = None,
                                   top_k: int = None,
@@ -96,8 +224,20 @@ class EmbeddingStorage:
     def _search_full_index(self,
                            query_vector: np.ndarray = None,
                            top_k: int = None) -> typing.List[int]:
-        _, indices = self.index.search(query_vector, top_k)
-        return indices.flatten().tolist()
+        """
+        Retrieve the nearest vectors and aggregate them per owner. The candidate count grows until
+        `top_k` owners are found or the whole index has been searched.
+        """
+        if not self.index.ntotal:
+            return []
+        has_owned_vectors = bool(np.any(self._owners != np.arange(len(self._owners))))
+        candidates = min(self.index.ntotal, top_k * (self.candidates_per_result if has_owned_vectors else 1))
+        while True:
+            distances, vector_ids = self.index.search(query_vector, candidates)
+            owner_ids = self._aggregate(vector_ids[0], distances[0], top_k)
+            if len(owner_ids) >= top_k or candidates >= self.index.ntotal:
+                return owner_ids
+            candidates = min(self.index.ntotal, candidates * 4)
 
     def search_with_parameters(self,
                                query_vector: np.ndarray,
@@ -108,7 +248,8 @@ class EmbeddingStorage:
                                agency_ic_admin: str = None,
                                has_funding: bool = None) -> typing.List[int]:
         """
-        Perform a filtered FAISS search based on metadata constraints
+        Perform a filtered FAISS search based on metadata constraints.
+        Every vector owned by a matching faculty member is compared with the query.
         """
         filtered_eids = self._get_filtered_eids(
             school=school,
@@ -117,18 +258,89 @@ class EmbeddingStorage:
             agency_ic_admin=agency_ic_admin,
             has_funding=has_funding
         )
-        valid_eids = [eid for eid in filtered_eids if eid < self.index.ntotal]
+        stored_ids = self._stored_ids()
+        candidate_ids = stored_ids[np.isin(self._owner_ids(stored_ids), np.asarray(filtered_eids, dtype=np.int64))]
 
-        if not valid_eids:
+        if not len(candidate_ids):
             logging.warning("No matching embeddings found after filtering.")
             return []
 
-        subset_vectors = np.array(self.index.reconstruct_batch(valid_eids), dtype=np.float32)
+        subset_vectors = np.array(self.index.reconstruct_batch(candidate_ids), dtype=np.float32)
+        distances = np.sum((subset_vectors - query_vector) ** 2, axis=1)
+        return self._aggregate(candidate_ids, distances, top_k)
 
-        distances = np.linalg.norm(subset_vectors - query_vector, axis=1) ** 2
-        top_k_indices = np.argsort(distances)[:min(top_k, len(subset_vectors))]
+    def _aggregate(self, vector_ids: np.ndarray, distances: np.ndarray, top_k: int) -> typing.List[int]:
+        """
+        Score each owner from its matching vectors and rank the owners.
+        Squared L2 distances are turned into cosine similarities, which holds for the unit-length
+        ada-002 embeddings. "max" scores an owner by its most similar vector; "sum_top_n" sums the
+        similarities of its `top_n` most similar vectors.
+        :param vector_ids: IDs of the matching vectors; -1 marks an empty FAISS result slot
+        :param distances: squared L2 distance of each vector to the query
+        :param top_k: number of owners to return
+        :return: owner embedding IDs, best first
+        """
+        found = vector_ids >= 0
+        vector_ids, distances = vector_ids[found], distances[found]
+        if not len(vector_ids):
+            return []
+        owner_ids = self._owner_ids(vector_ids)
+        similarities = self._similarities(distances)
+
+        order = np.lexsort((-similarities, owner_ids))
+        owner_ids, similarities = owner_ids[order], similarities[order]
+        unique_owner_ids, starts, groups = np.unique(owner_ids, return_index=True, return_inverse=True)
+        if self.aggregation == "max":
+            scores = similarities[starts]
+        else:
+            ranks = np.arange(len(owner_ids)) - starts[groups]
+            scores = np.bincount(groups, weights=np.where(ranks < self.top_n, similarities, 0.0),
+                                 minlength=len(unique_owner_ids))
 
-        return [valid_eids[idx] for idx in top_k_indices]
+        best = np.argsort(-scores, kind="stable")[:top_k]
+        return unique_owner_ids[best].tolist()
+
+    @staticmethod
+    def _similarities(distances: np.ndarray) -> np.ndarray:
+        """Cosine similarities from squared L2 distances between unit-length embeddings."""
+        return 1.0 - distances.astype(np.float64) / 2.0
+
+    def search_award_vectors(self,
+                             query_embedding: typing.List[float],
+                             top_k: int,
+                             activity_code: str = None,
+                             agency_ic_admin: str = None) -> typing.List[typing.Tuple[int, float]]:
+        """
+        Search only the project and grant vectors, i.e. the vectors owned by a profile vector, in a single
+        FAISS search restricted to their IDs. With an activity code or agency filter, only the vectors
+        of matching NIH projects are searched.
+        :param query_embedding: embedding generated from user input
+        :param top_k: number of vectors to return
+        :param activity_code: activity code
+        :param agency_ic_admin: agency ic admin
+        :return: (vector_id, similarity) pairs, most similar first
+        """
+        self._load_index()
+        stored_ids = self._stored_ids()
+        candidate_ids = stored_ids[self._owner_ids(stored_ids) != stored_ids]
+        if activity_code or agency_ic_admin:
+            filtered_ids = self.database_driver.get_award_vector_ids(
+                activity_code=activity_code,
+                agency_ic_admin=agency_ic_admin,
+            )
+            candidate_ids = candidate_ids[np.isin(candidate_ids, np.asarray(filtered_ids, dtype=np.int64))]
+        if not len(candidate_ids):
+            logging.warning("No project or grant embeddings to search.")
+            return []
+
+        logger.info(f"Performing FAISS search over {len(candidate_ids)} project and grant vectors with top_k={top_k}.")
+        query_vector = np.array([query_embedding], dtype=np.float32)
+        selector = faiss.IDSelectorBatch(np.ascontiguousarray(candidate_ids, dtype=np.int64))
+        distances, vector_ids = self.index.search(
+            query_vector, min(top_k, len(candidate_ids)), params=faiss.SearchParameters(sel=selector)
+        )
+        found = vector_ids[0] >= 0
+        return list(zip(vector_ids[0][found].tolist(), self._similarities(distances[0][found]).tolist()))
 
     def _get_filtered_eids(self,
                            school: str = None,
@@ -153,6 +365,47 @@ class EmbeddingStorage:
             has_funding=has_funding
         )
 
+    def _get_lexical_index(self) -> BM25Index:
+        self._load_index()
+        if self._lexical_index is None:
+            self._lexical_index = BM25Index(
+                self.database_driver.get_lexical_documents(),
+                k1=LEXICAL_SEARCH_CONFIG["BM25_K1"],
+                b=LEXICAL_SEARCH_CONFIG["BM25_B"],
+            )
+        return self._lexical_index
+
+    def search_lexical(self,
+                       query: str,
+                       top_k: int,
+                       school: str = None,
+                       department: str = None,
+                       activity_code: str = None,
+                       agency_ic_admin: str = None,
+                       has_funding: bool = None) -> typing.List[int]:
+        """
+        Rank faculty by BM25 score of the query over their about text and project abstracts and terms
+        :param query: query text
+        :param top_k: number of results to return
+        :param school: school name
+        :param department: department name
+        :param activity_code: activity code
+        :param agency_ic_admin: agency ic admin
+        :param has_funding: has funding
+        :return: list of faculty EIDs
+        """
+        lexical_index = self._get_lexical_index()
+        allowed_eids = None
+        if not self.are_search_parameters_empty(school, department, activity_code, agency_ic_admin, has_funding):
+            allowed_eids = self._get_filtered_eids(
+                school=school,
+                department=department,
+                activity_code=activity_code,
+                agency_ic_admin=agency_ic_admin,
+                has_funding=has_funding
+            )
+        return [eid for eid, _ in lexical_index.search(query, top_k, allowed_ids=allowed_eids)]
+
     def search_exact_words(self, query: str, top_k: int, school: str = None,
                            department: str = None, activity_code: str = None,
                            agency_ic_admin: str = None, has_funding: bool = None) -> typing.List[int]:
@@ -0,0 +1,172 @@
+import re
+import logging
+import typing
+import collections
+from datetime import date
+from backend.core.populate_config import OPENAI_CONFIG, PROFILE_DOCUMENT_CONFIG
+from backend.utils.token_utils import count_tokens, truncate_to_tokens
+
+logger = logging.getLogger(__name__)
+
+_TERM_DELIMITERS = re.compile(r"[<>;\n]")
+
+
+class ProfileDocumentBuilder:
+    SECTIONS = (
+        ("about", "About", " "),
+        ("projects", "Projects", "\n"),
+        ("terms", "Terms", "; "),
+        ("grants", "Grants", "; "),
+    )
+
+    def __init__(self,
+                 max_tokens: int = OPENAI_CONFIG["MAX_TOKENS"],
+                 section_shares: typing.Dict[str, float] = None,
+                 reserved_tokens: int = PROFILE_DOCUMENT_CONFIG["RESERVED_TOKENS"],
+                 min_section_tokens: int = PROFILE_DOCUMENT_CONFIG["MIN_SECTION_TOKENS"],
+                 sections: typing.Iterable[str] = None):
+        """
+        Builds the text embedded for a faculty member so that it fits one embedding call.
+        The token budget is planned across the about, projects, terms and grants sections;
+        each section's content is ranked and cut at its share of the budget.
+        :param max_tokens: token limit of the whole document
+        :param section_shares: share of the budget per section; defaults to PROFILE_DOCUMENT_CONFIG
+        :param reserved_tokens: tokens kept free for labels and tokenization differences at joins
+        :param min_section_tokens: smallest remainder an item is truncated to, rather than dropped
+        :param sections: names of the sections to include; defaults to all of SECTIONS
+        """
+        self.max_tokens = max_tokens
+        self.section_shares = section_shares or PROFILE_DOCUMENT_CONFIG["SECTION_SHARES"]
+        self.reserved_tokens = reserved_tokens
+        self.min_section_tokens = min_section_tokens
+        self.sections = [section for section in self.SECTIONS if sections is None or section[0] in sections]
+
+    def build(self, faculty: "Faculty") -> str:
+        """
+        Build the document to embed for a faculty member
+        :param faculty: faculty data
+        :return: document within the token budget
+        """
+        header = f"Department: {faculty.department}. School: {faculty.school}."
+        projects = self._rank_projects(faculty.projects)
+        items = {
+            "about": [faculty.about] if faculty.about else [],
+            "projects": [project.abstract for project in projects if project.abstract],
+            "terms": self._rank_terms(projects),
+            "grants": [grant.title for grant in self._rank_grants(faculty.grants) if grant.title],
+        }
+        items = {name: items[name] for name, _, _ in self.sections}
+        item_tokens = {name: [count_tokens(item) + 1 for item in section] for name, section in items.items()}
+
+        budget = self.max_tokens - self.reserved_tokens - count_tokens(header)
+        allocations = self._allocate(budget, {name: sum(tokens) for name, tokens in item_tokens.items()})
+
+        parts = [header]
+        for name, label, separator in self.sections:
+            content = self._fill(items[name], item_tokens[name], allocations.get(name, 0))
+            parts.append(f"{label}: {separator.join(content)}.")
+        document = " ".join(parts)
+        logger.debug(f"Built profile document for faculty {faculty.name}: {document}")
+        return document
+
+    def build_project(self, project: "Project") -> typing.Optional[str]:
+        """
+        Build the text embedded for a single project
+        :param project: project data
+        :return: abstract and terms of the project, or None if it has neither
+        """
+        parts = []
+        if project.abstract:
+            parts.append(f"Project: {project.abstract}")
+        terms = self._rank_terms([project])
+        if terms:
+            parts.append(f"Terms: {'; '.join(terms)}.")
+        return " ".join(parts) or None
+
+    @staticmethod
+    def build_grant(grant: "Grant") -> typing.Optional[str]:
+        """
+        Build the text embedded for a single grant
+        :param grant: grant data
+        :return: title of the grant, or None if it has none
+        """
+        return f"Grant: {grant.title}." if grant.title else None
+
+    def _allocate(self, budget: int, sizes: typing.Dict[str, int]) -> typing.Dict[str, int]:
+        """
+        Split the budget across sections in proportion to their shares. Sections needing less than
+        their share get what they need, and the rest is split again among the remaining sections.
+        :param budget: tokens available to all sections
+        :param sizes: tokens each section needs in full
+        :return: tokens allocated per section
+        """
+        allocations = {}
+        remaining = {name for name, size in sizes.items() if size > 0}
+        while remaining:
+            total_share = sum(self.section_shares.get(name, 0) for name in remaining)
+            if total_share <= 0:
+                break
+            fair = {name: budget * self.section_shares.get(name, 0) / total_share for name in remaining}
+            satisfied = {name for name in remaining if sizes[name] <= fair[name]}
+            if not satisfied:
+                allocations.update({name: int(fair[name]) for name in remaining})
+                break
+            for name in satisfied:
+                allocations[name] = sizes[name]
+                budget -= sizes[name]
+            remaining -= satisfied
+        return allocations
+
+    def _fill(self, items: typing.List[str], item_tokens: typing.List[int], budget: int) -> typing.List[str]:
+        """
+        Take ranked items until the budget runs out; the first item that does not fit is truncated
+        to the remaining budget if at least `min_section_tokens` of it fit.
+        """
+        content = []
+        for item, tokens in zip(items, item_tokens):
+            if tokens <= budget:
+                content.append(item)
+                budget -= tokens
+                continue
+            if budget - 1 >= self.min_section_tokens:
+                content.append(truncate_to_tokens(item, budget - 1))
+            break
+        return content
+
+    @staticmethod
+    def _rank_projects(projects: typing.List["Project"]) -> typing.List["Project"]:
+        """Most recent projects first, by end date and then start date."""
+        return sorted(
+            projects,
+            key=lambda project: (project.end_date or date.min, project.start_date or date.min),
+            reverse=True,
+        )
+
+    @staticmethod
+    def _rank_grants(grants: typing.List["Grant"]) -> typing.List["Grant"]:
+        """Most recent grants first, by start date and then award date."""
+        return sorted(
+            grants,
+            key=lambda grant: (grant.start_date or date.min, grant.date or date.min),
+            reverse=True,
+        )
+
+    @staticmethod
+    def _rank_terms(projects: typing.List["Project"]) -> typing.List[str]:
+        """
+        Distinct project terms, listed by more projects first and then in order of appearance,
+        so ties favour terms of the projects ranked first. Terms are compared case-insensitively.
+        """
+        counts = collections.Counter()
+        spellings = {}
+        for project in projects:
+            terms = {}
+            for term in _TERM_DELIMITERS.split(project.relevant_terms or ""):
+                term = term.strip()
+                if term:
+                    terms.setdefault(term.lower(), term)
+            for key, term in terms.items():
+                spellings.setdefault(key, term)
+                counts[key] += 1
+        order = {key: index for index, key in enumerate(spellings)}
+        return [spellings[key] for key in sorted(spellings, key=lambda key: (-counts[key], order[key]))]
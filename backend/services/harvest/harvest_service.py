@@ -0,0 +1,159 @@
+import copy
+import logging
+import typing
+from datetime import date
+from backend.core.populate_config import NIH_REPORTER_PAYLOAD
+from backend.services.harvest.harvest_store import HarvestStore
+from backend.services.nih.nih_reporter_proxy import NIHReporterProxy
+from backend.services.nsf.nsf_proxy import NSFProxy
+from backend.utils.name_utils import NameIndex, name_key
+
+logger = logging.getLogger(__name__)
+
+# RePORTER rejects offsets past this value, so each search must return fewer results
+NIH_MAX_OFFSET = 14999
+
+
+class AwardIndex:
+    def __init__(self):
+        """
+        In-memory join of harvested NIH projects and NSF awards to investigator names.
+        Projects and awards are listed under every PI and co-PI they name.
+        """
+        self.nih_projects = NameIndex()
+        self.nsf_awards = NameIndex()
+
+    def add_nih_project(self, project: typing.Dict):
+        for investigator in project.get("principal_investigators") or []:
+            self.nih_projects.add(name_key(investigator.get("first_name"), investigator.get("last_name")), project)
+
+    def add_nsf_award(self, award: typing.Dict):
+        self.nsf_awards.add(name_key(award.get("piFirstName"), award.get("piLastName")), award)
+        for co_pi in award.get("coPDPI") or []:
+            # Co-PIs are listed as "First Last ~NSF ID"
+            self.nsf_awards.add_name(co_pi.split("~")[0], award)
+
+    def get_nih_projects(self, first_name: str, last_name: str) -> typing.List[typing.Dict]:
+        """
+        :return: RePORTER project JSON of projects with the given PI
+        """
+        return self.nih_projects.get(name_key(first_name, last_name))
+
+    def get_nsf_awards(self, first_name: str, last_name: str) -> typing.List[typing.Dict]:
+        """
+        :return: NSF award JSON of awards with the given PI or co-PI
+        """
+        return self.nsf_awards.get(name_key(first_name, last_name))
+
+
+class HarvestService:
+    NSF_PRINT_FIELDS = "id,date,startDate,title,piFirstName,piLastName,coPDPI"
+
+    def __init__(self, nih_proxy: NIHReporterProxy, nsf_proxy: NSFProxy, store: HarvestStore):
+        self.nih_proxy = nih_proxy
+        self.nsf_proxy = nsf_proxy
+        self.store = store
+
+    def harvest(self,
+                fiscal_years: typing.List[int],
+                nsf_awardee_name: str,
+                nih_page_size: int = 500,
+                nsf_page_size: int = 25):
+        """
+        Download every NIH project awarded to the institution in the given fiscal years, and every
+        unexpired NSF award of the institution, then replace the stored harvest with the results.
+        :param fiscal_years: NIH fiscal years to harvest
+        :param nsf_awardee_name: NSF awardee name of the institution
+        :param nih_page_size: RePORTER results per page (at most 500)
+        :param nsf_page_size: NSF results per page (at most 25)
+        """
+        nih_projects = {}
+        for fiscal_year in fiscal_years:
+            for project in self.iter_nih_projects(fiscal_year, nih_page_size):
+                nih_projects[str(project.get("appl_id") or project.get("project_num"))] = project
+        logger.info(f"Harvested {len(nih_projects)} NIH projects for fiscal years {fiscal_years}.")
+
+        nsf_awards = {
+            str(award.get("id")): award for award in self.iter_nsf_awards(nsf_awardee_name, nsf_page_size)
+        }
+        logger.info(f"Harvested {len(nsf_awards)} NSF awards for awardee {nsf_awardee_name}.")
+
+        self.store.replace(nih_projects, nsf_awards)
+
+    def iter_nih_projects(self, fiscal_year: int, page_size: int) -> typing.Iterator[typing.Dict]:
+        """
+        Page through the RePORTER projects of the institutions in NIH_REPORTER_PAYLOAD for one fiscal year
+        :param fiscal_year: fiscal year to harvest
+        :param page_size: results per page
+        :return: iterator of project JSON
+        """
+        offset = 0
+        while True:
+            response = self.nih_proxy.call_reporter_api(self.build_nih_payload(fiscal_year, offset, page_size))
+            projects = response.get("results") or []
+            yield from projects
+
+            total = response.get("meta", {}).get("total", 0)
+            offset += len(projects)
+            if not projects or offset >= total:
+                return
+            if offset > NIH_MAX_OFFSET:
+                logger.warning(f"Stopping NIH harvest for fiscal year {fiscal_year} at the RePORTER offset limit: "
+                               f"{offset} of {total} projects retrieved.")
+                return
+
+    def iter_nsf_awards(self, awardee_name: str, page_size: int) -> typing.Iterator[typing.Dict]:
+        """
+        Page through the unexpired NSF awards of an awardee
+        :param awardee_name: NSF awardee name
+        :param page_size: results per page
+        :return: iterator of award JSON
+        """
+        offset = 1
+        while True:
+            response = self.nsf_proxy.call_nsf_api(payload={
+                "awardeeName": f'"{awardee_name}"',
+                "expDateStart": date.today().strftime("%m/%d/%Y"),
+                "printFields": self.NSF_PRINT_FIELDS,
+                "rpp": page_size,
+                "offset": offset,
+            })
+            awards = response.get("response", {}).get("award") or []
+            yield from awards
+
+            if len(awards) < page_size:
+                return
+            offset += len(awards)
+
+    def load_index(self) -> AwardIndex:
+        """
+        Build the in-memory name index from the stored harvest
+        :return: award index
+        """
+        index = AwardIndex()
+        for project in self.store.iter_nih_projects():
+            index.add_nih_project(project)
+        for award in self.store.iter_nsf_awards():
+            index.add_nsf_award(award)
+        logger.info(f"Loaded award index with {len(index.nih_projects)} NIH and {len(index.nsf_awards)} NSF investigators.")
+        return index
+
+    @staticmethod
+    def build_nih_payload(fiscal_year: int, offset: int, limit: int) -> typing.Dict:
+        """
+        Build the payload for one page of an institution-wide NIH RePORTER API request
+        :param fiscal_year: fiscal year to filter results
+        :param offset: index of the first result to return
+        :param limit: number of results to return
+        :return: payload as dictionary
+        """
+        payload = copy.deepcopy(NIH_REPORTER_PAYLOAD)
+        del payload["criteria"]["pi_names"]
+        payload["criteria"]["fiscal_years"] = [fiscal_year]
+        # Relevance ordering is not stable across pages
+        payload["criteria"]["use_relevance"] = False
+        payload["sort_field"] = "appl_id"
+        payload["sort_order"] = "asc"
+        payload["offset"] = offset
+        payload["limit"] = limit
+        return payload
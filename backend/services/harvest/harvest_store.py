@@ -0,0 +1,83 @@
+import os
+import json
+import time
+import sqlite3
+import logging
+import threading
+import typing
+
+logger = logging.getLogger(__name__)
+
+
+class HarvestStore:
+    def __init__(self, path: str):
+        """
+        Local SQLite copy of harvested NIH RePORTER projects and NSF awards, stored as raw API JSON.
+        :param path: SQLite file holding the harvest
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = None
+
+    def open(self) -> "HarvestStore":
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS nih_projects (project_key TEXT PRIMARY KEY, data TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS nsf_awards (award_id TEXT PRIMARY KEY, data TEXT NOT NULL);
+        """)
+        self._connection.commit()
+        return self
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def harvested_at(self) -> typing.Optional[float]:
+        """
+        :return: UNIX time of the last completed harvest, or None if there is none
+        """
+        with self._lock:
+            row = self._connection.execute("SELECT value FROM meta WHERE key = 'harvested_at'").fetchone()
+        return float(row[0]) if row else None
+
+    def is_stale(self, max_age_hours: float) -> bool:
+        harvested_at = self.harvested_at()
+        return harvested_at is None or time.time() - harvested_at > max_age_hours * 3600
+
+    def replace(self, nih_projects: typing.Dict[str, typing.Dict], nsf_awards: typing.Dict[str, typing.Dict]):
+        """
+        Replace the stored harvest in a single transaction.
+        :param nih_projects: RePORTER project JSON keyed by application ID
+        :param nsf_awards: NSF award JSON keyed by award ID
+        """
+        with self._lock:
+            with self._connection:
+                self._connection.execute("DELETE FROM nih_projects")
+                self._connection.execute("DELETE FROM nsf_awards")
+                self._connection.executemany(
+                    "INSERT INTO nih_projects (project_key, data) VALUES (?, ?)",
+                    ((key, json.dumps(project)) for key, project in nih_projects.items()),
+                )
+                self._connection.executemany(
+                    "INSERT INTO nsf_awards (award_id, data) VALUES (?, ?)",
+                    ((key, json.dumps(award)) for key, award in nsf_awards.items()),
+                )
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('harvested_at', ?)", (str(time.time()),)
+                )
+        logger.info(f"Stored {len(nih_projects)} NIH projects and {len(nsf_awards)} NSF awards in {self.path}.")
+
+    def iter_nih_projects(self) -> typing.Iterator[typing.Dict]:
+        with self._lock:
+            rows = self._connection.execute("SELECT data FROM nih_projects").fetchall()
+        for row in rows:
+            yield json.loads(row[0])
+
+    def iter_nsf_awards(self) -> typing.Iterator[typing.Dict]:
+        with self._lock:
+            rows = self._connection.execute("SELECT data FROM nsf_awards").fetchall()
+        for row in rows:
+            yield json.loads(row[0])
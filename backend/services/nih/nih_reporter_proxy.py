@@ -2,14 +2,21 @@ import typing
 import logging
 from requests import RequestException, Timeout, HTTPError
 from backend.utils.http_client import HttpClient
+from backend.utils.api_response_cache import ApiResponseCache
 
 logger = logging.getLogger(__name__)
 
 class NIHReporterProxy:
     NIH_REPORTER_ENDPOINT = "https://api.reporter.nih.gov/v2/projects/search"
+    CACHE_ENDPOINT = "nih_reporter_search"
 
-    def __init__(self, http_client: HttpClient):
+    def __init__(self, http_client: HttpClient, response_cache: typing.Optional[ApiResponseCache] = None):
+        """
+        :param http_client: client used for RePORTER requests
+        :param response_cache: durable cache of RePORTER responses; requests are not cached when None
+        """
         self.http_client = http_client
+        self.response_cache = response_cache
 
 
     def call_reporter_api(self, payload: typing.Dict) -> typing.Dict:
@@ -20,9 +27,14 @@ class NIHReporterProxy:
         :raises: Any exceptions raised by the HTTP client
         """
         try:
-            logger.info(f"Invoking NIH RePORTER API with payload: {payload}")
-            response = self.http_client.post(self.NIH_REPORTER_ENDPOINT, json=payload)
-            return response.json()
+            if self.response_cache is None:
+                return self._post(payload)
+            return self.response_cache.get_or_fetch(self.CACHE_ENDPOINT, payload, lambda: self._post(payload))
         except (RequestException, Timeout, HTTPError) as e:
             logger.error(f"NIH Reporter API request failed: {e}")
             raise
+
+    def _post(self, payload: typing.Dict) -> typing.Dict:
+        logger.info(f"Invoking NIH RePORTER API with payload: {payload}")
+        response = self.http_client.post(self.NIH_REPORTER_ENDPOINT, json=payload)
+        return response.json()
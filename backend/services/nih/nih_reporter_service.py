@@ -1,9 +1,11 @@
 import typing
-import pandas as pd
+import collections
 import logging
 import copy
+from backend.models.records import NIHProject
 from backend.services.nih.nih_reporter_proxy import NIHReporterProxy
-from backend.core.populate_config import NIH_REPORTER_PAYLOAD, DEFAULT_FISCAL_YEARS
+from backend.core.populate_config import NIH_REPORTER_PAYLOAD, DEFAULT_FISCAL_YEARS, NIH_BATCH_CONFIG
+from backend.utils.name_utils import name_key
 from datetime import datetime
 from dateutil.parser import parse
 
@@ -14,35 +16,131 @@ class NIHReporterService:
     def __init__(self, proxy: NIHReporterProxy):
         self.proxy = proxy
 
-    def compile_project_metadata(self, pi_first_name: str = None, pi_last_name: str = None, fiscal_years: typing.List[int] = DEFAULT_FISCAL_YEARS) -> pd.DataFrame:
+    def compile_project_metadata(self, pi_first_name: str = None, pi_last_name: str = None, fiscal_years: typing.List[int] = DEFAULT_FISCAL_YEARS) -> typing.List[NIHProject]:
         """
         Extract relevant metadata from PI projects for provided fiscal years
         :param pi_first_name: PI's first name
         :param pi_last_name: PI's last name
         :param fiscal_years: fiscal years during which projects were/are active
-        :return: dataframe of given PI's project metadata
+        :return: given PI's project metadata
         """
         response = self.invoke_proxy(pi_first_name=pi_first_name, pi_last_name=pi_last_name, fiscal_years=fiscal_years)
 
         projects = response["results"]
         if len(projects) == 0:
             logger.warning(f"No projects founds for PI '{pi_first_name} {pi_last_name}' and fiscal years '{fiscal_years}'")
-            return pd.DataFrame()
-
-        compiled_metadata = [
-            {
-                "project_number": self.get_project_number(project),
-                "abstract_text": self.get_abstract_text(project),
-                "terms": self.get_terms(project),
-                "start_date": self.get_project_start_date(project),
-                "end_date": self.get_project_end_date(project),
-                "agency_ic_admin": self.get_agency_ic_admin(project),
-                "activity_code": self.get_activity_code(project),
-            }
-            for project in projects
-        ]
+            return []
+
+        return [self.compile_project(project) for project in projects]
+
+    def compile_batch_project_metadata(
+            self,
+            pi_names: typing.List[typing.Tuple[str, str]],
+            fiscal_years: typing.List[int] = DEFAULT_FISCAL_YEARS,
+            names_per_request: int = NIH_BATCH_CONFIG["PI_NAMES_PER_REQUEST"],
+            page_size: int = NIH_BATCH_CONFIG["PAGE_SIZE"]) -> typing.Dict[typing.Tuple[str, str], typing.List[NIHProject]]:
+        """
+        Extract project metadata for many PIs with one paged RePORTER search per group of PI names.
+        Each project is mapped back to every requested PI listed among its principal investigators.
+        :param pi_names: (first name, last name) of each PI
+        :param fiscal_years: fiscal years during which projects were/are active
+        :param names_per_request: number of PI names sent per search
+        :param page_size: number of results requested per page
+        :return: project metadata for each requested (first name, last name)
+        """
+        requested = list(dict.fromkeys(pi_names))
+        projects_by_pi = {pi_name: [] for pi_name in requested}
+
+        for start in range(0, len(requested), names_per_request):
+            group = requested[start:start + names_per_request]
+            # Requested names that normalize to the same key, e.g. differing only in case, all get the project
+            lookup = collections.defaultdict(list)
+            for first_name, last_name in group:
+                lookup[name_key(first_name, last_name)].append((first_name, last_name))
+            for project in self.iter_batch_projects(group, fiscal_years, page_size):
+                for pi_name in self._match_principal_investigators(project, lookup):
+                    projects_by_pi[pi_name].append(self.compile_project(project))
+
+        for pi_name, projects in projects_by_pi.items():
+            if not projects:
+                logger.warning(f"No projects founds for PI '{pi_name[0]} {pi_name[1]}' and fiscal years '{fiscal_years}'")
+        return projects_by_pi
+
+    def iter_batch_projects(
+            self,
+            pi_names: typing.List[typing.Tuple[str, str]],
+            fiscal_years: typing.List[int],
+            page_size: int) -> typing.Iterator[typing.Dict]:
+        """
+        Page through RePORTER search results for a group of PI names
+        :param pi_names: (first name, last name) of each PI
+        :param fiscal_years: fiscal years during which projects were/are active
+        :param page_size: number of results requested per page
+        :return: iterator of project JSON
+        """
+        offset = 0
+        while True:
+            payload = self.build_batch_payload(pi_names, fiscal_years, offset, page_size)
+            response = self.proxy.call_reporter_api(payload)
+            projects = response.get("results") or []
+            yield from projects
 
-        return pd.DataFrame(compiled_metadata)
+            total = response.get("meta", {}).get("total", 0)
+            offset += len(projects)
+            if not projects or offset >= total:
+                return
+
+    def compile_project(self, project: typing.Dict) -> NIHProject:
+        """
+        Extract relevant metadata from a single project
+        :param project: JSON w/ project metadata
+        :return: project metadata
+        """
+        return NIHProject(
+            project_number=self.get_project_number(project),
+            abstract_text=self.get_abstract_text(project),
+            terms=self.get_terms(project),
+            start_date=self.get_project_start_date(project),
+            end_date=self.get_project_end_date(project),
+            agency_ic_admin=self.get_agency_ic_admin(project),
+            activity_code=self.get_activity_code(project),
+            core_project_number=project.get("core_project_num"),
+            fiscal_year=project.get("fiscal_year"),
+        )
+
+    @staticmethod
+    def canonicalize_projects(projects: typing.List[NIHProject]) -> typing.List[NIHProject]:
+        """
+        Keep one record per core project number. RePORTER returns a grant once per fiscal year (and once
+        per supplement), each with the same abstract; the record of the latest fiscal year is kept.
+        Projects without a core project number are keyed by their full project number.
+        :param projects: project metadata, possibly several fiscal years of the same grant
+        :return: latest record of each grant, in order of first appearance
+        """
+        canonical = {}
+        for project in projects:
+            key = project.core_project_number or project.project_number
+            kept = canonical.get(key)
+            if kept is None or (project.fiscal_year or 0) >= (kept.fiscal_year or 0):
+                canonical[key] = project
+        return list(canonical.values())
+
+    @staticmethod
+    def _match_principal_investigators(
+            project: typing.Dict,
+            lookup: typing.Dict[typing.Tuple[str, str], typing.List[typing.Tuple[str, str]]]) -> typing.List[typing.Tuple[str, str]]:
+        """
+        Find the requested PIs among a project's principal investigators
+        :param project: JSON w/ project metadata
+        :param lookup: requested PIs grouped by name_key
+        :return: matching requested (first name, last name) pairs
+        """
+        matches = []
+        for investigator in project.get("principal_investigators") or []:
+            for pi_name in lookup.get(name_key(investigator.get("first_name"), investigator.get("last_name")), []):
+                if pi_name not in matches:
+                    matches.append(pi_name)
+        return matches
 
     def invoke_proxy(self, pi_first_name: str, pi_last_name: str, fiscal_years: typing.List) -> typing.Dict:
         if pi_first_name is None or pi_last_name is None:
@@ -132,6 +230,32 @@ class NIHReporterService:
         payload["criteria"]["fiscal_years"] = fiscal_years
         return payload
 
+    @staticmethod
+    def build_batch_payload(pi_names: typing.List[typing.Tuple[str, str]],
+                            fiscal_years: typing.List[int],
+                            offset: int,
+                            limit: int) -> typing.Dict:
+        """
+        Build the payload for one page of a multi-PI NIH RePORTER API request
+        :param pi_names: (first name, last name) of each PI
+        :param fiscal_years: list of fiscal years to filter results
+        :param offset: index of the first result to return
+        :param limit: number of results to return
+        :return: payload as dictionary
+        """
+        payload = copy.deepcopy(NIH_REPORTER_PAYLOAD)
+        payload["criteria"]["pi_names"] = [
+            {"first_name": first_name, "last_name": last_name} for first_name, last_name in pi_names
+        ]
+        payload["criteria"]["fiscal_years"] = fiscal_years
+        # Relevance ordering is not stable across pages
+        payload["criteria"]["use_relevance"] = False
+        payload["sort_field"] = "appl_id"
+        payload["sort_order"] = "asc"
+        payload["offset"] = offset
+        payload["limit"] = limit
+        return payload
+
     @staticmethod
     def safe_get_field(data: dict, key: str) -> typing.Any:
         """
@@ -1,29 +1,62 @@
 import typing
 import logging
 from requests import RequestException, Timeout, HTTPError
-import requests
 from backend.utils.http_client import HttpClient
+from backend.utils.api_response_cache import ApiResponseCache
 
 logger = logging.getLogger(__name__)
 
 class NSFProxy:
-    NSF_REPORTER_ENDPOINT = "http://api.nsf.gov/services/v1/awards.json"
+    NSF_REPORTER_ENDPOINT = "https://api.nsf.gov/services/v1/awards.json"
+    NSF_AWARD_ENDPOINT = "https://api.nsf.gov/services/v1/awards/{award_id}.json"
+    CACHE_ENDPOINT = "nsf_awards_search"
+    AWARD_CACHE_ENDPOINT = "nsf_award"
 
-    def __init__(self):
-        pass
+    def __init__(self, http_client: HttpClient, response_cache: typing.Optional[ApiResponseCache] = None):
+        """
+        :param http_client: client used for NSF API requests
+        :param response_cache: durable cache of NSF API responses; requests are not cached when None
+        """
+        self.http_client = http_client
+        self.response_cache = response_cache
 
     def call_nsf_api(self, payload: typing.Dict) -> typing.Dict:
         """
         Call the NSF API with the given payload
-        :param payload: the payload for the POST request
+        :param payload: the query parameters for the GET request
         :return: API response as a dictionary
         :raises: Any exceptions raised by the HTTP client
         """
         try:
-            logger.info(f"Invoking NSF API with payload: {payload}")
-            response = requests.get(self.NSF_REPORTER_ENDPOINT, params=payload)
-            response.raise_for_status()
-            return response.json()
+            if self.response_cache is None:
+                return self._get(payload)
+            return self.response_cache.get_or_fetch(self.CACHE_ENDPOINT, payload, lambda: self._get(payload))
         except (RequestException, Timeout, HTTPError) as e:
             logger.error(f"NSF API request failed: {e}")
             raise
+
+    def call_award_api(self, award_id: str, payload: typing.Optional[typing.Dict] = None) -> typing.Dict:
+        """
+        Call the NSF API for a single award
+        :param award_id: NSF award ID
+        :param payload: optional query parameters, e.g. printFields
+        :return: API response as a dictionary
+        :raises: Any exceptions raised by the HTTP client
+        """
+        payload = payload or {}
+        url = self.NSF_AWARD_ENDPOINT.format(award_id=award_id)
+        try:
+            if self.response_cache is None:
+                return self._get(payload, url)
+            return self.response_cache.get_or_fetch(
+                self.AWARD_CACHE_ENDPOINT, {"award_id": award_id, **payload}, lambda: self._get(payload, url)
+            )
+        except (RequestException, Timeout, HTTPError) as e:
+            logger.error(f"NSF API request for award {award_id} failed: {e}")
+            raise
+
+    def _get(self, payload: typing.Dict, url: typing.Optional[str] = None) -> typing.Dict:
+        url = url or self.NSF_REPORTER_ENDPOINT
+        logger.info(f"Invoking NSF API {url} with payload: {payload}")
+        response = self.http_client.get(url, params=payload)
+        return response.json()
@@ -1,8 +1,8 @@
 import typing
-import pandas as pd
 import logging
 import copy
 from datetime import datetime, date
+from backend.models.records import NSFAward
 from backend.services.nsf.nsf_proxy import NSFProxy
 from backend.core.populate_config import NIH_REPORTER_PAYLOAD, DEFAULT_FISCAL_YEARS
 
@@ -13,13 +13,13 @@ class NSFService:
     def __init__(self, proxy: NSFProxy):
         self.proxy = proxy
 
-    def compile_project_metadata(self, pi_first_name: str = None, pi_last_name: str = None, fiscal_years: typing.List[int] = DEFAULT_FISCAL_YEARS) -> pd.DataFrame:
+    def compile_project_metadata(self, pi_first_name: str = None, pi_last_name: str = None, fiscal_years: typing.List[int] = DEFAULT_FISCAL_YEARS) -> typing.List[NSFAward]:
         """
         Extract relevant metadata from PI projects for provided fiscal years
         :param pi_first_name: PI's first name
         :param pi_last_name: PI's last name
         :param fiscal_years: fiscal years during which projects were/are active
-        :return: dataframe of given PI's project metadata
+        :return: given PI's award metadata
         """
         if not pi_first_name and not pi_last_name:
             raise Exception("No name provided.")
@@ -33,19 +33,57 @@ class NSFService:
         projects = resp["response"]["award"]
         if len(projects) == 0:
             logger.warning(f"No unexpired NSF grants found for PI '{pi_first_name} {pi_last_name}'.")
-            return pd.DataFrame()
+            return []
 
-        compiled_metadata = [
-            {
-                "id": self.safe_get_field(project, "id"),
-                "date": self.safe_get_field(project, "date"),
-                "start_date": self.safe_get_field(project, "startDate"),
-                "title": self.safe_get_field(project, "title"),
-            }
-            for project in projects
-        ]
+        return [self.compile_award(project) for project in projects]
 
-        return pd.DataFrame(compiled_metadata)
+    def compile_award(self, award: typing.Dict) -> NSFAward:
+        """
+        Extract relevant metadata from a single award
+        :param award: JSON w/ award metadata
+        :return: award metadata with parsed dates
+        """
+        return NSFAward(
+            id=self.safe_get_field(award, "id"),
+            date=self.process_date_string(self.safe_get_field(award, "date")),
+            start_date=self.process_date_string(self.safe_get_field(award, "startDate")),
+            title=self.safe_get_field(award, "title"),
+        )
+
+    def get_award_details(self, award_ids: typing.List[str], print_fields: typing.List[str],
+                          batch_size: int = 25) -> typing.Dict[str, typing.Dict]:
+        """
+        Look up awards by ID, `batch_size` IDs per request. Awards missing from a batched response,
+        or in a batch whose request failed, are requested one at a time.
+        :param award_ids: NSF award IDs
+        :param print_fields: award fields to return; "id" is always included
+        :param batch_size: IDs per request (the API returns at most 25 awards per page)
+        :return: award JSON keyed by award ID; IDs that could not be found are omitted
+        """
+        fields = ",".join(dict.fromkeys(["id", *print_fields]))
+        award_ids = list(dict.fromkeys(award_ids))
+        details = {}
+        for start in range(0, len(award_ids), batch_size):
+            batch = award_ids[start:start + batch_size]
+            try:
+                resp = self.proxy.call_nsf_api(payload={"id": ",".join(batch), "printFields": fields, "rpp": batch_size})
+                for award in resp["response"].get("award", []):
+                    if award.get("id") in batch:
+                        details[award["id"]] = award
+            except Exception as e:
+                logger.warning(f"Batched NSF award lookup failed, retrying IDs individually: {e}")
+
+            for award_id in batch:
+                if award_id in details:
+                    continue
+                try:
+                    resp = self.proxy.call_award_api(award_id, payload={"printFields": fields})
+                    awards = resp["response"].get("award", [])
+                    if awards:
+                        details[award_id] = awards[0]
+                except Exception as e:
+                    logger.error(f"NSF award lookup failed for {award_id}: {e}")
+        return details
 
     def invoke_proxy(self, pi_first_name: str, pi_last_name: str, fiscal_years: typing.List) -> typing.Dict:
         if pi_first_name is None or pi_last_name is None:
@@ -1,21 +1,22 @@
 import typing
 import logging
-import pandas as pd
 
+from backend.models.records import FacultyProfile
 from backend.services.scraper.base_scraper import BaseScraper
 from backend.utils.institution_utils import InstitutionUtils
 
 logger = logging.getLogger(__name__)
 
+
 class ScraperService:
     def __init__(self, scrapers: typing.List[BaseScraper]):
         self.scrapers = scrapers
 
-    def get_school_faculty_data(self, school: str) -> typing.Dict[str, pd.DataFrame]:
+    def get_school_faculty_data(self, school: str) -> typing.Dict[str, typing.List[FacultyProfile]]:
         """
         Fetch school faculty data
         :param school: school acronym
-        :return: dictionary mapping dept acronym to school faculty data as dataframe
+        :return: dictionary mapping dept acronym to the department's faculty profiles
         """
         departments = InstitutionUtils.get_departments_from_school(school)
         logger.info(f"Fetching school faculty data for school: {school}")
@@ -32,11 +33,35 @@ class ScraperService:
 
 
 
-    def get_department_faculty_data(self, department: str) -> pd.DataFrame:
+    def get_department_faculty_data(self, department: str) -> typing.List[FacultyProfile]:
+        """
+        Returns scraped information about a department's faculty members
+        :param department: school department e.g. Biomedical Engineering (Dept of SEAS)
+        :return: faculty profiles with name, email address, about section, and profile URL
+        """
+        return list(self.iter_department_faculty_profiles(department))
+
+    def iter_school_faculty_profiles(self, school: str) -> typing.Iterator[FacultyProfile]:
+        """
+        Lazily scrape a school's faculty, one profile at a time
+        :param school: school acronym
+        :return: iterator of faculty profiles across the school's departments
+        """
+        departments = InstitutionUtils.get_departments_from_school(school)
+        logger.info(f"Fetching school faculty data for school: {school}")
+
+        try:
+            for dept in departments:
+                yield from self.iter_department_faculty_profiles(dept)
+        except Exception as e:
+            logger.critical(f"Failed to fetch school faculty data for school: {school}: {e}")
+            raise RuntimeError(f"Data generation failed for school: {school}") from e
+
+    def iter_department_faculty_profiles(self, department: str) -> typing.Iterator[FacultyProfile]:
         """
-        Returns scraped information about a department's faculty members as a Pandas DataFrame
+        Lazily scrape a department's faculty, one profile at a time
         :param department: school department e.g. Biomedical Engineering (Dept of SEAS)
-        :return: dataframe containing the faculty name, email address, about section, and profile URL
+        :return: iterator of faculty profiles with name, email address, about section, and profile URL
         """
         scraper = self._select_scraper(department)
         people_url = InstitutionUtils.get_people_url_from_department(department)
@@ -46,23 +71,20 @@ class ScraperService:
         logger.info(f"Scraping faculty profile endpoints from {department} webpage")
         profile_endpoints = scraper.get_profile_endpoints_from_people(people_url)
 
-        faculty_data = []
         for endpoint in profile_endpoints:
             profile_url = InstitutionUtils.make_profile_url(school_base_url, endpoint)
             name = scraper.get_name_from_profile(profile_url)
             emails = ",".join(scraper.get_emails_from_profile(profile_url))
             about = scraper.get_about_from_profile(profile_url)
 
-            faculty_data.append({
-                "Faculty_Name": name,
-                "School": school,
-                "Department": department,
-                "Email_Address": emails,
-                "About_Section": about,
-                "Profile_URL": profile_url,
-            })
-
-        return pd.DataFrame(faculty_data)
+            yield FacultyProfile(
+                name=name,
+                school=school,
+                department=department,
+                email=emails,
+                about=about,
+                profile_url=profile_url,
+            )
 
     def _select_scraper(self, department: str) -> BaseScraper:
         """
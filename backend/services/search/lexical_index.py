@@ -0,0 +1,106 @@
+import re
+import logging
+import typing
+import collections
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset("""
+    a an and are as at be by for from has have in is it its of on or that the their this to was were which with
+""".split())
+
+
+def tokenize(text: typing.Optional[str]) -> typing.List[str]:
+    """Lowercase alphanumeric tokens of a text, without stopwords and single characters."""
+    return [token for token in _TOKEN.findall((text or "").lower()) if len(token) > 1 and token not in _STOPWORDS]
+
+
+def reciprocal_rank_fusion(rankings: typing.List[typing.List[int]], k: int = 60) -> typing.List[int]:
+    """
+    Fuse rankings by reciprocal rank fusion: an ID scores 1 / (k + rank) in every ranking it appears in.
+    :param rankings: lists of IDs, best first
+    :param k: fusion constant; larger values flatten the advantage of top ranks
+    :return: IDs of all rankings, best fused score first; ties keep first-seen order
+    """
+    scores = collections.defaultdict(float)
+    for ranking in rankings:
+        for rank, item_id in enumerate(ranking, start=1):
+            scores[item_id] += 1.0 / (k + rank)
+    return sorted(scores, key=scores.get, reverse=True)
+
+
+class BM25Index:
+    def __init__(self, documents: typing.Iterable[typing.Tuple[int, str]], k1: float = 1.2, b: float = 0.75):
+        """
+        In-memory inverted index scoring documents with Okapi BM25. Postings are stored per term as
+        contiguous numpy slices of document positions and precomputed BM25 weights, so a query only
+        sums the slices of its terms.
+        :param documents: (document ID, text) pairs
+        :param k1: term frequency saturation
+        :param b: document length normalization
+        """
+        vocabulary = {}
+        doc_ids, doc_lengths = [], []
+        term_ids, positions, frequencies = [], [], []
+        for position, (doc_id, text) in enumerate(documents):
+            counts = collections.Counter(tokenize(text))
+            doc_ids.append(doc_id)
+            doc_lengths.append(sum(counts.values()))
+            for term, count in counts.items():
+                term_ids.append(vocabulary.setdefault(term, len(vocabulary)))
+                positions.append(position)
+                frequencies.append(count)
+
+        self.vocabulary = vocabulary
+        self.doc_ids = np.asarray(doc_ids, dtype=np.int64)
+        term_ids = np.asarray(term_ids, dtype=np.int64)
+        order = np.argsort(term_ids, kind="stable")
+        self._positions = np.asarray(positions, dtype=np.int64)[order]
+        self._offsets = np.concatenate([[0], np.cumsum(np.bincount(term_ids, minlength=len(vocabulary)))])
+
+        doc_count = len(doc_ids)
+        doc_lengths = np.asarray(doc_lengths, dtype=np.float64)
+        average_length = doc_lengths.mean() if doc_count and doc_lengths.mean() > 0 else 1.0
+        document_frequencies = np.diff(self._offsets)
+        idf = np.log(1.0 + (doc_count - document_frequencies + 0.5) / (document_frequencies + 0.5))
+        frequencies = np.asarray(frequencies, dtype=np.float64)[order]
+        length_norms = k1 * (1.0 - b + b * doc_lengths / average_length)
+        self._weights = (
+            idf[term_ids[order]] * frequencies * (k1 + 1.0) / (frequencies + length_norms[self._positions])
+            if len(frequencies) else np.empty(0, dtype=np.float64)
+        )
+        logger.info(f"Built BM25 index of {doc_count} documents and {len(vocabulary)} terms.")
+
+    def __len__(self) -> int:
+        return len(self.doc_ids)
+
+    def search(self,
+               query: str,
+               top_k: int,
+               allowed_ids: typing.Iterable[int] = None) -> typing.List[typing.Tuple[int, float]]:
+        """
+        Rank documents containing any query term by BM25 score
+        :param query: query text
+        :param top_k: number of documents to return
+        :param allowed_ids: if given, only these document IDs are returned
+        :return: (document ID, score) pairs, best first
+        """
+        if top_k <= 0:
+            return []
+        scores = np.zeros(len(self.doc_ids), dtype=np.float64)
+        for term in set(tokenize(query)):
+            term_id = self.vocabulary.get(term)
+            if term_id is None:
+                continue
+            start, end = self._offsets[term_id], self._offsets[term_id + 1]
+            scores[self._positions[start:end]] += self._weights[start:end]
+
+        if allowed_ids is not None:
+            scores[~np.isin(self.doc_ids, np.asarray(list(allowed_ids), dtype=np.int64))] = 0.0
+        candidates = np.flatnonzero(scores > 0)
+        if len(candidates) > top_k:
+            candidates = candidates[np.argpartition(-scores[candidates], top_k - 1)[:top_k]]
+        best = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return list(zip(self.doc_ids[best].tolist(), scores[best].tolist()))
@@ -1,7 +1,10 @@
 import logging
 import typing
-from backend.services.embedding.embedding_service import EmbeddingService
+from backend.core.populate_config import EMBEDDING_INDEX_CONFIG
+from backend.models.records import AwardMatch
+from backend.services.embedding.embedding_service import EmbeddingService, PROJECT_VECTOR
 from backend.services.database.database_driver import DatabaseDriver
+from backend.utils.serialization_utils import FACULTY_FIELDS, faculty_field_attributes, faculty_search_document
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +21,8 @@ class SearchService:
                activity_code: str = None,
                agency_ic_admin: str = None,
                has_funding: bool = None,
-               exact_words: bool = False) -> typing.List["Faculty"]:
+               exact_words: bool = False,
+               mode: str = "vector") -> typing.List["Faculty"]:
         """
         Search for the most similar faculty based on a natural language query.
         :param query: user natural language query
@@ -28,6 +32,8 @@ class SearchService:
         :param activity_code: activity code
         :param agency_ic_admin: agency ic admin name
         :param has_funding: has funding
+        :param exact_words: only return faculty whose text matches the query as written
+        :param mode: "vector", "lexical" or "hybrid" ranking
         :return: list of Faculty
         """
         similar_embeddings_eids = self.embedding_service.search_similar_embeddings(
@@ -38,7 +44,8 @@ class SearchService:
             activity_code=activity_code,
             agency_ic_admin=agency_ic_admin,
             has_funding=has_funding,
-            exact_words=exact_words
+            exact_words=exact_words,
+            mode=mode
         )
 
         similar_faculty = [self._get_faculty_record(eid) for eid in similar_embeddings_eids]
@@ -48,6 +55,93 @@ class SearchService:
             logger.warning(f"{missing} embedding ID(s) had no matching faculty record and were excluded from results.")
         return similar_faculty_no_nulls
 
+    def search_documents(self,
+                         query: str = None,
+                         k: int = None,
+                         fields: typing.Iterable[str] = None,
+                         **parameters) -> typing.List[str]:
+        """
+        Search like `search`, but return each result as JSON text, fetched for all results at once.
+        With every field, the precomputed documents are returned, and results without a document yet
+        are hydrated from their record instead. With fewer fields, only the columns and relationships
+        those fields read are loaded, and only those fields are encoded.
+        Requires an app context.
+        :param query: user natural language query
+        :param k: number of faculty profiles to return
+        :param fields: keys of FACULTY_FIELDS to include; all of them by default
+        :param parameters: filters, exact_words and mode, as taken by `search`
+        :return: list of JSON texts, most similar first
+        """
+        similar_embeddings_eids = self.embedding_service.search_similar_embeddings(query=query, top_k=k, **parameters)
+        if fields is not None and set(FACULTY_FIELDS) - set(fields):
+            return self._search_documents_with_fields(similar_embeddings_eids, list(fields))
+
+        documents = self.database_driver.get_search_documents(similar_embeddings_eids)
+
+        results = []
+        missing = 0
+        for eid in similar_embeddings_eids:
+            document = documents.get(eid)
+            if document is None:
+                faculty = self._get_faculty_record(eid)
+                if faculty is None:
+                    missing += 1
+                    continue
+                document = faculty_search_document(faculty)
+            results.append(document)
+        if missing:
+            logger.warning(f"{missing} embedding ID(s) had no matching faculty record and were excluded from results.")
+        return results
+
+    def _search_documents_with_fields(self, eids: typing.List[int], fields: typing.List[str]) -> typing.List[str]:
+        """
+        Encode the given fields of the faculty records of the embedding IDs
+        :param eids: embedding IDs, most similar first
+        :param fields: keys of FACULTY_FIELDS to include
+        :return: list of JSON texts, in the order of `eids`
+        """
+        faculty = self.database_driver.get_faculty_by_embedding_ids(eids, faculty_field_attributes(fields))
+        if len(faculty) < len(set(eids)):
+            missing = len(set(eids)) - len(faculty)
+            logger.warning(f"{missing} embedding ID(s) had no matching faculty record and were excluded from results.")
+        return [faculty_search_document(faculty[eid], fields) for eid in eids if eid in faculty]
+
+    def search_projects(self,
+                        query: str = None,
+                        k: int = None,
+                        activity_code: str = None,
+                        agency_ic_admin: str = None) -> typing.List[AwardMatch]:
+        """
+        Search for the NIH projects and NSF grants most similar to a natural language query.
+        A project listed for several faculty members, e.g. co-PIs, is one result with all of them.
+        :param query: user natural language query
+        :param k: number of projects and grants to return
+        :param activity_code: activity code
+        :param agency_ic_admin: agency ic admin name
+        :return: list of AwardMatch, most similar first
+        """
+        # Each faculty member listing a project has its own vector of it, so fetch extra candidates
+        matches = self.embedding_service.search_similar_awards(
+            query=query,
+            top_k=k * EMBEDDING_INDEX_CONFIG["CANDIDATES_PER_RESULT"],
+            activity_code=activity_code,
+            agency_ic_admin=agency_ic_admin,
+        )
+        awards = self.database_driver.get_awards_by_vector_ids([vector_id for vector_id, _ in matches])
+
+        results = {}
+        for vector_id, score in matches:
+            if vector_id not in awards:
+                continue
+            kind, award, faculty = awards[vector_id]
+            key = (kind, award.project_number if kind == PROJECT_VECTOR else award.nsf_id)
+            if key in results:
+                if all(listed.faculty_id != faculty.faculty_id for listed in results[key].faculty):
+                    results[key].faculty.append(faculty)
+            elif len(results) < k:
+                results[key] = AwardMatch(kind=kind, award=award, score=score, faculty=[faculty])
+        return list(results.values())
+
     def _get_faculty_record(self, eid: int) -> "Faculty":
         """
         Get faculty record by embedding id
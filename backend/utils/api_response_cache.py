@@ -0,0 +1,157 @@
+import os
+import json
+import time
+import zlib
+import sqlite3
+import hashlib
+import logging
+import threading
+import collections
+import typing
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_payload(payload: typing.Any) -> typing.Any:
+    """
+    Canonical form of a request payload for cache keys: keys are sorted, strings are stripped,
+    and keys whose value is None or an empty string are dropped. List order is kept because it
+    can change paging. Payloads that differ only in formatting therefore share a cache entry.
+    :param payload: JSON-serializable request body or query parameters
+    :return: normalized copy of the payload
+    """
+    if isinstance(payload, dict):
+        normalized = {}
+        for key in sorted(payload, key=str):
+            value = normalize_payload(payload[key])
+            if value is not None and value != "":
+                normalized[str(key)] = value
+        return normalized
+    if isinstance(payload, (list, tuple)):
+        return [normalize_payload(value) for value in payload]
+    if isinstance(payload, str):
+        return payload.strip()
+    return payload
+
+
+class ApiResponseCache:
+    def __init__(self, path: str, ttl_seconds: typing.Dict[str, float], default_ttl_seconds: float = 24 * 3600):
+        """
+        Durable cache of decoded JSON API responses, shared by every script that calls the funding
+        APIs. Entries are keyed by endpoint and normalized payload, stored zlib-compressed in SQLite,
+        and expire after the endpoint's TTL.
+        :param path: SQLite file holding the cache
+        :param ttl_seconds: time to live in seconds per endpoint name; 0 disables caching for it
+        :param default_ttl_seconds: time to live for endpoints missing from `ttl_seconds`
+        """
+        self.path = path
+        self.ttl_seconds = dict(ttl_seconds)
+        self.default_ttl_seconds = default_ttl_seconds
+        self.metrics: collections.Counter = collections.Counter()
+        self._lock = threading.Lock()
+        self._connection = None
+
+    def open(self) -> "ApiResponseCache":
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._connection = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript("""
+            CREATE TABLE IF NOT EXISTS responses (
+                cache_key TEXT PRIMARY KEY,
+                endpoint TEXT NOT NULL,
+                stored_at REAL NOT NULL,
+                body BLOB NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS ix_responses_endpoint_stored_at ON responses (endpoint, stored_at);
+        """)
+        self._connection.commit()
+        return self
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _ttl(self, endpoint: str) -> float:
+        return self.ttl_seconds.get(endpoint, self.default_ttl_seconds)
+
+    @staticmethod
+    def cache_key(endpoint: str, payload: typing.Any) -> str:
+        canonical = json.dumps(normalize_payload(payload), sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(f"{endpoint}\n{canonical}".encode("utf-8")).hexdigest()
+
+    def get(self, endpoint: str, payload: typing.Any) -> typing.Optional[typing.Any]:
+        """
+        :param endpoint: endpoint name, as used in the TTL configuration
+        :param payload: request payload or query parameters
+        :return: cached response, or None if missing or expired
+        """
+        ttl = self._ttl(endpoint)
+        if ttl <= 0:
+            return None
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT stored_at, body FROM responses WHERE cache_key = ?",
+                (self.cache_key(endpoint, payload),),
+            ).fetchone()
+            if row is None or time.time() - row[0] > ttl:
+                self.metrics["misses"] += 1
+                return None
+            self.metrics["hits"] += 1
+        return json.loads(zlib.decompress(row[1]))
+
+    def set(self, endpoint: str, payload: typing.Any, response: typing.Any):
+        """
+        :param endpoint: endpoint name, as used in the TTL configuration
+        :param payload: request payload or query parameters
+        :param response: decoded JSON response
+        """
+        if self._ttl(endpoint) <= 0:
+            return
+        body = zlib.compress(json.dumps(response, separators=(",", ":")).encode("utf-8"))
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (cache_key, endpoint, stored_at, body) VALUES (?, ?, ?, ?)",
+                (self.cache_key(endpoint, payload), endpoint, time.time(), body),
+            )
+            self._connection.commit()
+            self.metrics["writes"] += 1
+
+    def get_or_fetch(self, endpoint: str, payload: typing.Any, fetch: typing.Callable[[], typing.Any]) -> typing.Any:
+        """
+        Return the cached response, or call `fetch` and cache what it returns.
+        :param endpoint: endpoint name, as used in the TTL configuration
+        :param payload: request payload or query parameters
+        :param fetch: performs the request and returns the decoded JSON response
+        :return: decoded JSON response
+        """
+        response = self.get(endpoint, payload)
+        if response is None:
+            response = fetch()
+            self.set(endpoint, payload, response)
+        return response
+
+    def purge_expired(self) -> int:
+        """
+        Delete expired entries.
+        :return: number of entries deleted
+        """
+        now = time.time()
+        deleted = 0
+        with self._lock:
+            endpoints = [row[0] for row in self._connection.execute("SELECT DISTINCT endpoint FROM responses")]
+            for endpoint in endpoints:
+                cursor = self._connection.execute(
+                    "DELETE FROM responses WHERE endpoint = ? AND stored_at < ?",
+                    (endpoint, now - self._ttl(endpoint)),
+                )
+                deleted += cursor.rowcount
+            self._connection.commit()
+        return deleted
+
+    def get_stats(self) -> typing.Dict[str, int]:
+        """
+        :return: hits, misses and writes since the cache was opened
+        """
+        with self._lock:
+            return {name: self.metrics[name] for name in ("hits", "misses", "writes")}
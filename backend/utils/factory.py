@@ -29,4 +29,27 @@ def get_search_service(app: "Flask"):
     from backend.services.search.search_service import SearchService
     embedding_service = get_embedding_service(app)
     database_driver = embedding_service.embedding_storage.database_driver
-    return SearchService(database_driver, embedding_service)
\ No newline at end of file
+    return SearchService(database_driver, embedding_service)
+
+def get_funding_api_cache():
+    from backend.core.populate_config import FUNDING_API_CACHE
+    from backend.utils.api_response_cache import ApiResponseCache
+    return ApiResponseCache(FUNDING_API_CACHE["PATH"], FUNDING_API_CACHE["TTL_SECONDS"]).open()
+
+def get_nih_reporter_proxy(http_client: "HttpClient", response_cache: "ApiResponseCache" = None):
+    from backend.services.nih.nih_reporter_proxy import NIHReporterProxy
+    return NIHReporterProxy(http_client, response_cache=response_cache)
+
+def get_nsf_proxy(http_client: "HttpClient", response_cache: "ApiResponseCache" = None):
+    from backend.services.nsf.nsf_proxy import NSFProxy
+    return NSFProxy(http_client, response_cache=response_cache)
+
+def get_harvest_service(http_client: "HttpClient", response_cache: "ApiResponseCache" = None):
+    from backend.core.populate_config import HARVEST_CONFIG
+    from backend.services.harvest.harvest_service import HarvestService
+    from backend.services.harvest.harvest_store import HarvestStore
+    return HarvestService(
+        nih_proxy=get_nih_reporter_proxy(http_client, response_cache),
+        nsf_proxy=get_nsf_proxy(http_client, response_cache),
+        store=HarvestStore(HARVEST_CONFIG["PATH"]).open(),
+    )
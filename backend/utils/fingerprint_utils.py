@@ -0,0 +1,58 @@
+import json
+import typing
+import hashlib
+from backend.core.populate_config import PROFILE_DOCUMENT_CONFIG, EMBEDDING_INDEX_CONFIG
+
+
+def _serialize_value(value: typing.Any) -> typing.Any:
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+def compute_faculty_fingerprint(faculty: "Faculty") -> str:
+    """
+    Compute a stable content hash of a faculty member's scraped profile and enrichment results.
+    Projects and grants are sorted so that API result order does not change the fingerprint.
+    School and department are left out: they are merged across departments after the faculty
+    member is written, and are compared and updated separately. The profile document version and
+    the multi-vector setting are included so that a change to what is embedded re-embeds every
+    faculty member.
+    :param faculty: Faculty model object
+    :return: hex SHA-256 digest
+    """
+    projects = sorted(
+        (
+            [_serialize_value(value) for value in (
+                project.project_number,
+                project.abstract,
+                project.relevant_terms,
+                project.start_date,
+                project.end_date,
+                project.agency_ic_admin,
+                project.activity_code,
+            )]
+            for project in faculty.projects
+        ),
+        key=lambda project: [str(value) for value in project],
+    )
+    grants = sorted(
+        (
+            [_serialize_value(value) for value in (grant.nsf_id, grant.date, grant.start_date, grant.title)]
+            for grant in faculty.grants
+        ),
+        key=lambda grant: [str(value) for value in grant],
+    )
+    document = {
+        "name": faculty.name,
+        "about": faculty.about,
+        "email": faculty.email,
+        "profile_url": faculty.profile_url,
+        "has_funding": faculty.has_funding,
+        "projects": projects,
+        "grants": grants,
+        "document_version": PROFILE_DOCUMENT_CONFIG["VERSION"],
+        "multi_vector": EMBEDDING_INDEX_CONFIG["MULTI_VECTOR"],
+    }
+    encoded = json.dumps(document, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
@@ -1,10 +1,14 @@
 import requests
 import logging
+import threading
+import time
 import typing
+import collections
 import urllib.parse
 import urllib.robotparser
-from requests.exceptions import RequestException, Timeout, HTTPError
+from requests.exceptions import RequestException, Timeout, ConnectionError
 from backend.utils.institution_utils import InstitutionUtils
+from backend.utils.retry_policy import RetryPolicy, CircuitBreaker, CircuitOpenError
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +19,9 @@ class HttpClient:
         retries: int = 3,
         user_agent: str = 'uvarc-dac-foi',
         respect_robots_txt: bool = True,
+        retry_policy: RetryPolicy | None = None,
+        breaker_failure_threshold: int = 5,
+        breaker_reset_timeout: float = 60.0,
     ):
         """
         Initializes the HTTP client facade.
@@ -22,11 +29,49 @@ class HttpClient:
         :param retries (int): Number of retries for transient errors.
         :param user_agent: User agent to use when evaluating robots.txt rules.
         :param respect_robots_txt: Whether to block requests disallowed by robots.txt.
+        :param retry_policy: Backoff and retryable-status policy; defaults to RetryPolicy().
+        :param breaker_failure_threshold: Consecutive transient failures before a host's circuit opens.
+        :param breaker_reset_timeout: Seconds an open circuit waits before letting a trial request through.
         """
         self.timeout = timeout
         self.retries = retries
         self.user_agent = user_agent
         self.respect_robots_txt = respect_robots_txt
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.breaker_failure_threshold = breaker_failure_threshold
+        self.breaker_reset_timeout = breaker_reset_timeout
+        self.metrics: collections.Counter = collections.Counter()
+        self._circuit_breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def _record_metric(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self.metrics[name] += value
+
+    def get_metrics(self) -> dict[str, typing.Any]:
+        """
+        Snapshot of request, retry and circuit breaker counters.
+        :return: dictionary of counters plus the current breaker state per host
+        """
+        with self._lock:
+            metrics = dict(self.metrics)
+            metrics["circuit_breakers"] = {
+                host: breaker.state for host, breaker in self._circuit_breakers.items()
+            }
+        return metrics
+
+    def _get_circuit_breaker(self, url: str) -> CircuitBreaker:
+        host = urllib.parse.urlparse(url).netloc
+        with self._lock:
+            if host not in self._circuit_breakers:
+                self._circuit_breakers[host] = CircuitBreaker(
+                    failure_threshold=self.breaker_failure_threshold,
+                    reset_timeout=self.breaker_reset_timeout,
+                )
+            return self._circuit_breakers[host]
+
+    def _sleep(self, seconds: float) -> None:
+        time.sleep(seconds)
 
     def _robots_url_for(self, url: str) -> str:
         parsed_url = urllib.parse.urlparse(url)
@@ -188,13 +233,17 @@ class HttpClient:
 
     def request(self, method: str, url: str, **kwargs: typing.Any) -> requests.Response | None:
         """
-        Makes an HTTP request with retries.
+        Makes an HTTP request, retrying timeouts, connection errors and retryable statuses
+        (see RetryPolicy) with exponential backoff or the server's Retry-After delay.
+        Non-transient 4xx responses are raised immediately. Requests to a host whose
+        circuit breaker is open fail fast without touching the network.
         :param method: HTTP method (e.g., 'GET', 'POST', 'PUT', 'DELETE').
         :param url: API endpoint (relative or absolute URL).
         :param kwargs: Additional arguments to pass to `requests.request`, such as `json`, `headers`, or `params`.
         :return requests.Response: The HTTP response object.
         :raise HTTPError: For non-2xx HTTP responses.
         :raise Timeout: If the request times out.
+        :raise CircuitOpenError: If the host's circuit breaker is open.
         :raise RequestException: For other types of request errors.
         """
         if not InstitutionUtils.is_valid_url(url):
@@ -204,20 +253,68 @@ class HttpClient:
         kwargs["headers"] = headers
         self._ensure_robots_txt_allows(url, headers=headers)
 
+        breaker = self._get_circuit_breaker(url)
         for attempt in range(self.retries):
+            if not breaker.allow_request():
+                self._record_metric("breaker_rejected")
+                raise CircuitOpenError(f"Circuit open for {url}; failing fast")
+
+            is_last_attempt = attempt == self.retries - 1
+            self._record_metric("requests")
             try:
                 logger.info(f"Making {method} request to {url} (attempt {attempt + 1}/{self.retries})")
                 response = self._send_request(method, url, **kwargs)
                 self._log_response(response, url)
-                response.raise_for_status()
-                return response
-            except (Timeout, HTTPError) as e:
+            except (Timeout, ConnectionError) as e:
+                opened = self._record_failure(breaker, url)
                 logger.warning(f"Attempt {attempt + 1} of {self.retries} failed for {url}: {e}")
-                if attempt == self.retries - 1:
+                # Once the breaker is open the next attempt would fail fast, so waiting for it is pointless
+                if is_last_attempt or opened:
                     raise
+                self._wait_before_retry(attempt, url)
+                continue
             except RequestException as e:
+                breaker.release_trial()
                 logger.error(f"Request error for {url}: {e}")
                 raise
+            except Exception:
+                breaker.release_trial()
+                raise
+
+            if not self.retry_policy.is_retryable_status(response.status_code):
+                # The host answered, so it is up even if the answer is a non-transient 4xx
+                if breaker.record_success():
+                    self._record_metric("breaker_closed")
+                    logger.info(f"Circuit closed for {url}")
+                response.raise_for_status()
+                return response
+
+            opened = self._record_failure(breaker, url)
+            logger.warning(
+                f"Attempt {attempt + 1} of {self.retries} failed for {url}: HTTP {response.status_code}"
+            )
+            if is_last_attempt or opened:
+                response.raise_for_status()
+            self._wait_before_retry(attempt, url, response.headers.get("Retry-After"))
+
+    def _record_failure(self, breaker: CircuitBreaker, url: str) -> bool:
+        """
+        :return: True if this failure opened the host's circuit breaker
+        """
+        self._record_metric("transient_failures")
+        if breaker.record_failure():
+            self._record_metric("breaker_opened")
+            logger.error(f"Circuit opened for {url} after {breaker.consecutive_failures} consecutive failures")
+            return True
+        return False
+
+    def _wait_before_retry(self, attempt: int, url: str, retry_after: str | None = None) -> None:
+        delay, used_retry_after = self.retry_policy.get_delay(attempt, retry_after)
+        self._record_metric("retries")
+        if used_retry_after:
+            self._record_metric("retry_after_honored")
+        logger.info(f"Retrying {url} in {delay:.2f}s")
+        self._sleep(delay)
 
     def get(self, url: str, **kwargs: typing.Any) -> requests.Response:
         """
@@ -17,6 +17,7 @@ class HttpClientCached(HttpClient):
         cache_name: str = 'instance/http_cache',
         backend: str = 'sqlite',
         expire_after: int = 30,
+        revalidate: bool = False,
         user_agent: str = 'uvarc-dac-foi',
         respect_robots_txt: bool = True,
         **kwargs: typing.Any,
@@ -25,7 +26,10 @@ class HttpClientCached(HttpClient):
         Initialize the cached HTTP client.
         :param cache_name: Name of the cache file or database.
         :param backend: Backend for requests-cache (e.g., 'sqlite', 'memory', 'redis').
-        :param expire_after: Time in seconds after which cached responses expire.
+        :param expire_after: Time in seconds after which cached responses expire. Ignored when revalidate is True.
+        :param revalidate: Long-lived cache mode. Responses carrying an ETag or Last-Modified header are kept
+            indefinitely and revalidated on every request with If-None-Match / If-Modified-Since; a 304 is
+            served from the cache. Responses without validators are always fetched in full.
         :param user_agent: User agent to use when evaluating robots.txt rules.
         :param respect_robots_txt: Whether to block requests disallowed by robots.txt.
         :param kwargs: Additional arguments for the base HttpClient.
@@ -38,7 +42,7 @@ class HttpClientCached(HttpClient):
         self.session = requests_cache.CachedSession(
             cache_name=cache_name,
             backend=backend,
-            expire_after=expire_after,
+            expire_after=requests_cache.EXPIRE_IMMEDIATELY if revalidate else expire_after,
             allowable_codes=(200,),
         )
         self.session.headers.update({"User-Agent": user_agent})
@@ -54,7 +58,37 @@ class HttpClientCached(HttpClient):
         return self.session.request(method, url, timeout=self.timeout, **kwargs)
 
     def _log_response(self, response: requests.Response, url: str) -> None:
-        if getattr(response, "from_cache", False):
+        if getattr(response, "revalidated", False):
+            self._record_metric("cache_revalidated")
+            logger.info(f"Revalidated cached response for {url} (304 Not Modified)")
+        elif getattr(response, "from_cache", False):
+            self._record_metric("cache_fresh")
             logger.info(f"Using cached response for {url}")
+        elif self._is_conditional_request(response):
+            self._record_metric("cache_changed")
+            logger.info(f"Fetched changed response for {url}")
         else:
+            self._record_metric("cache_new")
             logger.info(f"Fetched live response for {url}")
+
+    @staticmethod
+    def _is_conditional_request(response: requests.Response) -> bool:
+        request = getattr(response, "request", None)
+        if request is None:
+            return False
+        return "If-None-Match" in request.headers or "If-Modified-Since" in request.headers
+
+    def get_cache_stats(self) -> typing.Dict[str, int]:
+        """
+        Per-run cache outcome counts.
+        revalidated: 304 responses served from the cache
+        fresh: cached responses that had not expired yet and needed no request
+        changed: full downloads after a conditional request found the page modified
+        new: full downloads with no cached validator to revalidate against
+        :return: dictionary of counts
+        """
+        with self._lock:
+            return {
+                name: self.metrics[f"cache_{name}"]
+                for name in ("revalidated", "fresh", "changed", "new")
+            }
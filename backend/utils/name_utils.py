@@ -0,0 +1,145 @@
+import re
+import typing
+import unicodedata
+
+HONORIFICS = {"dr", "prof", "professor", "mr", "mrs", "ms", "miss", "mx"}
+
+SUFFIXES = {
+    "jr", "sr", "ii", "iii", "iv", "v",
+    "phd", "md", "do", "dds", "dmd", "dvm", "pharmd", "jd", "edd", "dnp", "dph", "drph", "scd",
+    "ms", "msc", "msn", "mph", "mba", "mpp", "ma", "mfa", "bs", "ba", "bsn",
+    "rn", "np", "aprn", "cnm", "crnp", "fnp", "faan", "facp", "facs", "pe", "cpa",
+}
+
+# Lowercase surname particles that belong to the last name ("Jan van der Berg")
+PARTICLES = {"van", "von", "der", "den", "de", "del", "della", "da", "di", "du", "la", "le", "st"}
+
+_PARENTHETICAL = re.compile(r"\([^)]*\)|\"[^\"]*\"")
+_NON_NAME_CHARACTERS = re.compile(r"[^\w\s,-]")
+
+
+class ParsedName(typing.NamedTuple):
+    first: str
+    middle: str
+    last: str
+
+    @property
+    def key(self) -> typing.Tuple[str, str]:
+        """Case-insensitive (first, last) key; middle names, initials and surname particles are ignored."""
+        return _key(self.first, self.last)
+
+
+def strip_diacritics(text: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(character for character in decomposed if not unicodedata.combining(character))
+
+
+def _tokens(text: str) -> typing.List[str]:
+    """Split on whitespace after dropping punctuation, keeping hyphenated names whole."""
+    text = _NON_NAME_CHARACTERS.sub("", strip_diacritics(text).replace(".", " "))
+    return [token for token in text.replace(",", " ").split() if token.strip("-")]
+
+
+def _is_suffix(token: str) -> bool:
+    return token.lower() in SUFFIXES
+
+
+def _strip_suffixes(tokens: typing.List[str], keep: int = 1) -> typing.List[str]:
+    """Drop trailing suffixes, but never below `keep` tokens (e.g. the surname in "Jane Do")."""
+    tokens = list(tokens)
+    while len(tokens) > keep and _is_suffix(tokens[-1]):
+        tokens.pop()
+    return tokens
+
+
+def _strip_honorifics(tokens: typing.List[str]) -> typing.List[str]:
+    tokens = list(tokens)
+    while len(tokens) > 1 and tokens[0].lower() in HONORIFICS:
+        tokens.pop(0)
+    return tokens
+
+
+def _key(first_name: str, last_name: str) -> typing.Tuple[str, str]:
+    first_tokens = first_name.split()
+    last_tokens = last_name.split()
+    return (
+        first_tokens[0].lower() if first_tokens else "",
+        last_tokens[-1].lower() if last_tokens else "",
+    )
+
+
+def parse_name(raw_name: str) -> ParsedName:
+    """
+    Parse a display name into first, middle and last names.
+    Handles "First M. Last", "Last, First M." (SOM), honorifics ("Dr."), suffixes and credentials
+    ("Jr.", "PhD, RN"), surname particles ("van der"), nicknames in parentheses or quotes, and
+    diacritics, which are removed. Case is preserved; compare names with ParsedName.key.
+    :param raw_name: name as scraped or returned by an API
+    :return: parsed name; components are empty strings when missing
+    """
+    text = _PARENTHETICAL.sub(" ", raw_name or "")
+    segments = [segment for segment in text.split(",") if _tokens(segment)]
+    trailing = _tokens(",".join(segments[1:]))
+
+    # "Last, First Middle" unless everything after the first comma is suffixes ("Jane Doe, PhD, RN")
+    if trailing and not all(_is_suffix(token) for token in trailing):
+        last_tokens = _strip_suffixes(_tokens(segments[0]))
+        given_tokens = _strip_honorifics(_strip_suffixes(trailing))
+    else:
+        tokens = _strip_suffixes(_strip_honorifics(_tokens(segments[0]) if segments else []), keep=2)
+        split_at = len(tokens) - 1
+        while split_at > 1 and tokens[split_at - 1].lower() in PARTICLES:
+            split_at -= 1
+        given_tokens, last_tokens = tokens[:split_at], tokens[split_at:]
+
+    if not given_tokens:
+        return ParsedName("", "", " ".join(last_tokens))
+    return ParsedName(given_tokens[0], " ".join(given_tokens[1:]), " ".join(last_tokens))
+
+
+def name_key(first_name: str, last_name: str) -> typing.Tuple[str, str]:
+    """
+    Key for a name given as separate first and last names, e.g. by NIH RePORTER or NSF.
+    Matches ParsedName.key of the same person's display name.
+    :param first_name: first name, possibly followed by middle names or initials
+    :param last_name: last name, possibly with particles or followed by a suffix
+    :return: case-insensitive (first, last) key
+    """
+    return _key(
+        " ".join(_strip_honorifics(_tokens(first_name or ""))),
+        " ".join(_strip_suffixes(_tokens(last_name or ""))),
+    )
+
+
+class NameIndex:
+    def __init__(self):
+        """
+        Hash index from normalized (first, last) names to the records naming that person.
+        A record is listed at most once per name.
+        """
+        self._records: typing.Dict[typing.Tuple[str, str], typing.List[typing.Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def add(self, key: typing.Tuple[str, str], record: typing.Any):
+        """
+        :param key: name key from name_key or ParsedName.key
+        :param record: record to list under the name
+        """
+        records = self._records.setdefault(key, [])
+        if not any(existing is record for existing in records):
+            records.append(record)
+
+    def add_name(self, raw_name: str, record: typing.Any):
+        self.add(parse_name(raw_name).key, record)
+
+    def get(self, key: typing.Tuple[str, str]) -> typing.List[typing.Any]:
+        return self._records.get(key, [])
+
+    def lookup(self, raw_name: str) -> typing.List[typing.Any]:
+        """
+        :param raw_name: display name, in any format parse_name accepts
+        :return: records listed under the name
+        """
+        return self.get(parse_name(raw_name).key)
@@ -0,0 +1,156 @@
+import random
+import threading
+import time
+import typing
+import logging
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from requests.exceptions import RequestException
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(RequestException):
+    """Raised when a request is short-circuited because its host's breaker is open."""
+
+
+class RetryPolicy:
+    RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+    def __init__(
+        self,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        jitter: bool = True,
+        retryable_status_codes: typing.Iterable[int] = RETRYABLE_STATUS_CODES,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 120.0,
+    ):
+        """
+        Decides which failures are retried and how long to wait between attempts.
+        :param backoff_base: delay in seconds before the first retry; doubled on each later attempt
+        :param backoff_max: upper bound in seconds for a single backoff delay
+        :param jitter: if True, use "full jitter" (uniform between 0 and the exponential delay)
+        :param retryable_status_codes: HTTP status codes treated as transient
+        :param respect_retry_after: whether to honor the server's Retry-After header
+        :param max_retry_after: upper bound in seconds for a Retry-After delay
+        """
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.retryable_status_codes = frozenset(retryable_status_codes)
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+
+    def is_retryable_status(self, status_code: int) -> bool:
+        return status_code in self.retryable_status_codes
+
+    def get_backoff_delay(self, attempt: int) -> float:
+        """
+        Exponential backoff delay for the given (zero-based) attempt.
+        :param attempt: index of the attempt that just failed
+        :return: delay in seconds
+        """
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        if self.jitter:
+            return random.uniform(0, delay)
+        return delay
+
+    def get_delay(self, attempt: int, retry_after: str | None = None) -> tuple[float, bool]:
+        """
+        Delay before the next attempt, preferring the server's Retry-After header when present.
+        :param attempt: index of the attempt that just failed
+        :param retry_after: raw Retry-After header value, if any
+        :return: (delay in seconds, whether Retry-After was used)
+        """
+        if self.respect_retry_after and retry_after:
+            parsed = self.parse_retry_after(retry_after)
+            if parsed is not None:
+                return min(parsed, self.max_retry_after), True
+        return self.get_backoff_delay(attempt), False
+
+    @staticmethod
+    def parse_retry_after(value: str) -> float | None:
+        """
+        Parse a Retry-After header given either as delta-seconds or as an HTTP date.
+        :param value: header value
+        :return: delay in seconds, or None if the value is malformed
+        """
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            logger.warning(f"Ignoring malformed Retry-After header: {value}")
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0):
+        """
+        Per-host circuit breaker. After `failure_threshold` consecutive transient failures the
+        breaker opens and requests fail fast; after `reset_timeout` seconds a single trial
+        request is let through (half-open) and its outcome closes or re-opens the breaker.
+        :param failure_threshold: consecutive failures before opening
+        :param reset_timeout: seconds to stay open before allowing a trial request
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._trial_in_flight = False
+            if self.state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> bool:
+        """
+        :return: True if this success closed a previously open breaker
+        """
+        with self._lock:
+            was_open = self.state != self.CLOSED
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+            self._trial_in_flight = False
+            return was_open
+
+    def release_trial(self):
+        """
+        End a half-open trial that failed for a reason saying nothing about the host's health, e.g. a
+        malformed response body, so the next request can be let through as a new trial.
+        """
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self) -> bool:
+        """
+        :return: True if this failure opened the breaker
+        """
+        with self._lock:
+            self.consecutive_failures += 1
+            self._trial_in_flight = False
+            if self.state == self.HALF_OPEN or (
+                    self.state == self.CLOSED and self.consecutive_failures >= self.failure_threshold):
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                return True
+            return False
@@ -0,0 +1,102 @@
+import typing
+from flask import current_app
+
+
+def serialize_project(project: "Project") -> typing.Dict:
+    """
+    Unpack Project into JSON
+    :param project: Project
+    :return: JSON
+    """
+    return {
+        "project_number": project.project_number,
+        "abstract": project.abstract,
+        "relevant_terms": project.relevant_terms,
+        "start_date": project.start_date,
+        "end_date": project.end_date,
+        "agency_ic_admin": project.agency_ic_admin,
+        "activity_code": project.activity_code,
+    }
+
+
+def serialize_grant(grant: "Grant") -> typing.Dict:
+    """
+    Unpack Grant into JSON
+    :param grant: Grant
+    :return: JSON
+    """
+    return {
+        "nsf_id": grant.nsf_id,
+        "date": grant.date,
+        "start_date": grant.start_date,
+        "title": grant.title,
+    }
+
+
+# Top-level keys of a serialized faculty member, in the order they are emitted, with the Faculty
+# attributes each one reads. Serializing a subset of the keys only touches the attributes they list,
+# so records loaded with just those attributes can be serialized.
+FACULTY_FIELDS = {
+    "name": ("name",),
+    "school": ("school",),
+    "schools": ("schools",),
+    "department": ("departments",),
+    "about": ("about",),
+    "emails": ("email",),
+    "profile_url": ("profile_url",),
+    "has_funding": ("has_funding",),
+    "projects": ("projects",),
+    "grants": ("grants",),
+}
+
+# Named sets of fields for the `view` parameter of faculty search; the summary is what a result list shows
+FACULTY_VIEWS = {
+    "full": tuple(FACULTY_FIELDS),
+    "summary": ("name", "school", "schools", "department", "about", "emails", "profile_url", "has_funding"),
+}
+
+_FACULTY_FIELD_SERIALIZERS = {
+    "name": lambda faculty: faculty.name,
+    "school": lambda faculty: faculty.school,
+    "schools": lambda faculty: [school.name for school in faculty.schools],
+    "department": lambda faculty: [department.name for department in faculty.departments],
+    "about": lambda faculty: faculty.about,
+    "emails": lambda faculty: faculty.email.split(",") if faculty.email else [],
+    "profile_url": lambda faculty: faculty.profile_url,
+    "has_funding": lambda faculty: faculty.has_funding,
+    # "grant_ids": lambda faculty: faculty.grant_ids.split(",") if faculty.grant_ids else [],
+    "projects": lambda faculty: [serialize_project(project) for project in faculty.projects],
+    "grants": lambda faculty: [serialize_grant(grant) for grant in faculty.grants],
+}
+
+
+def faculty_field_attributes(fields: typing.Iterable[str]) -> typing.List[str]:
+    """
+    :param fields: keys of FACULTY_FIELDS
+    :return: Faculty attributes read to serialize those keys
+    """
+    fields = set(fields)
+    return [attribute for field, attributes in FACULTY_FIELDS.items() if field in fields for attribute in attributes]
+
+
+def serialize_faculty(faculty: "Faculty", fields: typing.Iterable[str] = None) -> typing.Dict:
+    """
+    Unpack Faculty into JSON
+    :param faculty: Faculty
+    :param fields: keys of FACULTY_FIELDS to include; all of them by default
+    :return: JSON
+    """
+    fields = FACULTY_FIELDS if fields is None else set(fields)
+    return {field: serialize(faculty) for field, serialize in _FACULTY_FIELD_SERIALIZERS.items() if field in fields}
+
+
+def faculty_search_document(faculty: "Faculty", fields: typing.Iterable[str] = None) -> str:
+    """
+    Encode a faculty member as it appears in search results, with the app's JSON provider and the
+    compact separators of its responses, so the text can be embedded in a response unchanged.
+    Requires an app context.
+    :param faculty: Faculty
+    :param fields: keys of FACULTY_FIELDS to include; all of them by default
+    :return: JSON text
+    """
+    return current_app.json.dumps(serialize_faculty(faculty, fields), separators=(",", ":"))
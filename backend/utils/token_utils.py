@@ -1,15 +1,36 @@
+import functools
 import tiktoken
 import typing
 from backend.core.populate_config import OPENAI_CONFIG
 
+@functools.lru_cache(maxsize=None)
+def get_tokenizer(model: str = OPENAI_CONFIG["EMBEDDING_MODEL"]) -> tiktoken.Encoding:
+    """
+    Tokenizer of the embedding model, loaded once per process.
+    :param model: embedding model name
+    :return: tiktoken encoding
+    """
+    return tiktoken.encoding_for_model(model)
+
 def count_tokens(text: str) -> int:
     """
     Calculate the number of tokens in the text for embedding model.
     :param text: input text
     :return: token count
     """
-    tokenizer = tiktoken.encoding_for_model(OPENAI_CONFIG["EMBEDDING_MODEL"])
-    return len(tokenizer.encode(text))
+    return len(get_tokenizer().encode(text))
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Cut text to at most `max_tokens` tokens of the embedding model.
+    :param text: input text
+    :param max_tokens: token limit
+    :return: the text itself if it fits, otherwise its first `max_tokens` tokens
+    """
+    tokens = get_tokenizer().encode(text)
+    if len(tokens) <= max_tokens:
+        return text
+    return get_tokenizer().decode(tokens[:max(max_tokens, 0)])
 
 def chunk_text(text: str) -> typing.List[str]:
     """
@@ -31,4 +52,4 @@ def chunk_text(text: str) -> typing.List[str]:
         current_length += word_length + 1
     if current_chunk:
         chunks.append(" ".join(current_chunk))
-    return chunks
\ No newline at end of file
+    return chunks
@@ -1,6 +1,8 @@
 import typing
 import logging
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app
+from backend.services.embedding.embedding_service import SEARCH_MODES
+from backend.utils.serialization_utils import FACULTY_FIELDS, FACULTY_VIEWS, serialize_project, serialize_grant
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +16,13 @@ def create_search_blueprint(search_service: "SearchService"):
         """
         return search(search_service)
 
+    @search_bp.route("/projects/search", methods=["GET"])
+    def search_projects_route():
+        """
+        API endpoint for NIH project and NSF grant search
+        """
+        return search_projects(search_service)
+
     return search_bp
 
 
@@ -30,11 +39,24 @@ def search(search_service: "SearchService"):
     agency_ic_admin = request.args.get("agency_ic_admin", None)
     has_funding = request.args.get("has_funding", None) is not None
     exact_words = request.args.get("exact_words", None) is not None
+    mode = request.args.get("mode", "vector")
+    if mode not in SEARCH_MODES:
+        return jsonify({"error": f"mode must be one of {', '.join(SEARCH_MODES)}"}), 400
+    # fields lists the keys of each result to include, and takes precedence over view
+    view = request.args.get("view", "full")
+    if view not in FACULTY_VIEWS:
+        return jsonify({"error": f"view must be one of {', '.join(FACULTY_VIEWS)}"}), 400
+    fields = FACULTY_VIEWS[view]
+    if request.args.get("fields"):
+        fields = [field.strip() for field in request.args["fields"].split(",") if field.strip()]
+        unknown = [field for field in fields if field not in FACULTY_FIELDS]
+        if unknown or not fields:
+            return jsonify({"error": f"fields must be a comma-separated list of {', '.join(FACULTY_FIELDS)}"}), 400
 
     logging.info(f"Search query: {query}\nLimit: {limit}\nSchool: {school}\nDepartment: {department}\nActivity Code: \
-{activity_code}\nAgency IC Admin: {agency_ic_admin}\n Has Funding: {has_funding}")
+{activity_code}\nAgency IC Admin: {agency_ic_admin}\n Has Funding: {has_funding}\nMode: {mode}\nFields: {', '.join(fields)}")
 
-    results = search_service.search(
+    documents = search_service.search_documents(
         query=query,
         k=limit,
         school=school,
@@ -42,49 +64,63 @@ def search(search_service: "SearchService"):
         activity_code=activity_code,
         agency_ic_admin=agency_ic_admin,
         has_funding=has_funding,
-        exact_words=exact_words
+        exact_words=exact_words,
+        mode=mode,
+        fields=fields
+    )
+
+    # The documents are already JSON, so they are joined into the response rather than re-encoded
+    body = '{"results":[' + ",".join(documents) + ']}\n'
+    return current_app.response_class(body, mimetype=current_app.json.mimetype), 200
+
+
+def search_projects(search_service: "SearchService"):
+    """
+    Entry point for project search
+    :param search_service: SearchService instance
+    """
+    query = request.args.get("query")
+    if not query:
+        return jsonify({"error": "query is required"}), 400
+    limit = request.args.get("limit", 10, type=int)
+    activity_code = request.args.get("activity_code", None)
+    agency_ic_admin = request.args.get("agency_ic_admin", None)
+
+    logging.info(f"Project search query: {query}\nLimit: {limit}\nActivity Code: {activity_code}\n\
+Agency IC Admin: {agency_ic_admin}")
+
+    results = search_service.search_projects(
+        query=query,
+        k=limit,
+        activity_code=activity_code,
+        agency_ic_admin=agency_ic_admin,
     )
 
     response = {
-        "results": [serialize_faculty(r) for r in results]
+        "results": [serialize_award_match(r) for r in results]
     }
     return jsonify(response), 200
 
 
-def serialize_faculty(faculty: "Faculty") -> typing.Dict:
+def serialize_award_match(match: "AwardMatch") -> typing.Dict:
     """
-    Unpack Faculty into JSON
-    :param faculty: Faculty
+    Unpack AwardMatch into JSON
+    :param match: AwardMatch
     :return: JSON
     """
     return {
-        "name": faculty.name,
-        "school": faculty.school,
-        "department": faculty.department.split(","),
-        "about": faculty.about,
-        "emails": faculty.email.split(","),
-        "profile_url": faculty.profile_url,
-        "has_funding": faculty.has_funding,
-        # "grant_ids": faculty.grant_ids.split(",") if faculty.grant_ids else [],
-        "projects": [
+        "type": match.kind,
+        "score": round(match.score, 4),
+        **(serialize_project(match.award) if match.kind == "project" else serialize_grant(match.award)),
+        "faculty": [
             {
-                "project_number": project.project_number,
-                "abstract": project.abstract,
-                "relevant_terms": project.relevant_terms,
-                "start_date": project.start_date,
-                "end_date": project.end_date,
-                "agency_ic_admin": project.agency_ic_admin,
-                "activity_code": project.activity_code,
+                "name": faculty.name,
+                "school": faculty.school,
+                "schools": faculty.schools,
+                "department": faculty.departments,
+                "emails": faculty.email.split(",") if faculty.email else [],
+                "profile_url": faculty.profile_url,
             }
-            for project in faculty.projects
+            for faculty in match.faculty
         ],
-        "grants": [
-            {
-                "nsf_id": grant.nsf_id,
-                "date": grant.date,
-                "start_date": grant.start_date,
-                "title": grant.title,
-            }
-            for grant in faculty.grants
-        ]
     }
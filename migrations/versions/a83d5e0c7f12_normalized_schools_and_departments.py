@@ -0,0 +1,117 @@
+"""normalized schools and departments
+
+Revision ID: a83d5e0c7f12
+Revises: f4c18b2e6a73
+Create Date: 2026-10-19 19:02:11.563104
+
+"""
+import re
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a83d5e0c7f12'
+down_revision = 'f4c18b2e6a73'
+branch_labels = None
+depends_on = None
+
+# (lookup table, its key, association table, faculty column) for schools and departments
+AFFILIATIONS = (
+    ('schools', 'school_id', 'faculty_schools', 'school'),
+    ('departments', 'department_id', 'faculty_departments', 'department'),
+)
+
+
+def _split(value):
+    # Names were joined with a bare comma; a comma followed by a space belongs to a name,
+    # as in "Microbiology, Immunology, Cancer Biology"
+    return [name.strip() for name in re.split(r",(?!\s)", value or "") if name.strip()]
+
+
+def upgrade():
+    op.create_table('schools',
+    sa.Column('school_id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.PrimaryKeyConstraint('school_id'),
+    sa.UniqueConstraint('name')
+    )
+    op.create_table('departments',
+    sa.Column('department_id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.PrimaryKeyConstraint('department_id'),
+    sa.UniqueConstraint('name')
+    )
+    op.create_table('faculty_schools',
+    sa.Column('faculty_id', sa.Integer(), nullable=False),
+    sa.Column('school_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['faculty_id'], ['faculty.faculty_id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['school_id'], ['schools.school_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('faculty_id', 'school_id')
+    )
+    with op.batch_alter_table('faculty_schools', schema=None) as batch_op:
+        batch_op.create_index('ix_faculty_schools_school_id', ['school_id', 'faculty_id'], unique=False)
+
+    op.create_table('faculty_departments',
+    sa.Column('faculty_id', sa.Integer(), nullable=False),
+    sa.Column('department_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['department_id'], ['departments.department_id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['faculty_id'], ['faculty.faculty_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('faculty_id', 'department_id')
+    )
+    with op.batch_alter_table('faculty_departments', schema=None) as batch_op:
+        batch_op.create_index('ix_faculty_departments_department_id', ['department_id', 'faculty_id'], unique=False)
+
+    # Split the comma-joined school and department strings into association rows, and keep the
+    # first name of each as the faculty member's primary school and department
+    connection = op.get_bind()
+    faculty = connection.execute(sa.text("SELECT faculty_id, school, department FROM faculty")).all()
+    for table, key, association, column in AFFILIATIONS:
+        names = {row.faculty_id: _split(getattr(row, column)) for row in faculty}
+        distinct_names = sorted({name for row_names in names.values() for name in row_names})
+        if distinct_names:
+            connection.execute(sa.text(f"INSERT INTO {table} (name) VALUES (:name)"),
+                               [{"name": name} for name in distinct_names])
+        ids = dict(connection.execute(sa.text(f"SELECT name, {key} FROM {table}")).all())
+        rows = [
+            {"faculty_id": faculty_id, key: ids[name]}
+            for faculty_id, row_names in names.items()
+            for name in dict.fromkeys(row_names)
+        ]
+        if rows:
+            connection.execute(sa.text(f"INSERT INTO {association} (faculty_id, {key}) VALUES (:faculty_id, :{key})"),
+                               rows)
+        primary = [
+            {"faculty_id": faculty_id, "name": row_names[0]}
+            for faculty_id, row_names in names.items()
+            if len(row_names) > 1
+        ]
+        if primary:
+            connection.execute(sa.text(f"UPDATE faculty SET {column} = :name WHERE faculty_id = :faculty_id"),
+                               primary)
+
+
+def downgrade():
+    # Restore the comma-joined strings from the association rows
+    connection = op.get_bind()
+    for table, key, association, column in AFFILIATIONS:
+        names = {}
+        for faculty_id, name in connection.execute(sa.text(
+            f"SELECT {association}.faculty_id, {table}.name FROM {association} "
+            f"JOIN {table} ON {table}.{key} = {association}.{key}"
+        )):
+            names.setdefault(faculty_id, []).append(name)
+        rows = [{"faculty_id": faculty_id, "value": ",".join(sorted(row_names))} for faculty_id, row_names in names.items()]
+        if rows:
+            connection.execute(sa.text(f"UPDATE faculty SET {column} = :value WHERE faculty_id = :faculty_id"), rows)
+
+    with op.batch_alter_table('faculty_departments', schema=None) as batch_op:
+        batch_op.drop_index('ix_faculty_departments_department_id')
+
+    op.drop_table('faculty_departments')
+    with op.batch_alter_table('faculty_schools', schema=None) as batch_op:
+        batch_op.drop_index('ix_faculty_schools_school_id')
+
+    op.drop_table('faculty_schools')
+    op.drop_table('departments')
+    op.drop_table('schools')
@@ -0,0 +1,45 @@
+"""indexes for search filters and hydration
+
+Revision ID: b6f2c9d4e310
+Revises: a83d5e0c7f12
+Create Date: 2026-10-19 19:48:36.207541
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b6f2c9d4e310'
+down_revision = 'a83d5e0c7f12'
+branch_labels = None
+depends_on = None
+
+# projects.faculty_id and grants.faculty_id are already served by the unique constraints on
+# (faculty_id, project_number) and (faculty_id, nsf_id), which lead with faculty_id
+
+
+def upgrade():
+    with op.batch_alter_table('faculty', schema=None) as batch_op:
+        batch_op.create_index('ix_faculty_embedding_id', ['embedding_id'], unique=False)
+
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        batch_op.create_index('ix_projects_activity_code_faculty_id', ['activity_code', 'faculty_id'], unique=False)
+        batch_op.create_index('ix_projects_agency_ic_admin_faculty_id', ['agency_ic_admin', 'faculty_id'], unique=False)
+
+    with op.batch_alter_table('embedding_vectors', schema=None) as batch_op:
+        batch_op.create_index('ix_embedding_vectors_faculty_id_kind_source_key', ['faculty_id', 'kind', 'source_key'], unique=False)
+        batch_op.drop_index('ix_embedding_vectors_faculty_id')
+
+
+def downgrade():
+    with op.batch_alter_table('embedding_vectors', schema=None) as batch_op:
+        batch_op.create_index('ix_embedding_vectors_faculty_id', ['faculty_id'], unique=False)
+        batch_op.drop_index('ix_embedding_vectors_faculty_id_kind_source_key')
+
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        batch_op.drop_index('ix_projects_agency_ic_admin_faculty_id')
+        batch_op.drop_index('ix_projects_activity_code_faculty_id')
+
+    with op.batch_alter_table('faculty', schema=None) as batch_op:
+        batch_op.drop_index('ix_faculty_embedding_id')
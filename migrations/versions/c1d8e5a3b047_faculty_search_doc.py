@@ -0,0 +1,37 @@
+"""precomputed faculty search documents
+
+Revision ID: c1d8e5a3b047
+Revises: b6f2c9d4e310
+Create Date: 2026-10-19 20:31:52.880417
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c1d8e5a3b047'
+down_revision = 'b6f2c9d4e310'
+branch_labels = None
+depends_on = None
+
+# Rows are written by the next populate run; until then search results are hydrated from the faculty tables
+
+
+def upgrade():
+    op.create_table('faculty_search_doc',
+    sa.Column('embedding_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('faculty_id', sa.Integer(), nullable=False),
+    sa.Column('document', sa.Text(), nullable=False),
+    sa.ForeignKeyConstraint(['faculty_id'], ['faculty.faculty_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('embedding_id')
+    )
+    with op.batch_alter_table('faculty_search_doc', schema=None) as batch_op:
+        batch_op.create_index('ix_faculty_search_doc_faculty_id', ['faculty_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('faculty_search_doc', schema=None) as batch_op:
+        batch_op.drop_index('ix_faculty_search_doc_faculty_id')
+
+    op.drop_table('faculty_search_doc')
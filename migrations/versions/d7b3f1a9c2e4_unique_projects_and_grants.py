@@ -0,0 +1,44 @@
+"""unique projects and grants per faculty
+
+Revision ID: d7b3f1a9c2e4
+Revises: c51f0e2a9d47
+Create Date: 2026-10-19 14:05:11.402857
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd7b3f1a9c2e4'
+down_revision = 'c51f0e2a9d47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Keep the most recently written row of each duplicate group
+    op.execute("""
+        DELETE FROM projects WHERE project_id NOT IN (
+            SELECT MAX(project_id) FROM projects GROUP BY faculty_id, project_number
+        )
+    """)
+    op.execute("""
+        DELETE FROM grants WHERE grant_id NOT IN (
+            SELECT MAX(grant_id) FROM grants GROUP BY faculty_id, nsf_id
+        )
+    """)
+
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        batch_op.create_unique_constraint('uq_projects_faculty_id_project_number', ['faculty_id', 'project_number'])
+
+    with op.batch_alter_table('grants', schema=None) as batch_op:
+        batch_op.create_unique_constraint('uq_grants_faculty_id_nsf_id', ['faculty_id', 'nsf_id'])
+
+
+def downgrade():
+    with op.batch_alter_table('grants', schema=None) as batch_op:
+        batch_op.drop_constraint('uq_grants_faculty_id_nsf_id', type_='unique')
+
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        batch_op.drop_constraint('uq_projects_faculty_id_project_number', type_='unique')
@@ -0,0 +1,37 @@
+"""embedding vectors owned by faculty
+
+Revision ID: e2a9c4d7b815
+Revises: d7b3f1a9c2e4
+Create Date: 2026-10-19 16:42:37.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2a9c4d7b815'
+down_revision = 'd7b3f1a9c2e4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('embedding_vectors',
+    sa.Column('vector_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('faculty_id', sa.Integer(), nullable=False),
+    sa.Column('kind', sa.String(length=16), nullable=False),
+    sa.Column('source_key', sa.String(), nullable=False),
+    sa.Column('text_hash', sa.String(length=64), nullable=False),
+    sa.ForeignKeyConstraint(['faculty_id'], ['faculty.faculty_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('vector_id')
+    )
+    with op.batch_alter_table('embedding_vectors', schema=None) as batch_op:
+        batch_op.create_index('ix_embedding_vectors_faculty_id', ['faculty_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('embedding_vectors', schema=None) as batch_op:
+        batch_op.drop_index('ix_embedding_vectors_faculty_id')
+
+    op.drop_table('embedding_vectors')
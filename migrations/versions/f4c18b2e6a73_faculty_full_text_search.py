@@ -0,0 +1,156 @@
+"""full-text search document per faculty
+
+Revision ID: f4c18b2e6a73
+Revises: e2a9c4d7b815
+Create Date: 2026-10-19 18:20:54.630917
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f4c18b2e6a73'
+down_revision = 'e2a9c4d7b815'
+branch_labels = None
+depends_on = None
+
+# The search document of a faculty member is its about text plus the abstracts and terms of its
+# projects. It is kept up to date by triggers, so every writer of faculty and projects maintains it.
+
+POSTGRESQL_UPGRADE = [
+    "ALTER TABLE faculty ADD COLUMN search_vector tsvector",
+    """
+    CREATE FUNCTION faculty_search_vector(p_about text, p_faculty_id integer) RETURNS tsvector AS $$
+        SELECT setweight(to_tsvector('english', coalesce(p_about, '')), 'A')
+            || setweight(to_tsvector('english', coalesce(
+                string_agg(coalesce(abstract, '') || ' ' || coalesce(relevant_terms, ''), ' '), ''
+            )), 'B')
+        FROM projects WHERE faculty_id = p_faculty_id
+    $$ LANGUAGE sql STABLE
+    """,
+    """
+    CREATE FUNCTION faculty_search_vector_trigger() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector := faculty_search_vector(NEW.about, NEW.faculty_id);
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER faculty_search_vector_update BEFORE INSERT OR UPDATE OF about ON faculty
+    FOR EACH ROW EXECUTE PROCEDURE faculty_search_vector_trigger()
+    """,
+    """
+    CREATE FUNCTION projects_search_vector_trigger() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            UPDATE faculty SET search_vector = faculty_search_vector(about, faculty_id)
+            WHERE faculty_id = OLD.faculty_id;
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            UPDATE faculty SET search_vector = faculty_search_vector(about, faculty_id)
+            WHERE faculty_id = NEW.faculty_id;
+        END IF;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER projects_search_vector_update
+    AFTER INSERT OR UPDATE OF abstract, relevant_terms, faculty_id OR DELETE ON projects
+    FOR EACH ROW EXECUTE PROCEDURE projects_search_vector_trigger()
+    """,
+    "UPDATE faculty SET search_vector = faculty_search_vector(about, faculty_id)",
+    "CREATE INDEX ix_faculty_search_vector ON faculty USING GIN (search_vector)",
+]
+
+POSTGRESQL_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS projects_search_vector_update ON projects",
+    "DROP TRIGGER IF EXISTS faculty_search_vector_update ON faculty",
+    "DROP FUNCTION IF EXISTS projects_search_vector_trigger()",
+    "DROP FUNCTION IF EXISTS faculty_search_vector_trigger()",
+    "DROP FUNCTION IF EXISTS faculty_search_vector(text, integer)",
+    "DROP INDEX IF EXISTS ix_faculty_search_vector",
+    "ALTER TABLE faculty DROP COLUMN IF EXISTS search_vector",
+]
+
+_SQLITE_PROJECTS_TEXT = """(
+    SELECT group_concat(coalesce(abstract, '') || ' ' || coalesce(relevant_terms, ''), ' ')
+    FROM projects WHERE faculty_id = {faculty_id}
+)"""
+
+SQLITE_UPGRADE = [
+    "CREATE VIRTUAL TABLE faculty_fts USING fts5(about, projects, tokenize='porter unicode61')",
+    """
+    CREATE TRIGGER faculty_fts_insert AFTER INSERT ON faculty BEGIN
+        INSERT INTO faculty_fts (rowid, about, projects) VALUES (new.faculty_id, new.about, '');
+    END
+    """,
+    """
+    CREATE TRIGGER faculty_fts_update AFTER UPDATE OF about ON faculty BEGIN
+        UPDATE faculty_fts SET about = new.about WHERE rowid = new.faculty_id;
+    END
+    """,
+    """
+    CREATE TRIGGER faculty_fts_delete AFTER DELETE ON faculty BEGIN
+        DELETE FROM faculty_fts WHERE rowid = old.faculty_id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER projects_fts_insert AFTER INSERT ON projects BEGIN
+        UPDATE faculty_fts SET projects = {_SQLITE_PROJECTS_TEXT.format(faculty_id="new.faculty_id")}
+        WHERE rowid = new.faculty_id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER projects_fts_update AFTER UPDATE OF abstract, relevant_terms, faculty_id ON projects BEGIN
+        UPDATE faculty_fts SET projects = {_SQLITE_PROJECTS_TEXT.format(faculty_id="old.faculty_id")}
+        WHERE rowid = old.faculty_id;
+        UPDATE faculty_fts SET projects = {_SQLITE_PROJECTS_TEXT.format(faculty_id="new.faculty_id")}
+        WHERE rowid = new.faculty_id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER projects_fts_delete AFTER DELETE ON projects BEGIN
+        UPDATE faculty_fts SET projects = {_SQLITE_PROJECTS_TEXT.format(faculty_id="old.faculty_id")}
+        WHERE rowid = old.faculty_id;
+    END
+    """,
+    f"""
+    INSERT INTO faculty_fts (rowid, about, projects)
+    SELECT faculty.faculty_id, faculty.about, {_SQLITE_PROJECTS_TEXT.format(faculty_id="faculty.faculty_id")}
+    FROM faculty
+    """,
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS projects_fts_delete",
+    "DROP TRIGGER IF EXISTS projects_fts_update",
+    "DROP TRIGGER IF EXISTS projects_fts_insert",
+    "DROP TRIGGER IF EXISTS faculty_fts_delete",
+    "DROP TRIGGER IF EXISTS faculty_fts_update",
+    "DROP TRIGGER IF EXISTS faculty_fts_insert",
+    "DROP TABLE IF EXISTS faculty_fts",
+]
+
+
+def _execute(statements):
+    for statement in statements:
+        op.execute(sa.text(statement))
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        _execute(POSTGRESQL_UPGRADE)
+    elif dialect == 'sqlite':
+        _execute(SQLITE_UPGRADE)
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        _execute(POSTGRESQL_DOWNGRADE)
+    elif dialect == 'sqlite':
+        _execute(SQLITE_DOWNGRADE)
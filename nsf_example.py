@@ -1,13 +1,12 @@
 from datetime import date
-from backend.services.nsf.nsf_proxy import NSFProxy
 from backend.services.nsf.nsf_service import NSFService
+from backend.utils.factory import get_funding_api_cache, get_nsf_proxy
 from backend.utils.http_client import HttpClient
-import pandas as pd
 
 if __name__ == "__main__":
     fname = "Chris"
     lname = "Paolucci"
-    pr = NSFProxy()
+    pr = get_nsf_proxy(HttpClient(), get_funding_api_cache())
 
     # print(len(pr.call_nsf_api(payload={
     #         "coPDPI": fname + " " + lname,
@@ -15,7 +14,9 @@ if __name__ == "__main__":
     #     })))
     
     nsf_service = NSFService(proxy=pr)
-    df = nsf_service.compile_project_metadata(pi_first_name=fname, pi_last_name=lname)
-    print(df.shape)
-    print(df.head())
-    print(type(df.loc[0]["date"]))
\ No newline at end of file
+    awards = nsf_service.compile_project_metadata(pi_first_name=fname, pi_last_name=lname)
+    print(len(awards))
+    for award in awards[:5]:
+        print(award)
+    if awards:
+        print(type(awards[0].date))
\ No newline at end of file
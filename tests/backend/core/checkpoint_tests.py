@@ -0,0 +1,62 @@
+import os
+import time
+import shutil
+import tempfile
+import unittest
+from datetime import date
+from backend.core.checkpoint import PopulateCheckpoint
+from backend.models.models import Faculty, Project, Grant
+
+
+class TestPopulateCheckpoint(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "checkpoint.sqlite")
+        self.checkpoint = PopulateCheckpoint(self.path).open()
+
+    def tearDown(self):
+        self.checkpoint.close()
+        shutil.rmtree(self.directory)
+
+    def test_saved_work_survives_reopen(self):
+        faculty = Faculty(
+            name="Jane Doe", school="SEAS", department="CS", about="About", email="jd@virginia.edu",
+            profile_url="https://example.com", has_funding=True,
+            projects=[Project(project_number="R01", abstract="A", relevant_terms="t",
+                              start_date=date(2020, 1, 1), end_date=None,
+                              agency_ic_admin="NCI", activity_code="R01")],
+            grants=[Grant(nsf_id="123", date=date(2021, 2, 3), start_date=date(2021, 3, 1), title="G")],
+        )
+        self.checkpoint.save_department_profiles("CS", [{"name": "Jane Doe"}])
+        self.checkpoint.save_enriched_faculty("key", faculty)
+        self.checkpoint.save_embedding("text", [0.5, 0.25])
+        self.checkpoint.close()
+
+        self.checkpoint = PopulateCheckpoint(self.path).open()
+        restored = self.checkpoint.get_enriched_faculty("key")
+
+        self.assertEqual(self.checkpoint.get_department_profiles("CS"), [{"name": "Jane Doe"}])
+        self.assertIsNone(self.checkpoint.get_department_profiles("Math"))
+        self.assertEqual(restored.email, "jd@virginia.edu")
+        self.assertEqual(restored.projects[0].start_date, date(2020, 1, 1))
+        self.assertIsNone(restored.projects[0].end_date)
+        self.assertEqual(restored.grants[0].nsf_id, "123")
+        self.assertEqual(self.checkpoint.get_embedding("text"), [0.5, 0.25])
+        self.assertIsNone(self.checkpoint.get_embedding("other"))
+
+    def test_stale_checkpoint_is_discarded(self):
+        self.checkpoint.save_department_profiles("CS", [])
+        self.checkpoint.close()
+        time.sleep(0.01)
+
+        self.checkpoint = PopulateCheckpoint(self.path, max_age_hours=0).open()
+
+        self.assertIsNone(self.checkpoint.get_department_profiles("CS"))
+
+    def test_delete_removes_files(self):
+        self.checkpoint.delete()
+        self.assertFalse(os.path.exists(self.path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+from datetime import date
+from unittest.mock import MagicMock
+from backend.core.grant_backfill import backfill_nsf_grants
+from backend.models.records import NSFAward
+
+
+class TestGrantBackfill(unittest.TestCase):
+    def test_backfill_upserts_in_batches_and_skips_failures(self):
+        def compile_project_metadata(pi_first_name, pi_last_name):
+            if pi_last_name == "Fail":
+                raise RuntimeError("boom")
+            return [NSFAward(id=f"{pi_last_name}-{i}", date=date(2024, 1, 1), start_date=None, title="T")
+                    for i in range(2)]
+
+        nsf_service = MagicMock()
+        nsf_service.compile_project_metadata.side_effect = compile_project_metadata
+        database_driver = MagicMock()
+        database_driver.upsert_grants.side_effect = lambda grants, batch_size: len(grants)
+        faculty_rows = [(1, "Jane Doe", "SEAS"), (2, "Dr. John Roe, PhD", "SEAS"), (3, "Al Fail", "SOM")]
+
+        stats = backfill_nsf_grants(faculty_rows, nsf_service, database_driver, workers=3, batch_size=3)
+
+        self.assertEqual(stats, {"faculty": 3, "failed": 1, "grants": 4})
+        nsf_service.compile_project_metadata.assert_any_call(pi_first_name="John", pi_last_name="Roe")
+        upserted = [grant for c in database_driver.upsert_grants.call_args_list for grant in c.args[0]]
+        self.assertEqual(sorted((g["faculty_id"], g["nsf_id"]) for g in upserted),
+                         [(1, "Doe-0"), (1, "Doe-1"), (2, "Roe-0"), (2, "Roe-1")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+from backend.core.pipeline import StagedPipeline, PipelineStage
+
+
+class TestStagedPipeline(unittest.TestCase):
+    def test_run_passes_batches_through_stages(self):
+        written = []
+        source = ([i, i + 1] for i in range(0, 20, 2))
+        stages = [
+            PipelineStage("double", lambda batch: [x * 2 for x in batch], workers=3),
+            PipelineStage("drop_small", lambda batch: [x for x in batch if x >= 10]),
+            PipelineStage("write", written.extend),
+        ]
+
+        stats = StagedPipeline(source, stages, queue_size=1, source_name="scrape").run()
+
+        self.assertEqual(sorted(written), list(range(10, 40, 2)))
+        self.assertEqual([s.name for s in stats], ["scrape", "double", "drop_small", "write"])
+        self.assertEqual(stats[0].items, 20)
+        self.assertEqual(stats[1].items, 20)
+        self.assertEqual(stats[3].items, 15)
+
+    def test_run_reraises_stage_error(self):
+        def fail(batch):
+            raise ValueError("boom")
+
+        source = ([i] for i in range(1000))
+        stages = [PipelineStage("fail", fail), PipelineStage("write", lambda batch: None)]
+
+        with self.assertRaises(ValueError):
+            StagedPipeline(source, stages, queue_size=1).run()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+import os
+import random
+import tempfile
+import unittest
+import importlib
+import numpy as np
+from unittest.mock import patch
+from backend.core.config import Config
+from backend.core.extensions import db
+from backend.core.checkpoint import PopulateCheckpoint
+from backend.core.populate_config import FUNDING_API_CACHE, OPENAI_CONFIG
+from backend.models.models import Faculty, Project, EmbeddingVector, FacultySearchDocument
+from backend.models.records import FacultyProfile
+
+DEPARTMENTS = {"SEAS": ["Computer Science"], "SOM": ["Cell Biology"]}
+
+
+class TestPopulate(unittest.TestCase):
+    """Runs populate end to end against a temporary database and index, with fake scrapers and embeddings."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(cls.tmp.cleanup)
+        for patcher in (
+            patch.object(Config, "SQLALCHEMY_DATABASE_URI", f"sqlite:///{cls.tmp.name}/populate.db"),
+            patch.object(Config, "OPENAI_API_KEY", "test"),
+            patch.dict(FUNDING_API_CACHE, {"PATH": os.path.join(cls.tmp.name, "funding_api_cache.sqlite")}),
+        ):
+            patcher.start()
+            cls.addClassCleanup(patcher.stop)
+
+        # The scraper's HTTP cache is created relative to the working directory when populate is imported
+        cwd = os.getcwd()
+        os.chdir(cls.tmp.name)
+        try:
+            cls.populate = importlib.import_module("backend.core.populate")
+        finally:
+            os.chdir(cwd)
+
+        index_path = os.path.join(cls.tmp.name, "index.faiss")
+        for patcher in (
+            patch("backend.services.embedding.embedding_storage.INDEX_PATH", index_path),
+            patch.object(cls.populate, "INDEX_PATH", index_path),
+            patch("backend.services.embedding.profile_document_builder.count_tokens", lambda text: len(text.split())),
+            patch("backend.services.embedding.profile_document_builder.truncate_to_tokens",
+                  lambda text, tokens: " ".join(text.split()[:tokens])),
+            patch.object(cls.populate.InstitutionUtils, "get_departments_from_school", lambda school: DEPARTMENTS[school]),
+            patch.object(cls.populate.data_aggregator, "build_faculty_models", cls._build_faculty_models),
+            patch.object(cls.populate.embedding_service.embedding_generator, "generate_embeddings",
+                         lambda texts: [cls._embedding() for _ in texts]),
+        ):
+            patcher.start()
+            cls.addClassCleanup(patcher.stop)
+
+    def setUp(self):
+        self.profiles = {
+            "Computer Science": [self._profile(f"Engineer {i}", "SEAS", "Computer Science") for i in range(4)],
+            "Cell Biology": [self._profile(f"Biologist {i}", "SOM", "Cell Biology") for i in range(3)],
+        }
+        scrape = patch.object(self.populate.scraper_service, "iter_department_faculty_profiles",
+                              lambda department: iter(self.profiles[department]))
+        scrape.start()
+        self.addCleanup(scrape.stop)
+
+        with self.populate.app.app_context():
+            db.drop_all()
+            db.create_all()
+        if os.path.exists(self.populate.INDEX_PATH):
+            os.remove(self.populate.INDEX_PATH)
+        self.populate.embedding_service.embedding_storage.index = None
+
+    @staticmethod
+    def _profile(name: str, school: str, department: str) -> FacultyProfile:
+        return FacultyProfile(name, school, department, f"{name.replace(' ', '.').lower()}@virginia.edu",
+                              f"About {name}", None)
+
+    # Suffix of the NIH project numbers built for scraped faculty, e.g. the fiscal year of the latest record
+    project_suffix = "-05"
+
+    @classmethod
+    def _build_faculty_models(cls, profiles, **kwargs):
+        return [
+            Faculty(name=profile.name, school=profile.school, department=profile.department, email=profile.email,
+                    about=profile.about, profile_url=profile.profile_url, embedding_id=-1,
+                    projects=[Project(project_number=f"P-{profile.name}{cls.project_suffix}",
+                                      abstract=f"Project of {profile.name}")])
+            for profile in profiles
+        ]
+
+    @staticmethod
+    def _embedding():
+        return [random.random() for _ in range(OPENAI_CONFIG["EMBEDDING_DIMENSIONS"])]
+
+    def _run_full_update(self, schools, keep_existing_schools, rebuild_index):
+        checkpoint = PopulateCheckpoint(os.path.join(self.tmp.name, "checkpoint.sqlite")).open()
+        with patch.multiple(self.populate, SCHOOLS_TO_SCRAPE=schools, KEEP_EXISTING_SCHOOLS=keep_existing_schools,
+                            REBUILD_INDEX=rebuild_index):
+            self.populate.run_full_update(checkpoint)
+        checkpoint.delete()
+
+    def _run_incremental_update(self, schools):
+        checkpoint = PopulateCheckpoint(os.path.join(self.tmp.name, "checkpoint.sqlite")).open()
+        with patch.object(self.populate, "SCHOOLS_TO_SCRAPE", schools):
+            self.populate.run_incremental_update(checkpoint)
+        checkpoint.delete()
+
+    def test_incremental_update_keeps_faculty_of_a_school_whose_scrape_came_back_short(self):
+        self._run_full_update(["SEAS", "SOM"], keep_existing_schools=False, rebuild_index=True)
+        self.profiles["Computer Science"] = []
+        self.profiles["Cell Biology"] = self.profiles["Cell Biology"][:2]
+
+        with self.assertLogs("backend.core.populate", level="WARNING") as logs:
+            self._run_incremental_update(["SEAS", "SOM"])
+
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn("Scrape of SEAS found 0 of its 4 stored faculty", logs.output[0])
+        storage = self.populate.embedding_service.embedding_storage
+        with self.populate.app.app_context():
+            names = sorted(f.name for f in Faculty.query)
+            embedding_ids = {f.embedding_id for f in Faculty.query}
+        self.assertEqual(names, ["Biologist 0", "Biologist 1"] + [f"Engineer {i}" for i in range(4)])
+        self.assertTrue(embedding_ids <= storage.get_embedding_ids())
+
+    def test_incremental_update_reuses_vectors_of_renumbered_projects(self):
+        self._run_full_update(["SOM"], keep_existing_schools=False, rebuild_index=True)
+        embeddings = self.populate.embedding_service.embedding_generator.generate_embeddings
+        with self.populate.app.app_context():
+            vector_ids = {f.name: sorted(v.vector_id for v in f.vectors) for f in Faculty.query}
+
+        with patch.object(type(self), "project_suffix", "-06"), \
+                patch.object(self.populate.embedding_service.embedding_generator, "generate_embeddings",
+                             wraps=embeddings) as generate_embeddings:
+            self._run_incremental_update(["SOM"])
+
+        generate_embeddings.assert_not_called()
+        with self.populate.app.app_context():
+            self.assertEqual({f.name: sorted(v.vector_id for v in f.vectors) for f in Faculty.query}, vector_ids)
+            self.assertEqual(sorted(v.source_key for v in EmbeddingVector.query.filter_by(kind="project")),
+                             [f"P-Biologist {i}-06" for i in range(3)])
+
+    def test_rebuild_keeping_schools_gives_every_faculty_member_its_own_vectors(self):
+        # The kept SEAS faculty hold the first vector IDs, which the rebuilt index hands out again
+        self._run_full_update(["SEAS"], keep_existing_schools=False, rebuild_index=True)
+        self._run_full_update(["SOM"], keep_existing_schools=True, rebuild_index=True)
+
+        storage = self.populate.embedding_service.embedding_storage
+        with self.populate.app.app_context():
+            faculty = Faculty.query.all()
+            embedding_ids = [f.embedding_id for f in faculty]
+            self.assertEqual(len(faculty), 7)
+            self.assertEqual(len(set(embedding_ids)), len(faculty))
+            self.assertTrue(all(embedding_id >= 0 for embedding_id in embedding_ids))
+            self.assertEqual(storage.get_embedding_ids(), {v.vector_id for v in EmbeddingVector.query})
+
+            for f in faculty:
+                for vector in f.vectors:
+                    self.assertEqual(storage._owner_ids(np.array([vector.vector_id]))[0], f.embedding_id)
+                document = db.session.get(FacultySearchDocument, f.embedding_id)
+                self.assertIn(f'"name":"{f.name}"', document.document)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-import pandas as pd
+import threading
 from unittest.mock import MagicMock, patch
 from datetime import date, timedelta
 from backend.services.aggregator.data_aggregator import DataAggregator
@@ -8,6 +8,7 @@ from backend.services.nih.nih_reporter_service import NIHReporterService
 from backend.services.nsf.nsf_service import NSFService
 from backend.services.scraper.scraper_service import ScraperService
 from backend.models.models import Faculty, Project
+from backend.models.records import FacultyProfile, NIHProject
 
 class TestDataAggregator(unittest.TestCase):
     def setUp(self):
@@ -15,7 +16,7 @@ class TestDataAggregator(unittest.TestCase):
         self.nih_service = MagicMock(spec=NIHReporterService)
         self.embedding_service = MagicMock(spec=EmbeddingService)
         self.nsf_service = MagicMock(spec=NSFService)
-        self.nsf_service.compile_project_metadata.return_value = pd.DataFrame()
+        self.nsf_service.compile_project_metadata.return_value = []
         self.aggregator = DataAggregator(
             self.scraper_service,
             self.nih_service,
@@ -25,30 +26,30 @@ class TestDataAggregator(unittest.TestCase):
 
     def test_aggregate_school_faculty_data(self):
         mock_faculty_data = {
-            "CS": pd.DataFrame([
-                {
-                    "Faculty_Name": "John Doe",
-                    "School": "SEAS",
-                    "Email_Address": "johndoe@virginia.edu",
-                    "Department": "CS",
-                    "About_Section": "About John",
-                    "Profile_URL": "https://profile.com"
-                 }
-            ])
+            "CS": [
+                FacultyProfile(
+                    name="John Doe",
+                    school="SEAS",
+                    email="johndoe@virginia.edu",
+                    department="CS",
+                    about="About John",
+                    profile_url="https://profile.com"
+                )
+            ]
         }
 
         self.scraper_service.get_school_faculty_data.return_value = mock_faculty_data
-        self.nih_service.compile_project_metadata.return_value = pd.DataFrame([
-            {
-                "project_number": "TEST",
-                "abstract_text": "TEST",
-                "terms": "TERMS",
-                "start_date": date(2020, 1, 1),
-                "end_date": date(2020, 2, 2),
-                "agency_ic_admin": "TEST",
-                "activity_code": "TEST"
-            }
-        ])
+        self.nih_service.compile_project_metadata.return_value = [
+            NIHProject(
+                project_number="TEST",
+                abstract_text="TEST",
+                terms="TERMS",
+                start_date=date(2020, 1, 1),
+                end_date=date(2020, 2, 2),
+                agency_ic_admin="TEST",
+                activity_code="TEST"
+            )
+        ]
         self.embedding_service.generate_and_store_embedding.return_value = 1
         faculty_list = self.aggregator.aggregate_school_faculty_data("SEAS")
 
@@ -58,20 +59,20 @@ class TestDataAggregator(unittest.TestCase):
 
     def test_aggregate_school_faculty_data_skips_nsf_when_disabled(self):
         mock_faculty_data = {
-            "CS": pd.DataFrame([
-                {
-                    "Faculty_Name": "John Doe",
-                    "School": "SEAS",
-                    "Email_Address": "johndoe@virginia.edu",
-                    "Department": "CS",
-                    "About_Section": "About John",
-                    "Profile_URL": "https://profile.com"
-                 }
-            ])
+            "CS": [
+                FacultyProfile(
+                    name="John Doe",
+                    school="SEAS",
+                    email="johndoe@virginia.edu",
+                    department="CS",
+                    about="About John",
+                    profile_url="https://profile.com"
+                )
+            ]
         }
 
         self.scraper_service.get_school_faculty_data.return_value = mock_faculty_data
-        self.nih_service.compile_project_metadata.return_value = pd.DataFrame()
+        self.nih_service.compile_project_metadata.return_value = []
 
         faculty_list = self.aggregator.aggregate_school_faculty_data(
             "SEAS",
@@ -83,13 +84,13 @@ class TestDataAggregator(unittest.TestCase):
         self.assertEqual(faculty_list[0].grants, [])
 
     def test_build_faculty_model(self):
-        mock_profile = MagicMock(
-            Faculty_Name="John Doe",
-            School="NONE",
-            Department="CS",
-            Email_Address="johndoe@testing.edu",
-            About_Section="About John",
-            Profile_URL="https://profile.com"
+        mock_profile = FacultyProfile(
+            name="John Doe",
+            school="NONE",
+            department="CS",
+            email="johndoe@testing.edu",
+            about="About John",
+            profile_url="https://profile.com"
         )
 
         with patch.object(self.aggregator, "_get_projects", return_value=[]):
@@ -104,19 +105,19 @@ class TestDataAggregator(unittest.TestCase):
         self.assertEqual(faculty.has_funding, False)
 
     def test_get_faculty_projects(self):
-        mock_project_df = pd.DataFrame([
-            {
-                "project_number": "TEST1",
-                "abstract_text": "TEST2",
-                "terms": "TEST3",
-                "start_date": date(2020, 1, 1),
-                "end_date": date(2020, 2, 2),
-                "agency_ic_admin": "TEST4",
-                "activity_code": "TEST5"
-            }
-        ])
-
-        self.nih_service.compile_project_metadata.return_value = mock_project_df
+        mock_projects = [
+            NIHProject(
+                project_number="TEST1",
+                abstract_text="TEST2",
+                terms="TEST3",
+                start_date=date(2020, 1, 1),
+                end_date=date(2020, 2, 2),
+                agency_ic_admin="TEST4",
+                activity_code="TEST5"
+            )
+        ]
+
+        self.nih_service.compile_project_metadata.return_value = mock_projects
         projects = self.aggregator._get_projects("John", "Doe")
 
         self.assertEqual(len(projects), 1)
@@ -182,5 +183,53 @@ class TestDataAggregator(unittest.TestCase):
         ]
         self.assertFalse(self.aggregator._has_funding(projects))
 
+    def test_build_faculty_models_batches_nih_queries(self):
+        self.aggregator.enrichment_mode = "batched"
+        profiles = [
+            FacultyProfile(name=name, school="SEAS", department="CS", email="", about="", profile_url="")
+            for name in ("John Doe", "Jane Smith")
+        ]
+        self.nih_service.compile_batch_project_metadata.return_value = {
+            ("John", "Doe"): [
+                NIHProject(
+                    project_number="TEST",
+                    abstract_text="TEST",
+                    terms="TERMS",
+                    start_date=date(2020, 1, 1),
+                    end_date=date(2020, 2, 2),
+                    agency_ic_admin="TEST",
+                    activity_code="TEST"
+                )
+            ],
+            ("Jane", "Smith"): [],
+        }
+
+        faculty_list = self.aggregator.build_faculty_models(profiles)
+
+        self.nih_service.compile_batch_project_metadata.assert_called_once_with([("John", "Doe"), ("Jane", "Smith")])
+        self.nih_service.compile_project_metadata.assert_not_called()
+        self.assertEqual([len(faculty.projects) for faculty in faculty_list], [1, 0])
+
+    def test_build_faculty_models_queries_nih_and_nsf_concurrently(self):
+        # Each call waits until the other service is called too, so sequential calls would time out
+        barrier = threading.Barrier(2, timeout=5)
+
+        def nih_projects(first_name, last_name):
+            barrier.wait()
+            return []
+
+        def nsf_grants(pi_first_name, pi_last_name):
+            barrier.wait()
+            return []
+
+        self.nih_service.compile_project_metadata.side_effect = nih_projects
+        self.nsf_service.compile_project_metadata.side_effect = nsf_grants
+        profile = FacultyProfile(name="John Doe", school="SEAS", department="CS", email="", about="", profile_url="")
+
+        faculty_list = self.aggregator.build_faculty_models([profile])
+
+        self.assertEqual(faculty_list[0].name, "John Doe")
+        self.nih_service.compile_project_metadata.assert_called_once_with("John", "Doe")
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,9 +1,29 @@
+import os
+import json
 import unittest
+import importlib.util
 from unittest.mock import MagicMock, patch
 from flask import Flask
+from sqlalchemy import event, text
+from sqlalchemy.exc import IntegrityError, InvalidRequestError
 from backend.core.extensions import db
-from backend.models.models import Faculty
-from backend.services.database.database_driver import DatabaseDriver
+from backend.models.models import (
+    Faculty, Project, Grant, EmbeddingVector, FacultySearchDocument, School, faculty_schools, faculty_departments
+)
+from backend.services.database.database_driver import DatabaseDriver, _websearch_to_fts5
+from backend.utils.serialization_utils import FACULTY_VIEWS, faculty_field_attributes, faculty_search_document
+
+FULL_TEXT_SEARCH_MIGRATION = os.path.join(
+    os.path.dirname(__file__), "..", "..", "..", "..",
+    "migrations", "versions", "f4c18b2e6a73_faculty_full_text_search.py",
+)
+
+
+def _load_migration(path):
+    spec = importlib.util.spec_from_file_location("full_text_search_migration", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
 
 class TestDatabaseDriver(unittest.TestCase):
     DB_DRIVER_MODULE = "backend.services.database.database_driver.DatabaseDriver"
@@ -40,4 +60,333 @@ class TestDatabaseDriver(unittest.TestCase):
         mock_ids = [1, 2, 3]
         with patch(self.DB_DRIVER_MODULE + "._get_embedding_ids_by_search_parameters", return_value=mock_ids):
             result = self.db_driver.get_embedding_ids_by_search_parameters(school="SEAS")
-            self.assertEqual(result, mock_ids)
\ No newline at end of file
+            self.assertEqual(result, mock_ids)
+
+    def test_update_faculty_replaces_projects(self):
+        db.create_all()
+        faculty = Faculty(name="John Doe", school="SEAS", department="CS", email="jd@virginia.edu",
+                          embedding_id=1, fingerprint="old", projects=[Project(project_number="OLD")])
+        self.db_driver.add_faculty(faculty)
+        faculty_id = faculty.faculty_id
+
+        updated = Faculty(name="John Doe", school="SEAS", department="CS", email="jd@virginia.edu",
+                          embedding_id=2, fingerprint="new", projects=[Project(project_number="NEW")])
+        self.db_driver.update_faculty(faculty_id, updated)
+
+        fingerprints = self.db_driver.get_faculty_fingerprints(["SEAS"])
+        self.assertEqual(fingerprints[("John Doe", "jd@virginia.edu")], (faculty_id, "new", 2))
+        self.assertEqual([p.project_number for p in Project.query.all()], ["NEW"])
+        db.drop_all()
+
+    def test_update_faculty_upserts_children_in_place(self):
+        db.create_all()
+        faculty = Faculty(name="John Doe", school="SEAS", department="CS", email="jd@virginia.edu", embedding_id=1,
+                          projects=[Project(project_number="KEEP", abstract="old"), Project(project_number="OLD")],
+                          grants=[Grant(nsf_id="1", title="old")])
+        self.db_driver.add_faculty(faculty)
+        faculty_id = faculty.faculty_id
+        kept_project_id = Project.query.filter_by(project_number="KEEP").one().project_id
+
+        updated = Faculty(name="John Doe", school="SEAS", department="CS", email="jd@virginia.edu", embedding_id=1,
+                          projects=[Project(project_number="KEEP", abstract="new"), Project(project_number="NEW")],
+                          grants=[Grant(nsf_id="1", title="new")])
+        self.db_driver.update_faculty(faculty_id, updated)
+
+        kept = Project.query.filter_by(project_number="KEEP").one()
+        self.assertEqual((kept.project_id, kept.abstract), (kept_project_id, "new"))
+        self.assertEqual(sorted(p.project_number for p in Project.query.all()), ["KEEP", "NEW"])
+        self.assertEqual([g.title for g in Grant.query.all()], ["new"])
+
+        db.session.add(Project(faculty_id=faculty_id, project_number="NEW"))
+        with self.assertRaises(IntegrityError):
+            db.session.commit()
+        db.session.rollback()
+        db.drop_all()
+
+    def test_bulk_add_update_and_delete(self):
+        db.create_all()
+        faculty_list = [
+            Faculty(name=f"Person {i}", school="SEAS" if i % 2 else "SOM", department="CS",
+                    email=f"p{i}@virginia.edu", embedding_id=-1,
+                    projects=[Project(project_number=f"P{i}")], grants=[Grant(nsf_id=f"G{i}")])
+            for i in range(5)
+        ]
+        self.db_driver.add_faculty_batch(faculty_list, batch_size=2)
+        faculty_ids = [faculty_id for faculty_id, in db.session.query(Faculty.faculty_id).order_by(Faculty.name)]
+        self.assertEqual(len(faculty_ids), 5)
+
+        self.db_driver.update_faculty_embedding_ids(
+            {faculty_id: index for index, faculty_id in enumerate(faculty_ids)}, batch_size=2
+        )
+        self.assertEqual(
+            [embedding_id for embedding_id, in db.session.query(Faculty.embedding_id).order_by(Faculty.name)],
+            [0, 1, 2, 3, 4],
+        )
+
+        self.db_driver.delete_faculty_by_schools(["SEAS"])
+        self.assertEqual(Faculty.query.count(), 3)
+        self.assertEqual(Project.query.count(), 3)
+        self.assertEqual(Grant.query.count(), 3)
+
+        self.db_driver.clear()
+        self.assertEqual(Grant.query.count(), 0)
+        db.drop_all()
+
+    def test_affiliations_are_matched_by_name(self):
+        db.create_all()
+        self.db_driver.add_faculty_batch([
+            Faculty(name="Jane Doe", school="SEAS", department="Biomedical Engineering", email="jd@virginia.edu",
+                    embedding_id=1),
+            Faculty(name="John Roe", school="SOM", department="Microbiology, Immunology, Cancer Biology",
+                    email="jr@virginia.edu", embedding_id=2),
+        ])
+        self.assertEqual(self.db_driver.get_embedding_ids_by_search_parameters(department="Engineering"), [])
+        self.assertEqual(self.db_driver.get_embedding_ids_by_search_parameters(school="SOM"), [2])
+
+        self.db_driver.update_faculty_affiliations({
+            ("Jane Doe", "jd@virginia.edu"): (["SEAS", "SOM"], ["Biomedical Engineering", "Cell Biology"]),
+        })
+        self.assertEqual(sorted(self.db_driver.get_embedding_ids_by_search_parameters(school="SOM")), [1, 2])
+        self.assertEqual(
+            self.db_driver.get_embedding_ids_by_search_parameters(school="SEAS", department="Cell Biology"), [1]
+        )
+        self.assertEqual(sorted(self.db_driver.get_faculty_fingerprints(["SOM"])), [
+            ("Jane Doe", "jd@virginia.edu"), ("John Roe", "jr@virginia.edu"),
+        ])
+        jane = Faculty.query.filter_by(name="Jane Doe").one()
+        self.assertEqual([school.name for school in jane.schools], ["SEAS", "SOM"])
+        self.assertEqual(jane.department, "Biomedical Engineering")
+        self.assertEqual([(row.name, row.schools) for row in self.db_driver.get_faculty_names()],
+                         [("Jane Doe", ["SEAS", "SOM"]), ("John Roe", ["SOM"])])
+
+        self.db_driver.delete_faculty_by_schools(["SEAS"])
+        self.assertEqual(db.session.query(faculty_schools).count(), 1)
+        self.assertEqual(db.session.query(faculty_departments).count(), 1)
+        self.db_driver.clear()
+        self.assertEqual(School.query.count(), 0)
+        db.drop_all()
+
+    def test_search_documents_follow_faculty(self):
+        db.create_all()
+        self.db_driver.add_faculty_batch([
+            Faculty(name="Jane Doe", school="SEAS", department="CS", email="jd@virginia.edu", embedding_id=1,
+                    about="Robotics", projects=[Project(project_number="P1", abstract="Grasping")]),
+            Faculty(name="John Roe", school="SOM", department="Biology", embedding_id=2),
+            Faculty(name="Ann Poe", school="SOM", department="Biology", embedding_id=-1),
+        ])
+
+        self.assertEqual(self.db_driver.sync_search_documents(batch_size=2), 2)
+        self.assertEqual(self.db_driver.sync_search_documents(batch_size=2), 0)
+        documents = self.db_driver.get_search_documents([1, 2, 3])
+        self.assertEqual(sorted(documents), [1, 2])
+        jane = json.loads(documents[1])
+        self.assertEqual((jane["name"], jane["schools"], jane["department"], jane["emails"]),
+                         ("Jane Doe", ["SEAS"], ["CS"], ["jd@virginia.edu"]))
+        self.assertEqual(jane["projects"][0]["abstract"], "Grasping")
+
+        jane_id = Faculty.query.filter_by(name="Jane Doe").one().faculty_id
+        self.db_driver.update_faculty(jane_id, Faculty(name="Jane Doe", school="SEAS", department="CS",
+                                                       email="jd@virginia.edu", embedding_id=5, about="Vision"))
+        self.assertEqual(sorted(self.db_driver.get_search_documents([1, 2, 5])), [2])
+        self.assertEqual(self.db_driver.sync_search_documents(), 1)
+        self.assertEqual(json.loads(self.db_driver.get_search_documents([5])[5])["about"], "Vision")
+
+        self.db_driver.delete_faculty_by_ids([jane_id])
+        self.assertEqual([document.embedding_id for document in FacultySearchDocument.query], [2])
+        db.drop_all()
+
+    def test_sync_search_documents_reads_documents_per_page_and_deletes_orphans(self):
+        db.create_all()
+        self.db_driver.add_faculty_batch([
+            Faculty(name=f"Person {i}", school="SEAS", department="CS", embedding_id=i) for i in range(5)
+        ])
+        db.session.add(FacultySearchDocument(embedding_id=40, faculty_id=1, document="{}"))
+        db.session.commit()
+
+        statements = []
+        capture = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(db.engine, "before_cursor_execute", capture)
+        try:
+            self.assertEqual(self.db_driver.sync_search_documents(batch_size=2), 5)
+        finally:
+            event.remove(db.engine, "before_cursor_execute", capture)
+
+        document_reads = [statement for statement in statements
+                          if statement.lstrip().startswith("SELECT") and "FROM faculty_search_doc" in statement]
+        self.assertEqual(len(document_reads), 3)
+        self.assertTrue(all(" IN (" in statement for statement in document_reads))
+        self.assertEqual(sorted(self.db_driver.get_search_documents(range(50))), [0, 1, 2, 3, 4])
+        db.drop_all()
+
+    def test_get_faculty_by_embedding_ids_loads_only_requested_attributes(self):
+        db.create_all()
+        self.db_driver.add_faculty_batch([
+            Faculty(name="Jane Doe", school="SEAS", department="CS", email="jd@virginia.edu", embedding_id=1,
+                    about="Robotics", projects=[Project(project_number="P1", abstract="Grasping")],
+                    grants=[Grant(nsf_id="G1", title="Hands")]),
+            Faculty(name="John Roe", school="SOM", department="Biology", embedding_id=2),
+        ])
+        self.db_driver.sync_search_documents()
+
+        statements = []
+        capture = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(db.engine, "before_cursor_execute", capture)
+        try:
+            faculty = self.db_driver.get_faculty_by_embedding_ids([2, 1, 3], ["name", "email"])
+        finally:
+            event.remove(db.engine, "before_cursor_execute", capture)
+        self.assertEqual(sorted(faculty), [1, 2])
+        self.assertEqual(len(statements), 1)
+        self.assertNotIn("about", statements[0])
+        self.assertNotIn("projects", statements[0])
+        self.assertEqual((faculty[1].name, faculty[1].email), ("Jane Doe", "jd@virginia.edu"))
+        with self.assertRaises(InvalidRequestError):
+            faculty[1].projects
+
+        summary = FACULTY_VIEWS["summary"]
+        faculty = self.db_driver.get_faculty_by_embedding_ids([1], faculty_field_attributes(summary))
+        full = json.loads(self.db_driver.get_search_documents([1])[1])
+        self.assertEqual(json.loads(faculty_search_document(faculty[1], summary)),
+                         {field: full[field] for field in summary})
+        db.drop_all()
+
+    def test_iter_all_faculty_streams_pages_with_children(self):
+        db.create_all()
+        self.db_driver.add_faculty_batch([
+            Faculty(name=f"Person {i}", school="SEAS", department="CS", embedding_id=i,
+                    projects=[Project(project_number=f"P{i}"), Project(project_number=f"Q{i}")],
+                    grants=[Grant(nsf_id=f"G{i}")])
+            for i in range(5)
+        ])
+
+        with patch(self.DB_DRIVER_MODULE + "._get_faculty_page", wraps=DatabaseDriver._get_faculty_page) as get_page:
+            faculty = list(self.db_driver.iter_all_faculty(batch_size=2))
+        self.assertEqual([f.embedding_id for f in faculty], [0, 1, 2, 3, 4])
+        self.assertEqual([call.args for call in get_page.call_args_list],
+                         [(None, 2), (faculty[1].faculty_id, 2), (faculty[3].faculty_id, 2)])
+        self.assertTrue(all(db.inspect(f).detached for f in faculty))
+        self.assertEqual([len(f.projects) + len(f.grants) for f in faculty], [3] * 5)
+        self.assertEqual(faculty[4].schools[0].name, "SEAS")
+        db.drop_all()
+
+    def test_embedding_vectors_follow_faculty(self):
+        db.create_all()
+        vector = lambda vector_id, kind, key: EmbeddingVector(vector_id=vector_id, kind=kind, source_key=key, text_hash=kind)
+        faculty = Faculty(name="Jane Doe", school="SEAS", department="CS", email="jd@virginia.edu", embedding_id=10,
+                          vectors=[vector(10, "profile", ""), vector(11, "project", "P1"), vector(12, "grant", "G1")])
+        self.db_driver.add_faculty(faculty)
+        faculty_id = faculty.faculty_id
+        self.assertEqual(sorted(self.db_driver.get_vector_owners()), [(11, 10), (12, 10)])
+
+        updated = Faculty(name="Jane Doe", school="SEAS", department="CS", email="jd@virginia.edu", embedding_id=10,
+                          vectors=[vector(10, "profile", ""), vector(13, "project", "P1")])
+        self.db_driver.update_faculty(faculty_id, updated)
+        self.assertEqual(self.db_driver.get_embedding_vectors([faculty_id]),
+                         {faculty_id: {("profile", ""): (10, "profile"), ("project", "P1"): (13, "project")}})
+
+        self.db_driver.replace_embedding_vectors({faculty_id: [vector(10, "profile", ""), vector(20, "grant", "G2")]})
+        self.assertEqual(self.db_driver.get_vector_owners(), [(20, 10)])
+
+        self.db_driver.delete_faculty_by_ids([faculty_id])
+        self.assertEqual(EmbeddingVector.query.count(), 0)
+        db.drop_all()
+
+    def test_awards_are_hydrated_by_vector_id(self):
+        db.create_all()
+        vector = lambda vector_id, kind, key: EmbeddingVector(vector_id=vector_id, kind=kind, source_key=key, text_hash=kind)
+        self.db_driver.add_faculty(Faculty(
+            name="Jane Doe", school="SEAS", department="CS", email="jd@virginia.edu", embedding_id=10,
+            projects=[Project(project_number="P1", activity_code="R01"), Project(project_number="P2", activity_code="K99")],
+            grants=[Grant(nsf_id="G1", title="Design")],
+            vectors=[vector(10, "profile", ""), vector(11, "project", "P1"), vector(12, "project", "P2"),
+                     vector(13, "grant", "G1")],
+        ))
+
+        self.assertEqual(self.db_driver.get_award_vector_ids(activity_code="R01"), [11])
+        awards = self.db_driver.get_awards_by_vector_ids([10, 11, 13])
+        self.assertEqual(sorted(awards), [11, 13])
+        kind, project, faculty = awards[11]
+        self.assertEqual((kind, project.project_number, faculty.name), ("project", "P1", "Jane Doe"))
+        self.assertEqual((awards[13][0], awards[13][1].title), ("grant", "Design"))
+        db.drop_all()
+
+    def test_get_lexical_documents(self):
+        db.create_all()
+        self.db_driver.add_faculty_batch([
+            Faculty(name="Jane Doe", school="SEAS", department="CS", embedding_id=1, about="Robotics",
+                    projects=[Project(project_number="P1", abstract="Grasping", relevant_terms="hands")]),
+            Faculty(name="John Roe", school="SEAS", department="CS", embedding_id=2),
+        ])
+
+        self.assertEqual(sorted(self.db_driver.get_lexical_documents()), [(1, "Robotics\nGrasping\nhands"), (2, "")])
+        db.drop_all()
+
+    def test_websearch_to_fts5(self):
+        self.assertEqual(_websearch_to_fts5("machine learning"), '"machine" AND "learning"')
+        self.assertEqual(_websearch_to_fts5('"deep learning" OR robotics'), '("deep learning" OR "robotics")')
+        self.assertEqual(_websearch_to_fts5('vision -"medical imaging"'), '("vision") NOT "medical imaging"')
+        self.assertEqual(_websearch_to_fts5("RNA-binding NEAR(x)"), '"RNA binding" AND "NEAR x"')
+        self.assertIsNone(_websearch_to_fts5("-robotics OR"))
+
+    def test_search_exact_words_uses_full_text_index(self):
+        db.create_all()
+        migration = _load_migration(FULL_TEXT_SEARCH_MIGRATION)
+        self.db_driver.add_faculty_batch([
+            Faculty(name="Jane Doe", school="SEAS", department="CS", embedding_id=1,
+                    about="Robot learning for grasping. Learning from demonstration and learning to walk."),
+        ])
+        for statement in migration.SQLITE_UPGRADE:
+            db.session.execute(text(statement))
+        self.db_driver.add_faculty_batch([
+            Faculty(name="John Roe", school="SEAS", department="CS", embedding_id=2, about="Medical imaging",
+                    projects=[Project(project_number="P1", abstract="Deep learning of tumors", activity_code="R01")]),
+            Faculty(name="Ann Poe", school="Medicine", department="Radiology", embedding_id=3,
+                    about="Learning machines"),
+        ])
+
+        results = self.db_driver.search_exact_words("learning", 10)
+        self.assertEqual((sorted(results), results[-1]), ([1, 2, 3], 2))
+        self.assertEqual(self.db_driver.search_exact_words('"deep learning"', 10), [2])
+        self.assertEqual(self.db_driver.search_exact_words("learn -robot", 10), [3, 2])
+        self.assertEqual(self.db_driver.search_exact_words("learning", 10, activity_code="R01"), [2])
+        self.assertEqual(self.db_driver.search_exact_words("learning", 10, school="Medicine"), [3])
+
+        Project.query.delete()
+        db.session.commit()
+        self.assertEqual(self.db_driver.search_exact_words("tumors", 10), [])
+        for statement in migration.SQLITE_DOWNGRADE:
+            db.session.execute(text(statement))
+        db.drop_all()
+
+    def test_search_exact_words_falls_back_to_substring_match(self):
+        db.create_all()
+        self.db_driver.add_faculty_batch([
+            Faculty(name="Jane Doe", school="SEAS", department="CS", embedding_id=1, about="Robotics",
+                    projects=[Project(project_number="P1", abstract="Grasping"), Project(project_number="P2")]),
+        ])
+        self.assertEqual(self.db_driver.search_exact_words("grasp", 10), [1])
+        db.drop_all()
+
+    def test_upsert_grants_is_idempotent(self):
+        db.create_all()
+        self.db_driver.add_faculty_batch([
+            Faculty(name="Jane Doe", school="SEAS", department="CS", email="jd@virginia.edu", embedding_id=1),
+            Faculty(name="John Roe", school="SEAS", department="CS", email="jr@virginia.edu", embedding_id=2,
+                    has_funding=False, grants=[Grant(nsf_id="100", title="Old")]),
+        ])
+        jane_id, john_id = [faculty_id for faculty_id, in db.session.query(Faculty.faculty_id).order_by(Faculty.name)]
+        grants = [
+            {"faculty_id": jane_id, "nsf_id": "100", "date": None, "start_date": None, "title": "Shared"},
+            {"faculty_id": john_id, "nsf_id": "100", "date": None, "start_date": None, "title": "Shared"},
+            {"faculty_id": john_id, "nsf_id": "200", "date": None, "start_date": None, "title": "New"},
+        ]
+
+        self.assertEqual(self.db_driver.upsert_grants(grants, batch_size=2), 3)
+        self.assertEqual(self.db_driver.upsert_grants(grants + grants[:1], batch_size=2), 3)
+        self.assertEqual(Grant.query.count(), 3)
+        self.assertEqual({grant.title for grant in Grant.query}, {"Shared", "New"})
+
+        self.assertEqual(self.db_driver.update_has_funding_from_grants(), 2)
+        db.session.expire_all()
+        self.assertTrue(all(faculty.has_funding for faculty in Faculty.query))
+        db.drop_all()
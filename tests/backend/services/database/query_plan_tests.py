@@ -0,0 +1,161 @@
+import os
+import re
+import random
+import unittest
+import importlib.util
+from flask import Flask
+from sqlalchemy import event, insert, text
+from backend.core.extensions import db
+from backend.models.models import (
+    Faculty, Project, Grant, EmbeddingVector, School, Department, faculty_schools, faculty_departments
+)
+from backend.services.database.database_driver import DatabaseDriver
+
+FULL_TEXT_SEARCH_MIGRATION = os.path.join(
+    os.path.dirname(__file__), "..", "..", "..", "..",
+    "migrations", "versions", "f4c18b2e6a73_faculty_full_text_search.py",
+)
+
+FACULTY = 3000
+PROJECTS_PER_FACULTY = 4
+GRANTS_PER_FACULTY = 2
+SCHOOLS = [f"School {i}" for i in range(8)]
+DEPARTMENTS = [f"Department {i}" for i in range(60)]
+ACTIVITY_CODES = [f"R{i:02d}" for i in range(40)]
+AGENCIES = [f"IC{i:02d}" for i in range(25)]
+WORDS = ["protein", "folding", "robot", "learning", "imaging", "neuron", "climate", "policy", "graph", "cell"]
+
+# A full scan of one of these tables means a filter or join key is missing an index
+_TABLE_SCAN = re.compile(
+    r"^SCAN (faculty|projects|grants|embedding_vectors|schools|departments|faculty_schools|faculty_departments)\b"
+)
+
+
+def _load_migration(path):
+    spec = importlib.util.spec_from_file_location("full_text_search_migration", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestQueryPlans(unittest.TestCase):
+    """
+    Runs the search filter, hydration and exact-word queries against synthetic data of a realistic
+    size and fails if SQLite plans a full scan of a table for any statement they issue.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = Flask(__name__)
+        cls.app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
+        cls.app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+        db.init_app(cls.app)
+        cls.app_context = cls.app.app_context()
+        cls.app_context.push()
+        cls.db_driver = DatabaseDriver(cls.app)
+
+        db.create_all()
+        for statement in _load_migration(FULL_TEXT_SEARCH_MIGRATION).SQLITE_UPGRADE:
+            db.session.execute(text(statement))
+        cls._insert_synthetic_data()
+        db.session.execute(text("ANALYZE"))
+        db.session.commit()
+
+    @classmethod
+    def tearDownClass(cls):
+        db.session.remove()
+        db.drop_all()
+        cls.app_context.pop()
+
+    @staticmethod
+    def _insert_synthetic_data():
+        rng = random.Random(0)
+        sentence = lambda size: " ".join(rng.choice(WORDS) for _ in range(size))
+        db.session.execute(insert(School), [{"school_id": i + 1, "name": name} for i, name in enumerate(SCHOOLS)])
+        db.session.execute(insert(Department), [{"department_id": i + 1, "name": name} for i, name in enumerate(DEPARTMENTS)])
+
+        faculty, schools, departments, projects, grants, vectors = [], [], [], [], [], []
+        vector_id = 0
+        for faculty_id in range(1, FACULTY + 1):
+            faculty.append({
+                "faculty_id": faculty_id, "name": f"Person {faculty_id}", "school": "", "department": "",
+                "about": sentence(30), "email": f"p{faculty_id}@virginia.edu", "has_funding": faculty_id % 3 == 0,
+                "embedding_id": vector_id,
+            })
+            vectors.append({"vector_id": vector_id, "faculty_id": faculty_id, "kind": "profile", "source_key": "",
+                            "text_hash": ""})
+            vector_id += 1
+            schools.append({"faculty_id": faculty_id, "school_id": faculty_id % len(SCHOOLS) + 1})
+            departments.append({"faculty_id": faculty_id, "department_id": faculty_id % len(DEPARTMENTS) + 1})
+            for index in range(PROJECTS_PER_FACULTY):
+                project_number = f"P{faculty_id}-{index}"
+                projects.append({
+                    "faculty_id": faculty_id, "project_number": project_number, "abstract": sentence(60),
+                    "relevant_terms": sentence(5), "activity_code": rng.choice(ACTIVITY_CODES),
+                    "agency_ic_admin": rng.choice(AGENCIES),
+                })
+                vectors.append({"vector_id": vector_id, "faculty_id": faculty_id, "kind": "project",
+                                "source_key": project_number, "text_hash": ""})
+                vector_id += 1
+            for index in range(GRANTS_PER_FACULTY):
+                grants.append({"faculty_id": faculty_id, "nsf_id": f"G{faculty_id}-{index}", "title": sentence(8)})
+
+        for model, rows in ((Faculty, faculty), (faculty_schools, schools), (faculty_departments, departments),
+                            (Project, projects), (Grant, grants), (EmbeddingVector, vectors)):
+            db.session.execute(insert(model), rows)
+        db.session.commit()
+
+    def _table_scans(self, call) -> list:
+        """
+        Run `call`, then EXPLAIN every SELECT it issued.
+        :return: (statement, plan line) of each full table scan
+        """
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append((statement, parameters))
+
+        event.listen(db.engine, "before_cursor_execute", capture)
+        try:
+            call()
+        finally:
+            event.remove(db.engine, "before_cursor_execute", capture)
+        self.assertTrue(statements)
+
+        scans = []
+        for statement, parameters in statements:
+            plan = db.session.connection().exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters).all()
+            scans.extend((statement, row[-1]) for row in plan if _TABLE_SCAN.match(row[-1]))
+        return scans
+
+    def assertUsesIndexes(self, call):
+        scans = self._table_scans(call)
+        self.assertEqual(scans, [], "\n\n".join(f"{detail}\n{statement}" for statement, detail in scans))
+
+    def test_filter_queries_use_indexes(self):
+        for filters in (
+            {"school": SCHOOLS[1]},
+            {"department": DEPARTMENTS[2]},
+            {"activity_code": ACTIVITY_CODES[3]},
+            {"agency_ic_admin": AGENCIES[4]},
+            {"school": SCHOOLS[5], "department": DEPARTMENTS[5], "activity_code": ACTIVITY_CODES[5]},
+        ):
+            with self.subTest(**filters):
+                self.assertUsesIndexes(lambda: self.db_driver.get_embedding_ids_by_search_parameters(**filters))
+
+    def test_hydration_queries_use_indexes(self):
+        self.assertUsesIndexes(lambda: self.db_driver.get_faculty_by_embedding_id(250))
+        self.assertUsesIndexes(lambda: self.db_driver.get_search_documents([0, 5, 250]))
+        self.assertUsesIndexes(lambda: self.db_driver.get_faculty_by_embedding_ids(
+            [0, 5, 250], ["name", "schools", "departments", "projects", "grants"]))
+        self.assertUsesIndexes(lambda: self.db_driver.get_awards_by_vector_ids([1, 2, 7, 12]))
+        self.assertUsesIndexes(lambda: self.db_driver.get_award_vector_ids(activity_code=ACTIVITY_CODES[6]))
+
+    def test_exact_word_queries_use_indexes(self):
+        self.assertUsesIndexes(lambda: self.db_driver.search_exact_words('"protein folding"', 10))
+        self.assertUsesIndexes(lambda: self.db_driver.search_exact_words("robot", 10, school=SCHOOLS[2]))
+
+
+if __name__ == "__main__":
+    unittest.main()
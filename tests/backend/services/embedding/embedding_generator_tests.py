@@ -29,6 +29,7 @@ class TestEmbeddingGenerator(unittest.TestCase):
         mock_count_tokens.return_value = OPENAI_CONFIG["MAX_TOKENS"] + 10
         mock_chunk_text.return_value = ["chunk1", "chunk2"]
         mock_call_api.side_effect = [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]
+        self.generator.chunked_fallback = True
 
         result = self.generator.generate_embedding("long test text")
 
@@ -40,6 +41,39 @@ class TestEmbeddingGenerator(unittest.TestCase):
                 places=2
             )
 
+    @patch(f"{MODULE_PATH}.chunk_text")
+    @patch(f"{MODULE_PATH}.count_tokens")
+    def test_metrics_count_texts_tokens_and_api_calls(self, mock_count_tokens, mock_chunk_text):
+        self.mock_openai_client.embeddings.create.return_value = MagicMock(data=[MagicMock(embedding=[0.1])])
+        mock_count_tokens.side_effect = [100, OPENAI_CONFIG["MAX_TOKENS"] + 100]
+        mock_chunk_text.return_value = ["chunk1", "chunk2"]
+        self.generator.chunked_fallback = True
+
+        self.generator.generate_embedding("short")
+        self.generator.generate_embedding("long")
+
+        metrics = self.generator.get_metrics()
+        self.assertEqual(metrics["texts"], 2)
+        self.assertEqual(metrics["text_tokens"], OPENAI_CONFIG["MAX_TOKENS"] + 200)
+        self.assertEqual(metrics["chunked_texts"], 1)
+        self.assertEqual(metrics["api_calls"], 3)
+
+    @patch(f"{MODULE_PATH}.truncate_to_tokens")
+    @patch(f"{MODULE_PATH}.count_tokens")
+    @patch(f"{MODULE_PATH}.EmbeddingGenerator._call_embedding_api")
+    def test_generate_embedding_truncates_without_chunked_fallback(self, mock_call_api, mock_count_tokens, mock_truncate):
+        mock_count_tokens.return_value = OPENAI_CONFIG["MAX_TOKENS"] + 10
+        mock_truncate.return_value = "truncated"
+        mock_call_api.return_value = [0.1, 0.2, 0.3]
+        self.generator.chunked_fallback = False
+
+        result = self.generator.generate_embedding("long test text")
+
+        mock_truncate.assert_called_once_with("long test text", OPENAI_CONFIG["MAX_TOKENS"])
+        mock_call_api.assert_called_once_with("truncated")
+        self.assertEqual(result, [0.1, 0.2, 0.3])
+        self.assertEqual(self.generator.get_metrics()["truncated_texts"], 1)
+
     def test_aggregate_embeddings(self):
         embeddings = [
             [1, 2, 3],
@@ -72,6 +106,23 @@ class TestEmbeddingGenerator(unittest.TestCase):
 
         self.assertEqual(str(context.exception), "API ERROR")
 
+    @patch.dict(OPENAI_CONFIG, {"BATCH_SIZE": 2})
+    @patch(f"{MODULE_PATH}.count_tokens", lambda text: len(text))
+    def test_generate_embeddings_batches_requests(self):
+        def create(input, model):
+            data = [MagicMock(index=index, embedding=[float(len(text))]) for index, text in enumerate(input)]
+            return MagicMock(data=list(reversed(data)))
+        self.mock_openai_client.embeddings.create.side_effect = create
+
+        result = self.generator.generate_embeddings(["a", "bb", "ccc"])
+
+        self.assertEqual(result, [[1.0], [2.0], [3.0]])
+        self.assertEqual(
+            [kwargs["input"] for _, kwargs in self.mock_openai_client.embeddings.create.call_args_list],
+            [["a", "bb"], ["ccc"]],
+        )
+        self.assertEqual(self.generator.get_metrics()["api_calls"], 2)
+
 if __name__ == "__main__":
     unittest.main()
 
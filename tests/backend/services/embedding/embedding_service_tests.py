@@ -0,0 +1,101 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from backend.models.models import Faculty, Project, Grant
+from backend.services.embedding.embedding_service import EmbeddingService
+
+BUILDER_PATH = "backend.services.embedding.profile_document_builder"
+
+
+@patch(f"{BUILDER_PATH}.truncate_to_tokens", lambda text, tokens: " ".join(text.split()[:tokens]))
+@patch(f"{BUILDER_PATH}.count_tokens", lambda text: len(text.split()))
+class TestEmbeddingService(unittest.TestCase):
+    def setUp(self):
+        self.generator = MagicMock()
+        self.generator.generate_embeddings.side_effect = lambda texts: [[float(len(text))] for text in texts]
+        self.storage = MagicMock()
+        self.service = EmbeddingService(self.generator, self.storage, multi_vector=True)
+
+    @staticmethod
+    def _faculty(abstract: str) -> Faculty:
+        return Faculty(
+            name="Jane Doe", school="SEAS", department="CS", about="Studies proteins.",
+            projects=[
+                Project(project_number="P1", abstract=abstract, relevant_terms="folding"),
+                Project(project_number="P2", abstract="Same text"),
+                Project(project_number="P3", abstract="Same text"),
+            ],
+            grants=[Grant(nsf_id="G1", title="Protein design")],
+        )
+
+    def test_builds_one_vector_per_distinct_text(self):
+        texts = self.service.build_texts(self._faculty("Folding"))
+
+        self.assertEqual([(kind, key) for kind, key, _ in texts],
+                         [("profile", ""), ("project", "P1"), ("project", "P2"), ("grant", "G1")])
+        self.assertNotIn("Folding", texts[0][2])
+
+    def test_changed_project_is_the_only_text_embedded(self):
+        stored = self.service.generate_vectors([self._faculty("Folding")])[0]
+        existing = {(vector.kind, vector.source_key): (index, vector.text_hash) for index, vector in enumerate(stored)}
+        self.generator.generate_embeddings.reset_mock()
+
+        vectors = self.service.generate_vectors([self._faculty("Misfolding")], existing_vectors=[existing])[0]
+
+        (texts,), _ = self.generator.generate_embeddings.call_args
+        self.assertEqual(len(texts), 1)
+        self.assertIn("Misfolding", texts[0])
+        self.assertEqual([vector.vector_id for vector in vectors], [0, None, 2, 3])
+
+    def test_renumbered_project_reuses_vector_with_same_text(self):
+        stored = self.service.generate_vectors([self._faculty("Folding")])[0]
+        existing = {(vector.kind, vector.source_key): (index, vector.text_hash) for index, vector in enumerate(stored)}
+        self.generator.generate_embeddings.reset_mock()
+        faculty = self._faculty("Folding")
+        faculty.projects[0].project_number = "P1-06"
+
+        vectors = self.service.generate_vectors([faculty], existing_vectors=[existing])[0]
+
+        self.generator.generate_embeddings.assert_not_called()
+        self.assertEqual([(vector.source_key, vector.vector_id) for vector in vectors],
+                         [("", 0), ("P1-06", 1), ("P2", 2), ("G1", 3)])
+
+    def test_store_vectors_adds_new_vectors_owned_by_profile(self):
+        self.storage.add_embeddings.side_effect = [[7], [8, 9]]
+        faculty = self._faculty("Folding")
+        vectors = self.service.generate_vectors([faculty])[0]
+        vectors[3].embedding, vectors[3].vector_id = None, 4
+
+        rows = self.service.store_vectors(faculty, vectors, save_index=False)
+
+        self.assertEqual(faculty.embedding_id, 7)
+        self.storage.add_embeddings.assert_called_with(
+            [vectors[1].embedding, vectors[2].embedding], owner_id=7, save_index=False
+        )
+        self.storage.set_owner.assert_called_once_with([8, 9, 4], 7)
+        self.assertEqual([row.vector_id for row in rows], [7, 8, 9, 4])
+
+    def test_hybrid_search_fuses_vector_and_lexical_rankings(self):
+        self.storage.search_similar_embeddings.return_value = [1, 2, 3]
+        self.storage.search_lexical.return_value = [2, 4, 1]
+
+        results = self.service.search_similar_embeddings(query="protein folding", top_k=2, mode="hybrid")
+
+        self.assertEqual(results, [2, 1])
+        self.assertEqual(self.storage.search_lexical.call_args.kwargs["top_k"],
+                         self.storage.search_similar_embeddings.call_args.kwargs["top_k"])
+
+    def test_lexical_search_skips_query_embedding(self):
+        self.storage.search_lexical.return_value = [4]
+
+        self.assertEqual(self.service.search_similar_embeddings(query="protein", top_k=2, mode="lexical"), [4])
+        self.generator.generate_embedding.assert_not_called()
+
+    def test_exact_words_search_keeps_query_syntax(self):
+        self.storage.search_exact_words.return_value = [5]
+
+        self.service.search_similar_embeddings(query=' "Protein Folding" OR -yeast ', top_k=2, exact_words=True)
+        self.assertEqual(self.storage.search_exact_words.call_args.kwargs["query"], '"Protein Folding" OR -yeast')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+import numpy as np
+from backend.core.populate_config import OPENAI_CONFIG
+from backend.services.embedding.embedding_storage import EmbeddingStorage
+
+
+def unit(*components):
+    """Unit-length embedding with the given leading components."""
+    vector = np.zeros(OPENAI_CONFIG["EMBEDDING_DIMENSIONS"], dtype=np.float32)
+    vector[:len(components)] = components
+    return (vector / np.linalg.norm(vector)).tolist()
+
+
+class TestEmbeddingStorage(unittest.TestCase):
+    MODULE_PATH = "backend.services.embedding.embedding_storage"
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.index_path = os.path.join(self.directory.name, "index.faiss")
+        patcher = patch(f"{self.MODULE_PATH}.INDEX_PATH", self.index_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.directory.cleanup)
+        self.database_driver = MagicMock()
+        self.database_driver.get_vector_owners.return_value = []
+
+    def _add_faculty(self, storage, profile, owned):
+        owner_id = storage.add_embeddings([profile], save_index=False)[0]
+        storage.add_embeddings(owned, owner_id=owner_id, save_index=False)
+        return owner_id
+
+    def test_max_aggregation_ranks_by_best_matching_vector(self):
+        storage = EmbeddingStorage(self.database_driver, aggregation="max")
+        # one exactly matching project among unrelated vectors, versus a single partial match
+        specialist = self._add_faculty(storage, unit(0, 1), [unit(1), unit(0, 0, 1), unit(0, 0, 0, 1)])
+        generalist = self._add_faculty(storage, unit(1, 1), [])
+        unrelated = self._add_faculty(storage, unit(0, 0, 0, 0, 1), [])
+
+        results = storage.search_similar_embeddings(query_embedding=unit(1), top_k=2)
+
+        self.assertEqual(results, [specialist, generalist])
+        self.assertNotIn(unrelated, results)
+
+    def test_sum_top_n_aggregation_rewards_several_matches(self):
+        storage = EmbeddingStorage(self.database_driver, aggregation="sum_top_n", top_n=2)
+        single_match = self._add_faculty(storage, unit(0, 1), [unit(1)])
+        several_matches = self._add_faculty(storage, unit(3, 1), [unit(3, 0, 1), unit(3, 0, 0, 1)])
+
+        results = storage.search_similar_embeddings(query_embedding=unit(1), top_k=2)
+
+        self.assertEqual(results, [several_matches, single_match])
+
+    def test_filtered_search_compares_owned_vectors(self):
+        storage = EmbeddingStorage(self.database_driver)
+        matching = self._add_faculty(storage, unit(0, 1), [unit(1)])
+        excluded = self._add_faculty(storage, unit(1), [])
+        self.database_driver.get_embedding_ids_by_search_parameters.return_value = [matching]
+
+        results = storage.search_similar_embeddings(query_embedding=unit(1), top_k=5, school="SEAS")
+
+        self.assertEqual(results, [matching])
+        self.assertNotIn(excluded, results)
+
+    def test_owner_map_is_loaded_from_database(self):
+        storage = EmbeddingStorage(self.database_driver)
+        storage.add_embeddings([unit(0, 1), unit(1), unit(0, 0, 1)])
+
+        self.database_driver.get_vector_owners.return_value = [(1, 0)]
+        reloaded = EmbeddingStorage(self.database_driver)
+
+        self.assertEqual(reloaded.search_similar_embeddings(query_embedding=unit(1), top_k=2), [0, 2])
+
+    def test_award_search_only_returns_project_and_grant_vectors(self):
+        storage = EmbeddingStorage(self.database_driver)
+        profile = storage.add_embeddings([unit(1)])[0]
+        project, grant = storage.add_embeddings([unit(1, 1), unit(0, 1)], owner_id=profile)
+
+        results = storage.search_award_vectors(query_embedding=unit(1), top_k=5)
+        self.assertEqual([vector_id for vector_id, _ in results], [project, grant])
+        self.assertAlmostEqual(results[0][1], np.sqrt(0.5), places=5)
+
+        self.database_driver.get_award_vector_ids.return_value = [grant]
+        results = storage.search_award_vectors(query_embedding=unit(1), top_k=5, activity_code="R01")
+        self.assertEqual([vector_id for vector_id, _ in results], [grant])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+from datetime import date
+from unittest.mock import patch
+from backend.models.models import Faculty, Project, Grant
+from backend.services.embedding.profile_document_builder import ProfileDocumentBuilder
+
+MODULE_PATH = "backend.services.embedding.profile_document_builder"
+
+
+def count_words(text):
+    return len(text.split())
+
+
+def truncate_words(text, max_tokens):
+    return " ".join(text.split()[:max_tokens])
+
+
+@patch(f"{MODULE_PATH}.truncate_to_tokens", side_effect=truncate_words)
+@patch(f"{MODULE_PATH}.count_tokens", side_effect=count_words)
+class TestProfileDocumentBuilder(unittest.TestCase):
+    def make_faculty(self, about_words=10, abstract_words=10):
+        return Faculty(
+            name="Jane Doe", school="SOM", department="Medicine", about=" ".join(["about"] * about_words),
+            projects=[
+                Project(project_number="OLD", abstract=" ".join(["old"] * abstract_words),
+                        relevant_terms="<cancer><imaging>", end_date=date(2020, 1, 1)),
+                Project(project_number="NEW", abstract=" ".join(["new"] * abstract_words),
+                        relevant_terms="<Imaging><genomics>", end_date=date(2025, 1, 1)),
+            ],
+            grants=[Grant(nsf_id="1", title="Early grant", start_date=date(2019, 1, 1)),
+                    Grant(nsf_id="2", title="Recent grant", start_date=date(2024, 1, 1))],
+        )
+
+    def test_small_profile_is_kept_whole_and_ranked(self, *_):
+        document = ProfileDocumentBuilder(max_tokens=500, reserved_tokens=0).build(self.make_faculty())
+
+        self.assertTrue(document.startswith("Department: Medicine. School: SOM. About: about"))
+        self.assertLess(document.index("new new"), document.index("old old"))
+        self.assertIn("Terms: Imaging; genomics; cancer.", document)
+        self.assertIn("Grants: Recent grant; Early grant.", document)
+
+    def test_large_profile_fits_budget_dropping_oldest_projects(self, *_):
+        builder = ProfileDocumentBuilder(max_tokens=300, reserved_tokens=0, min_section_tokens=5)
+
+        document = builder.build(self.make_faculty(about_words=500, abstract_words=200))
+
+        self.assertLessEqual(count_words(document), 300)
+        self.assertIn("new", document)
+        self.assertNotIn("old", document)
+        self.assertIn("Recent grant", document)
+        self.assertIn("genomics", document)
+
+    def test_allocate_hands_unused_share_to_other_sections(self, *_):
+        builder = ProfileDocumentBuilder(section_shares={"about": 0.5, "projects": 0.5})
+
+        allocations = builder._allocate(100, {"about": 10, "projects": 500})
+
+        self.assertEqual(allocations, {"about": 10, "projects": 90})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+from backend.services.harvest.harvest_service import HarvestService
+from backend.services.harvest.harvest_store import HarvestStore
+from backend.services.nih.nih_reporter_proxy import NIHReporterProxy
+from backend.services.nsf.nsf_proxy import NSFProxy
+
+
+class TestHarvestService(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.store = HarvestStore(os.path.join(self.directory, "harvest.sqlite")).open()
+        self.nih_proxy = MagicMock(spec=NIHReporterProxy)
+        self.nsf_proxy = MagicMock(spec=NSFProxy)
+        self.service = HarvestService(self.nih_proxy, self.nsf_proxy, self.store)
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.directory)
+
+    def test_harvest_pages_and_joins_by_name(self):
+        self.nih_proxy.call_reporter_api.side_effect = [
+            {"meta": {"total": 2}, "results": [
+                {"appl_id": 1, "project_num": "P1",
+                 "principal_investigators": [{"first_name": "Jane A", "last_name": "Doe"}]},
+            ]},
+            {"meta": {"total": 2}, "results": [
+                {"appl_id": 2, "project_num": "P2",
+                 "principal_investigators": [{"first_name": "John", "last_name": "Smith"}]},
+            ]},
+        ]
+        self.nsf_proxy.call_nsf_api.side_effect = [
+            {"response": {"award": [
+                {"id": "A1", "piFirstName": "John", "piLastName": "Smith", "coPDPI": ["Jane Doe ~000123"]},
+                {"id": "A2", "piFirstName": "Other", "piLastName": "Person"},
+            ]}},
+            {"response": {"award": []}},
+        ]
+
+        self.assertTrue(self.store.is_stale(max_age_hours=1))
+        self.service.harvest([2024], "University of Virginia", nih_page_size=1, nsf_page_size=2)
+        index = self.service.load_index()
+
+        nih_payloads = [call.args[0] for call in self.nih_proxy.call_reporter_api.call_args_list]
+        self.assertNotIn("pi_names", nih_payloads[0]["criteria"])
+        self.assertEqual([payload["offset"] for payload in nih_payloads], [0, 1])
+        self.assertEqual(self.nsf_proxy.call_nsf_api.call_args_list[1].kwargs["payload"]["offset"], 3)
+        self.assertFalse(self.store.is_stale(max_age_hours=1))
+        self.assertEqual([p["project_num"] for p in index.get_nih_projects("Jane", "Doe")], ["P1"])
+        self.assertEqual([a["id"] for a in index.get_nsf_awards("jane", "doe")], ["A1"])
+        self.assertEqual([a["id"] for a in index.get_nsf_awards("John", "Smith")], ["A1"])
+        self.assertEqual(index.get_nih_projects("No", "One"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+from unittest.mock import MagicMock
+from backend.services.nih.nih_reporter_proxy import NIHReporterProxy
+from backend.services.nih.nih_reporter_service import NIHReporterService
+
+
+def make_project(project_num, *investigators):
+    return {
+        "project_num": project_num,
+        "abstract_text": "Abstract",
+        "terms": "terms",
+        "project_start_date": "2020-01-01T00:00:00",
+        "project_end_date": "2024-01-01T00:00:00",
+        "agency_ic_admin": {"name": "NCI"},
+        "activity_code": "R01",
+        "principal_investigators": [
+            {"first_name": first_name, "last_name": last_name} for first_name, last_name in investigators
+        ],
+    }
+
+
+class TestNIHReporterService(unittest.TestCase):
+    def setUp(self):
+        self.proxy = MagicMock(spec=NIHReporterProxy)
+        self.service = NIHReporterService(self.proxy)
+
+    def test_compile_batch_project_metadata_pages_and_demultiplexes(self):
+        pages = [
+            {"meta": {"total": 3}, "results": [
+                make_project("P1", ("JANE", "DOE")),
+                make_project("P2", ("John A", "Smith"), ("Jane", "Doe")),
+            ]},
+            {"meta": {"total": 3}, "results": [make_project("P3", ("Other", "Person"))]},
+        ]
+        self.proxy.call_reporter_api.side_effect = pages
+
+        result = self.service.compile_batch_project_metadata(
+            [("Jane", "Doe"), ("John", "Smith"), ("No", "Projects")], fiscal_years=[2024], page_size=2
+        )
+
+        self.assertEqual(self.proxy.call_reporter_api.call_count, 2)
+        first_payload = self.proxy.call_reporter_api.call_args_list[0].args[0]
+        second_payload = self.proxy.call_reporter_api.call_args_list[1].args[0]
+        self.assertEqual(len(first_payload["criteria"]["pi_names"]), 3)
+        self.assertEqual((first_payload["offset"], second_payload["offset"]), (0, 2))
+        self.assertEqual([project.project_number for project in result[("Jane", "Doe")]], ["P1", "P2"])
+        self.assertEqual([project.project_number for project in result[("John", "Smith")]], ["P2"])
+        self.assertEqual(result[("No", "Projects")], [])
+
+    def test_compile_batch_project_metadata_gives_projects_to_every_name_with_the_same_key(self):
+        self.proxy.call_reporter_api.return_value = {"meta": {"total": 1}, "results": [
+            make_project("P1", ("Jane", "Doe")),
+        ]}
+
+        result = self.service.compile_batch_project_metadata([("Jane", "Doe"), ("JANE", "DOE")], fiscal_years=[2024])
+
+        self.assertEqual([project.project_number for project in result[("Jane", "Doe")]], ["P1"])
+        self.assertEqual([project.project_number for project in result[("JANE", "DOE")]], ["P1"])
+
+    def test_compile_batch_project_metadata_groups_names(self):
+        self.proxy.call_reporter_api.return_value = {"meta": {"total": 0}, "results": []}
+
+        self.service.compile_batch_project_metadata(
+            [(f"First{i}", f"Last{i}") for i in range(5)], names_per_request=2
+        )
+
+        self.assertEqual(self.proxy.call_reporter_api.call_count, 3)
+
+
+    def test_canonicalize_projects_keeps_latest_fiscal_year(self):
+        yearly = []
+        for fiscal_year, project_num in [(2022, "5R01CA1-03"), (2024, "5R01CA1-05"), (2023, "5R01CA1-04")]:
+            project = make_project(project_num)
+            project.update(core_project_num="R01CA1", fiscal_year=fiscal_year)
+            yearly.append(self.service.compile_project(project))
+        other = self.service.compile_project(make_project("1R21CA2-01"))
+
+        canonical = NIHReporterService.canonicalize_projects([yearly[0], other, *yearly[1:]])
+
+        self.assertEqual([p.project_number for p in canonical], ["5R01CA1-05", "1R21CA2-01"])
+        self.assertEqual(canonical[0].fiscal_year, 2024)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+from unittest.mock import MagicMock
+from requests import HTTPError
+from backend.services.nsf.nsf_proxy import NSFProxy
+from backend.services.nsf.nsf_service import NSFService
+
+
+class TestNSFService(unittest.TestCase):
+    def setUp(self):
+        self.proxy = MagicMock(spec=NSFProxy)
+        self.service = NSFService(self.proxy)
+
+    def test_get_award_details_batches_ids_and_falls_back_per_id(self):
+        self.proxy.call_nsf_api.side_effect = [
+            {"response": {"award": [{"id": "1", "awardeeName": "UVA"}, {"id": "2", "awardeeName": "UVA"}]}},
+            HTTPError("HTTP 500"),
+        ]
+        self.proxy.call_award_api.side_effect = lambda award_id, payload: {
+            "response": {"award": [] if award_id == "4" else [{"id": award_id, "awardeeName": "VT"}]}
+        }
+
+        details = self.service.get_award_details(["1", "2", "3", "4", "1"], print_fields=["awardeeName"], batch_size=3)
+
+        self.assertEqual(sorted(details), ["1", "2", "3"])
+        self.assertEqual(details["3"]["awardeeName"], "VT")
+        first_payload = self.proxy.call_nsf_api.call_args_list[0].kwargs["payload"]
+        self.assertEqual(first_payload["id"], "1,2,3")
+        self.assertEqual(first_payload["printFields"], "id,awardeeName")
+        self.assertEqual([c.args[0] for c in self.proxy.call_award_api.call_args_list], ["3", "4"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+from backend.services.search.lexical_index import BM25Index, reciprocal_rank_fusion, tokenize
+
+
+class TestBM25Index(unittest.TestCase):
+    def setUp(self):
+        self.index = BM25Index([
+            (10, "Protein folding and misfolding in neurodegenerative disease. Terms: protein; folding"),
+            (11, "Cell biology of membrane proteins"),
+            (12, "Protein markets: an economics of the pharmaceutical industry"),
+            (13, None),
+        ])
+
+    def test_tokenize_drops_stopwords_and_punctuation(self):
+        self.assertEqual(tokenize("The Folding of RNA-binding proteins!"), ["folding", "rna", "binding", "proteins"])
+
+    def test_ranks_documents_by_bm25(self):
+        results = self.index.search("protein folding", top_k=5)
+
+        self.assertEqual([doc_id for doc_id, _ in results], [10, 12])
+        self.assertGreater(results[0][1], results[1][1])
+
+    def test_limits_and_filters_results(self):
+        self.assertEqual([doc_id for doc_id, _ in self.index.search("protein", top_k=1)], [10])
+        self.assertEqual([doc_id for doc_id, _ in self.index.search("protein", top_k=5, allowed_ids=[12, 13])], [12])
+        self.assertEqual(self.index.search("unknown words", top_k=5), [])
+
+    def test_reciprocal_rank_fusion_rewards_agreement(self):
+        fused = reciprocal_rank_fusion([[1, 2, 3], [2, 4, 1]], k=60)
+
+        self.assertEqual(fused[0], 2)
+        self.assertEqual(set(fused), {1, 2, 3, 4})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from backend.models.models import Project, Grant
+from backend.models.records import FacultySummary
+from backend.services.search.search_service import SearchService
+
+
+class TestSearchService(unittest.TestCase):
+    def setUp(self):
+        self.database_driver = MagicMock()
+        self.embedding_service = MagicMock()
+        self.search_service = SearchService(self.database_driver, self.embedding_service)
+
+    def test_search_projects_merges_faculty_of_shared_projects(self):
+        shared = Project(project_number="R01GM1", abstract="Folding")
+        grant = Grant(nsf_id="200", title="Design")
+        jane = FacultySummary(1, "Jane Doe", "SEAS", ["SEAS"], ["CS"], "jd@virginia.edu", None)
+        john = FacultySummary(2, "John Roe", "SOM", ["SOM"], ["Biology"], "jr@virginia.edu", None)
+        self.embedding_service.search_similar_awards.return_value = [(10, 0.9), (20, 0.9), (11, 0.5), (99, 0.4)]
+        self.database_driver.get_awards_by_vector_ids.return_value = {
+            10: ("project", shared, jane),
+            20: ("project", shared, john),
+            11: ("grant", grant, jane),
+        }
+
+        results = self.search_service.search_projects(query="protein folding", k=1, activity_code="R01")
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual((results[0].kind, results[0].award, results[0].score), ("project", shared, 0.9))
+        self.assertEqual([faculty.name for faculty in results[0].faculty], ["Jane Doe", "John Roe"])
+        self.database_driver.get_awards_by_vector_ids.assert_called_once_with([10, 20, 11, 99])
+        self.assertEqual(self.embedding_service.search_similar_awards.call_args.kwargs["activity_code"], "R01")
+
+    def test_search_documents_hydrates_missing_documents_from_records(self):
+        faculty = MagicMock()
+        self.embedding_service.search_similar_embeddings.return_value = [3, 1, 2]
+        self.database_driver.get_search_documents.return_value = {3: '{"name":"C"}', 2: '{"name":"B"}'}
+        self.database_driver.get_faculty_by_embedding_id.side_effect = lambda eid: faculty if eid == 1 else None
+
+        with patch("backend.services.search.search_service.faculty_search_document", return_value='{"name":"A"}'):
+            results = self.search_service.search_documents(query="robotics", k=3, school="SEAS", mode="hybrid")
+
+        self.assertEqual(results, ['{"name":"C"}', '{"name":"A"}', '{"name":"B"}'])
+        self.database_driver.get_search_documents.assert_called_once_with([3, 1, 2])
+        self.database_driver.get_faculty_by_embedding_id.assert_called_once_with(1)
+        self.assertEqual(self.embedding_service.search_similar_embeddings.call_args.kwargs["mode"], "hybrid")
+
+    def test_search_documents_with_fields_loads_only_their_attributes(self):
+        self.embedding_service.search_similar_embeddings.return_value = [3, 1, 2]
+        self.database_driver.get_faculty_by_embedding_ids.return_value = {3: "C", 2: "B"}
+
+        with patch("backend.services.search.search_service.faculty_search_document",
+                   side_effect=lambda faculty, fields: f'{{"name":"{faculty}"}}') as encode:
+            results = self.search_service.search_documents(query="robotics", k=3, fields=["name", "emails"])
+
+        self.assertEqual(results, ['{"name":"C"}', '{"name":"B"}'])
+        self.database_driver.get_faculty_by_embedding_ids.assert_called_once_with([3, 1, 2], ["name", "email"])
+        self.database_driver.get_search_documents.assert_not_called()
+        self.assertEqual(encode.call_args.args[1], ["name", "emails"])
+
+
+if __name__ == "__main__":
+    unittest.main()
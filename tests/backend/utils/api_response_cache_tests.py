@@ -0,0 +1,55 @@
+import os
+import time
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+from backend.utils.api_response_cache import ApiResponseCache
+from backend.services.nsf.nsf_proxy import NSFProxy
+
+
+class TestApiResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "cache.sqlite")
+        self.cache = ApiResponseCache(self.path, {"search": 60, "uncached": 0}).open()
+
+    def tearDown(self):
+        self.cache.close()
+        shutil.rmtree(self.directory)
+
+    def test_equivalent_payloads_share_entry_across_reopen(self):
+        self.cache.set("search", {"pdPIName": "Jane Doe", "offset": 1, "unused": None}, {"award": [1, 2]})
+        self.cache.close()
+        self.cache = ApiResponseCache(self.path, {"search": 60}).open()
+
+        self.assertEqual(self.cache.get("search", {"offset": 1, "pdPIName": " Jane Doe "}), {"award": [1, 2]})
+        self.assertIsNone(self.cache.get("search", {"offset": 2, "pdPIName": "Jane Doe"}))
+        self.assertIsNone(self.cache.get("other", {"offset": 1, "pdPIName": "Jane Doe"}))
+        self.assertEqual(self.cache.get_stats(), {"hits": 1, "misses": 2, "writes": 0})
+
+    def test_entries_expire_per_endpoint(self):
+        self.cache.set("search", {"q": 1}, {"ok": True})
+        self.cache.set("uncached", {"q": 1}, {"ok": True})
+        self.assertIsNone(self.cache.get("uncached", {"q": 1}))
+
+        self.cache.ttl_seconds["search"] = 0.01
+        time.sleep(0.05)
+        self.assertIsNone(self.cache.get("search", {"q": 1}))
+        self.assertEqual(self.cache.purge_expired(), 1)
+
+    def test_proxy_fetches_once(self):
+        http_client = MagicMock()
+        http_client.get.return_value.json.return_value = {"response": {"award": []}}
+        self.cache.ttl_seconds[NSFProxy.CACHE_ENDPOINT] = 60
+        proxy = NSFProxy(http_client, response_cache=self.cache)
+
+        first = proxy.call_nsf_api({"pdPIName": "Jane Doe", "offset": 1})
+        second = proxy.call_nsf_api({"offset": 1, "pdPIName": "Jane Doe"})
+
+        self.assertEqual(first, second)
+        http_client.get.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import io
+import unittest
+import requests
+from urllib3 import HTTPResponse
+from requests.adapters import BaseAdapter
+from backend.utils.http_client_cached import HttpClientCached
+
+URL = "https://engineering.virginia.edu/department/computer-science/people"
+
+
+class ScriptedAdapter(BaseAdapter):
+    """Transport adapter answering each request with the next scripted (status, headers) response."""
+
+    def __init__(self, responses):
+        super().__init__()
+        self.responses = list(responses)
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        status_code, headers = self.responses.pop(0)
+        body = b"" if status_code == 304 else b"<html>people</html>"
+        response = requests.Response()
+        response.raw = HTTPResponse(body=io.BytesIO(body), headers=headers, status=status_code, preload_content=False)
+        response.status_code = status_code
+        response.headers.update(headers)
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+class TestHttpClientCached(unittest.TestCase):
+    def _client(self, responses, **kwargs):
+        client = HttpClientCached(backend="memory", respect_robots_txt=False, retries=1, **kwargs)
+        adapter = ScriptedAdapter(responses)
+        client.session.mount("https://", adapter)
+        return client, adapter
+
+    def test_revalidate_serves_304_from_cache_and_counts_outcomes(self):
+        client, adapter = self._client([
+            (200, {"ETag": '"v1"'}),
+            (304, {"ETag": '"v1"'}),
+            (200, {"ETag": '"v2"'}),
+        ], revalidate=True)
+
+        first = client.get(URL)
+        second = client.get(URL)
+        third = client.get(URL)
+
+        self.assertNotIn("If-None-Match", adapter.requests[0].headers)
+        self.assertEqual(adapter.requests[1].headers["If-None-Match"], '"v1"')
+        self.assertEqual(adapter.requests[2].headers["If-None-Match"], '"v1"')
+        self.assertEqual((second.status_code, second.text), (200, first.text))
+        self.assertTrue(second.revalidated)
+        self.assertEqual(third.headers["ETag"], '"v2"')
+        stats = client.get_cache_stats()
+        self.assertEqual(stats, {"revalidated": 1, "fresh": 0, "changed": 1, "new": 1})
+        self.assertEqual(sum(stats.values()), 3)
+
+    def test_revalidate_fetches_responses_without_validators_in_full(self):
+        client, adapter = self._client([(200, {}), (200, {})], revalidate=True)
+
+        client.get(URL)
+        client.get(URL)
+
+        self.assertEqual(len(adapter.requests), 2)
+        self.assertNotIn("If-None-Match", adapter.requests[1].headers)
+        self.assertEqual(client.get_cache_stats(), {"revalidated": 0, "fresh": 0, "changed": 0, "new": 2})
+
+    def test_expiring_cache_serves_fresh_responses_without_a_request(self):
+        client, adapter = self._client([(200, {"ETag": '"v1"'})], expire_after=30)
+
+        client.get(URL)
+        client.get(URL)
+
+        self.assertEqual(len(adapter.requests), 1)
+        self.assertEqual(client.get_cache_stats(), {"revalidated": 0, "fresh": 1, "changed": 0, "new": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from requests.exceptions import ChunkedEncodingError, HTTPError, Timeout
+from backend.utils.http_client import HttpClient
+from backend.utils.retry_policy import RetryPolicy, CircuitBreaker, CircuitOpenError
+
+URL = "https://api.reporter.nih.gov/v2/projects/search"
+
+
+def make_response(status_code, headers=None):
+    response = MagicMock(status_code=status_code, headers=headers or {})
+    if status_code >= 400:
+        response.raise_for_status.side_effect = HTTPError(f"HTTP {status_code}")
+    return response
+
+
+class TestHttpClient(unittest.TestCase):
+    def setUp(self):
+        self.client = HttpClient(
+            retries=3,
+            respect_robots_txt=False,
+            retry_policy=RetryPolicy(backoff_base=1.0, jitter=False),
+            breaker_failure_threshold=2,
+        )
+        self.client._sleep = MagicMock()
+
+    def test_retries_transient_status_with_backoff(self):
+        with patch.object(self.client, "_send_request", side_effect=[
+            make_response(503), make_response(503), make_response(200)
+        ]):
+            self.client.breaker_failure_threshold = 5
+            response = self.client.get(URL)
+
+        self.assertEqual(response.status_code, 200)
+        self.client._sleep.assert_any_call(1.0)
+        self.client._sleep.assert_any_call(2.0)
+        self.assertEqual(self.client.get_metrics()["retries"], 2)
+
+    def test_does_not_retry_non_transient_status(self):
+        with patch.object(self.client, "_send_request", return_value=make_response(404)) as mock_send:
+            with self.assertRaises(HTTPError):
+                self.client.get(URL)
+
+        mock_send.assert_called_once()
+        self.client._sleep.assert_not_called()
+
+    def test_honors_retry_after(self):
+        with patch.object(self.client, "_send_request", side_effect=[
+            make_response(429, {"Retry-After": "7"}), make_response(200)
+        ]):
+            self.client.get(URL)
+
+        self.client._sleep.assert_called_once_with(7.0)
+        self.assertEqual(self.client.get_metrics()["retry_after_honored"], 1)
+
+    def test_raises_after_last_timeout(self):
+        with patch.object(self.client, "_send_request", side_effect=Timeout("timed out")):
+            self.client.breaker_failure_threshold = 5
+            with self.assertRaises(Timeout):
+                self.client.get(URL)
+
+        self.assertEqual(self.client._sleep.call_count, 2)
+
+    def test_open_circuit_fails_fast(self):
+        with patch.object(self.client, "_send_request", side_effect=Timeout("timed out")) as mock_send:
+            # The failure that opens the breaker is raised at once instead of waiting for a doomed retry
+            with self.assertRaises(Timeout):
+                self.client.get(URL)
+            self.client._sleep.assert_called_once()
+            with self.assertRaises(CircuitOpenError):
+                self.client.get(URL)
+
+        self.assertEqual(mock_send.call_count, 2)
+        metrics = self.client.get_metrics()
+        self.assertEqual(metrics["breaker_opened"], 1)
+        self.assertEqual(metrics["circuit_breakers"]["api.reporter.nih.gov"], CircuitBreaker.OPEN)
+
+    def test_opening_the_breaker_skips_retry_after_wait(self):
+        with patch.object(self.client, "_send_request", side_effect=[
+            make_response(503, {"Retry-After": "120"}), make_response(503, {"Retry-After": "120"})
+        ]) as mock_send:
+            with self.assertRaises(HTTPError):
+                self.client.get(URL)
+
+        self.assertEqual(mock_send.call_count, 2)
+        self.client._sleep.assert_called_once_with(120.0)
+
+    @patch("backend.utils.retry_policy.time.monotonic")
+    def test_half_open_trial_failing_with_other_request_error_releases_trial(self, mock_monotonic):
+        mock_monotonic.return_value = 0.0
+        breaker = self.client._get_circuit_breaker(URL)
+        breaker.failure_threshold = 1
+        breaker.record_failure()
+
+        mock_monotonic.return_value = breaker.reset_timeout + 1
+        with patch.object(self.client, "_send_request", side_effect=ChunkedEncodingError("truncated body")):
+            with self.assertRaises(ChunkedEncodingError):
+                self.client.get(URL)
+        with patch.object(self.client, "_log_response", side_effect=RuntimeError("hook failed")), \
+                patch.object(self.client, "_send_request", return_value=make_response(200)):
+            with self.assertRaises(RuntimeError):
+                self.client.get(URL)
+
+        with patch.object(self.client, "_send_request", return_value=make_response(200)) as mock_send:
+            self.assertEqual(self.client.get(URL).status_code, 200)
+        mock_send.assert_called_once()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    @patch("backend.utils.retry_policy.time.monotonic")
+    def test_half_open_trial_closes_breaker(self, mock_monotonic):
+        mock_monotonic.return_value = 0.0
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0)
+        self.assertTrue(breaker.record_failure())
+        self.assertFalse(breaker.allow_request())
+
+        mock_monotonic.return_value = 11.0
+        self.assertTrue(breaker.allow_request())
+        self.assertFalse(breaker.allow_request())
+        self.assertTrue(breaker.record_success())
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+from backend.utils.name_utils import parse_name, name_key, NameIndex
+
+
+class TestNameUtils(unittest.TestCase):
+    def test_parse_name_formats_match_api_names(self):
+        cases = [
+            ("Jane A. Doe", ("JANE", "DOE")),
+            ("Doe, Jane A.", ("JANE", "DOE")),
+            ("Doe, Jane A., MD", ("Jane", "Doe")),
+            ("Dr. José Núñez-García, PhD, RN", ("JOSE", "NUNEZ-GARCIA")),
+            ("John Smith Jr.", ("John", "Smith Jr")),
+            ("Jan van der Berg", ("JAN", "VAN DER BERG")),
+            ("Mary (Molly) O'Brien", ("MARY", "O'BRIEN")),
+            ("Jane Do", ("Jane", "Do")),
+            ("Prof. Li Ma", ("Li", "Ma")),
+        ]
+        for raw_name, (first_name, last_name) in cases:
+            with self.subTest(raw_name=raw_name):
+                self.assertEqual(parse_name(raw_name).key, name_key(first_name, last_name))
+
+    def test_parse_name_components(self):
+        self.assertEqual(parse_name("Doe, Jane Anne"), ("Jane", "Anne", "Doe"))
+        self.assertEqual(parse_name("Maria de la Cruz").last, "de la Cruz")
+        self.assertEqual(parse_name("Cher"), ("", "", "Cher"))
+
+    def test_name_index_lookup(self):
+        index = NameIndex()
+        project = {"project_num": "P1"}
+        index.add(name_key("JANE A", "DOE"), project)
+        index.add(name_key("Jane", "Doe"), project)
+
+        self.assertEqual(index.lookup("Doe, Jane"), [project])
+        self.assertEqual(index.lookup("John Doe"), [])
+        self.assertEqual(len(index), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()